@@ -11,7 +11,6 @@ Version: 1.1 (Bug Fix Release)
 """
 
 import streamlit as st
-import pandas as pd
 from datetime import datetime, timedelta
 import sys
 import os
@@ -19,10 +18,10 @@ import os
 # Add backend modules to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Import backend modules
-from tourism_backend_engine import TourismBackendEngine, TouristProfile
-from pdf_generator import PDFItineraryGenerator
-from chatbot_integration import TravelChatbot
+# Backend modules are imported where they are first needed, not here:
+# the engine (pandas/numpy) when a page needs data, the chatbot on the
+# assistant page and ReportLab only when a PDF is generated. The About
+# page and the first render of the script load none of them.
 
 # Page configuration
 st.set_page_config(
@@ -46,11 +45,15 @@ if 'chat_history' not in st.session_state:
 @st.cache_resource
 def load_backend_engine(dataset_path):
     """Load and cache backend engine"""
-    return TourismBackendEngine(dataset_path)
+    from tourism_backend_engine import TourismBackendEngine
+    engine = TourismBackendEngine(dataset_path)
+    engine.prepare()
+    return engine
 
 @st.cache_resource
 def load_chatbot(_engine):
     """Load and cache chatbot"""
+    from chatbot_integration import TravelChatbot
     return TravelChatbot(_engine)
 
 # Main app
@@ -68,6 +71,12 @@ def main():
     
     st.sidebar.markdown("---")
     
+    # The About page is static: show it without loading the backend
+    if page == "ℹ️ About":
+        show_about_page()
+        st.sidebar.markdown("---")
+        return
+    
     # Initialize backend
     try:
         if st.session_state.backend_engine is None:
@@ -75,8 +84,9 @@ def main():
                 st.session_state.backend_engine = load_backend_engine(
                     'master_tourism_dataset_v2_enhanced.csv'
                 )
-                st.session_state.chatbot = load_chatbot(st.session_state.backend_engine)
             st.sidebar.success("✅ Backend loaded!")
+        if page == "💬 Travel Assistant" and st.session_state.chatbot is None:
+            st.session_state.chatbot = load_chatbot(st.session_state.backend_engine)
     except Exception as e:
         st.sidebar.error(f"❌ Backend Error")
         st.error(f"**Error loading backend:** {str(e)}")
@@ -97,8 +107,6 @@ def main():
         show_chatbot_page(chatbot, engine)
     elif page == "📊 Analytics":
         show_analytics_page(engine)
-    elif page == "ℹ️ About":
-        show_about_page()
     
     # Footer
     st.sidebar.markdown("---")
@@ -289,6 +297,7 @@ def show_itinerary_page(engine):
         
         with st.spinner("🤖 AI is creating your perfect itinerary..."):
             try:
+                from tourism_backend_engine import TouristProfile
                 profile = TouristProfile(
                     age=age,
                     interests=interests,
@@ -427,13 +436,13 @@ def generate_and_download_pdf(itinerary):
     """Generate and offer PDF download"""
     try:
         with st.spinner("Generating PDF..."):
-            pdf_gen = PDFItineraryGenerator()
-            pdf_path = "generated_itinerary.pdf"
-            pdf_gen.generate_itinerary_pdf(itinerary, pdf_path)
+            from pdf_cache import get_pdf_cache
+            from pdf_generator import get_pdf_generator
+            pdf_gen = get_pdf_generator()
             
-            # Read PDF for download
-            with open(pdf_path, "rb") as pdf_file:
-                pdf_bytes = pdf_file.read()
+            # Rendered in memory: no file shared between sessions; repeated
+            # clicks on the same itinerary are served from the cache
+            pdf_bytes = get_pdf_cache().get_or_render(itinerary, pdf_gen.render_itinerary_pdf)
             
             st.download_button(
                 label="⬇️ Download Your Itinerary",
@@ -526,6 +535,7 @@ def show_recommendations_page(engine):
         
         with st.spinner("🤖 Finding your perfect matches..."):
             try:
+                from tourism_backend_engine import TouristProfile
                 profile = TouristProfile(
                     age=age_filter,
                     interests=interests_filter,
@@ -701,6 +711,7 @@ def handle_chat(user_message, chatbot):
 
 def show_analytics_page(engine):
     """Display analytics dashboard"""
+    import pandas as pd
     
     st.title("📊 Platform Analytics")
     st.markdown("Explore insights from our tourism platform data.")
@@ -0,0 +1,88 @@
+"""
+App Import-Time Benchmark
+=========================
+
+Measures with `python -X importtime` what app.py costs at import (the
+work Streamlit repeats on a cold start) and what each backend module
+adds when a page first needs it. Every measurement runs in a fresh
+interpreter, after `import streamlit` so only the increment is counted.
+
+Usage: python benchmarks/bench_app_import.py [--runs N] [--top N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Deferred imports and the page that triggers them
+DEFERRED = [
+    ('tourism_backend_engine', 'any data page (engine, pandas, numpy)'),
+    ('chatbot_integration', 'Travel Assistant page'),
+    ('pdf_generator', '"Download PDF Itinerary" (ReportLab)'),
+]
+
+
+def importtime(statement: str, preload: str = 'streamlit') -> List[Tuple[int, int, str]]:
+    """
+    (self us, cumulative us, module) of every import made by ``statement``
+
+    Modules imported by ``preload`` beforehand are not counted.
+    """
+    code = f"import {preload}\nimport sys\nsys.stderr.write('--start--\\n')\n{statement}"
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    imports = []
+    started = False
+    for line in result.stderr.splitlines():
+        if line == '--start--':
+            started = True
+        elif started and line.startswith('import time:') and '|' in line:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|')
+            if self_us.strip().isdigit():
+                imports.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return imports
+
+
+def top_level_ms(imports: List[Tuple[int, int, str]]) -> float:
+    """Total import time: cumulative time of the outermost imports"""
+    return sum(cumulative for _, cumulative, name in imports if not name.startswith('  ')) / 1000
+
+
+def measure(statement: str, runs: int) -> Tuple[float, List[Tuple[int, int, str]]]:
+    """Median total import time (ms) over fresh interpreters, and the last run's imports"""
+    totals, imports = [], []
+    for _ in range(runs):
+        imports = importtime(statement)
+        totals.append(top_level_ms(imports))
+    return statistics.median(totals), imports
+
+
+def main(runs: int, top: int):
+    total, imports = measure('import app', runs)
+    print(f"import app: {total:.1f} ms (median of {runs}, after streamlit)")
+    for self_us, cumulative_us, name in sorted(imports, key=lambda i: -i[1])[:top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name.strip()}")
+
+    print("\nDeferred until first use:")
+    for module, trigger in DEFERRED:
+        try:
+            total, _ = measure(f'import {module}', runs)
+        except subprocess.CalledProcessError as e:
+            print(f"  {module:<24} not importable: {e.stderr.strip().splitlines()[-1]}")
+            continue
+        print(f"  {module:<24} {total:8.1f} ms  on {trigger}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=5, help='fresh interpreters per measurement')
+    parser.add_argument('--top', type=int, default=10, help='slowest imports to list')
+    args = parser.parse_args()
+    main(args.runs, args.top)
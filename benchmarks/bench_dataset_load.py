@@ -0,0 +1,76 @@
+"""
+Dataset Load Benchmark
+======================
+
+Compares cold-start load time and RSS of the CSV dataset against its
+columnar copies (.parquet when pyarrow is installed, and .npz). Every load
+runs in a fresh interpreter so the numbers reflect a new Streamlit worker.
+RSS is read from /proc (Linux only).
+
+Usage: python benchmarks/bench_dataset_load.py [rows ...]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from dataset_store import HAS_PYARROW, save_columnar
+from synthetic import make_dataset
+
+# Runs in a child process: import, load, report seconds and peak RSS (MB)
+LOAD_SCRIPT = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+import pandas
+from dataset_store import load_dataset
+
+def status_mb(field):
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith(field + ':'):
+                return int(line.split()[1]) / 1024
+
+baseline = status_mb('VmRSS')
+start = time.perf_counter()
+df = load_dataset({path!r}, prefer_columnar=False)
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'peak_rss_mb': status_mb('VmHWM'),
+                  'load_rss_mb': status_mb('VmRSS') - baseline, 'rows': len(df)}}))
+"""
+
+
+def measure(path: str) -> dict:
+    """Load ``path`` in a fresh interpreter"""
+    output = subprocess.run(
+        [sys.executable, '-c', LOAD_SCRIPT.format(root=ROOT, path=path)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(sizes):
+    print(f"{'rows':>10} {'format':>8} {'size MB':>8} {'load s':>8} {'load RSS MB':>12} {'peak RSS MB':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            df = make_dataset(rows)
+            paths = {'csv': os.path.join(tmp, f"dataset_{rows}.csv")}
+            df.to_csv(paths['csv'], index=False)
+            if HAS_PYARROW:
+                paths['parquet'] = save_columnar(df, os.path.join(tmp, f"dataset_{rows}.parquet"))
+            paths['npz'] = save_columnar(df, os.path.join(tmp, f"dataset_{rows}.npz"))
+
+            for fmt, path in paths.items():
+                result = measure(path)
+                size_mb = os.path.getsize(path) / 1024 / 1024
+                print(f"{rows:>10,} {fmt:>8} {size_mb:>8.1f} {result['seconds']:>8.3f} "
+                      f"{result['load_rss_mb']:>12.1f} {result['peak_rss_mb']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000])
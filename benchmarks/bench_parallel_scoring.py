@@ -0,0 +1,79 @@
+"""
+Parallel Scoring Benchmark
+==========================
+
+Scores a batch of random tourist profiles against a synthetic dataset
+with engine_parallel.score_profiles_parallel for 1..N worker processes,
+reports throughput and speedup over the in-process baseline, and checks
+every worker count returns the same rankings.
+
+Usage: python benchmarks/bench_parallel_scoring.py [rows] [profiles] [max_workers]
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine_index import FILTER_COLUMNS
+from engine_parallel import SharedScoringArrays, map_scoring_arrays, score_chunk, score_profiles_parallel
+from engine_scoring import InterestEncoder
+from synthetic import BUDGET_LEVELS, CLIMATES, INTERESTS, SEASONS, make_dataset
+
+K = 10
+CHUNK_SIZE = 250
+
+
+def make_tasks(encoder: InterestEncoder, count: int, seed: int = 7):
+    """Random (criteria, interest mask, interest count) scoring tasks"""
+    rng = np.random.default_rng(seed)
+    tasks = []
+    for _ in range(count):
+        interests = list(rng.choice(INTERESTS, rng.integers(1, 4), replace=False))
+        criteria = {'budget_level': str(rng.choice(BUDGET_LEVELS))}
+        if rng.random() < 0.5:
+            criteria['climate_classification'] = str(rng.choice(CLIMATES))
+        if rng.random() < 0.5:
+            criteria['Best Season'] = str(rng.choice(SEASONS))
+        tasks.append((criteria, encoder.encode(interests), len(interests)))
+    return tasks
+
+
+def main(rows: int, num_profiles: int, max_workers: int):
+    df = make_dataset(rows)
+    encoder = InterestEncoder()
+    masks = encoder.encode_column(df['Interests'])
+    tasks = make_tasks(encoder, num_profiles)
+
+    print(f"{rows:,} rows, {num_profiles:,} profiles, {os.cpu_count()} CPUs available")
+    print(f"{'workers':>8} {'seconds':>9} {'profiles/s':>11} {'speedup':>8}")
+
+    with SharedScoringArrays(df, masks, FILTER_COLUMNS) as shared:
+        arrays = map_scoring_arrays(shared.spec)
+
+        start = time.perf_counter()
+        expected = score_chunk(tasks, K, arrays)
+        baseline = time.perf_counter() - start
+        print(f"{'serial':>8} {baseline:>9.2f} {num_profiles / baseline:>11,.0f} {1.0:>7.2f}x")
+
+        for workers in range(1, max_workers + 1):
+            start = time.perf_counter()
+            results = score_profiles_parallel(shared, tasks, K, workers, CHUNK_SIZE)
+            elapsed = time.perf_counter() - start
+
+            assert all(
+                (got[0] == want[0]).all() and np.allclose(got[1], want[1])
+                for got, want in zip(results, expected)
+            ), f"rankings differ with {workers} workers"
+            print(f"{workers:>8} {elapsed:>9.2f} {num_profiles / elapsed:>11,.0f} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(
+        args[0] if len(args) > 0 else 100_000,
+        args[1] if len(args) > 1 else 2_000,
+        args[2] if len(args) > 2 else os.cpu_count() or 1,
+    )
@@ -0,0 +1,63 @@
+"""
+Bulk PDF Benchmark
+==================
+
+Renders a partner-sized batch of itinerary PDFs and compares:
+- serial: render_itinerary_pdf in a loop on the shared generator
+- pool: pdf_batch.write_pdf_zip across worker processes
+
+Reports throughput and per-document render-time percentiles. The pool
+only helps with more than one CPU; ReportLab holds the GIL, so threads
+would not.
+
+Usage: python benchmarks/bench_pdf_batch.py [--documents N] [--days N] [--workers N]
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from pdf_batch import RenderedPDF, default_filename, summarize_batch, write_pdf_zip
+from pdf_generator import get_pdf_generator
+from synthetic import make_itinerary
+
+
+def serial(itineraries):
+    """Batch summary of rendering every itinerary in this process"""
+    generator = get_pdf_generator()
+    results = []
+    start = time.perf_counter()
+    for index, itinerary in enumerate(itineraries):
+        document_start = time.perf_counter()
+        data = generator.render_itinerary_pdf(itinerary)
+        results.append(RenderedPDF(index, default_filename(index, itinerary),
+                                   (time.perf_counter() - document_start) * 1000, len(data)))
+    return summarize_batch(results, time.perf_counter() - start)
+
+
+def main(documents: int, days: int, workers: int):
+    itineraries = [make_itinerary(days, seed=i) for i in range(documents)]
+    print(f"{documents} itineraries of {days} days, {workers} workers ({os.cpu_count()} CPUs)\n")
+    print(f"{'mode':<8} {'seconds':>9} {'PDFs/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'MB':>7}")
+    for name, run in (
+        ('serial', lambda: serial(itineraries)),
+        ('pool', lambda: write_pdf_zip(iter(itineraries), io.BytesIO(), workers=workers)),
+    ):
+        stats = run()
+        print(f"{name:<8} {stats['seconds']:>9.2f} {stats['documents_per_second']:>8.1f} "
+              f"{stats['render_ms']['p50']:>8.1f} {stats['render_ms']['p95']:>8.1f} "
+              f"{stats['bytes'] / 1e6:>7.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk PDF generation benchmark")
+    parser.add_argument('--documents', type=int, default=200)
+    parser.add_argument('--days', type=int, default=7, help='trip length of every itinerary')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    main(args.documents, args.days, args.workers)
@@ -0,0 +1,70 @@
+"""
+Long Itinerary PDF Benchmark
+============================
+
+Renders 14, 90 and 365-day itineraries and compares:
+- eager: every flowable of every day built before layout starts
+- paged: daily sections created while the document is laid out
+  (PDFItineraryGenerator's default)
+
+Reports render time and peak traced Python memory (tracemalloc, measured
+in a separate run so it does not inflate the timing). Both modes produce
+the same PDF.
+
+Usage: python benchmarks/bench_pdf_paged.py [--days N N ...] [--sites N] [--runs N]
+"""
+
+import argparse
+import gc
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from pdf_generator import get_pdf_generator
+from synthetic import make_itinerary
+
+
+def render_ms(itinerary: Dict[str, Any], paged: bool, runs: int) -> float:
+    """Median render time in milliseconds"""
+    generator = get_pdf_generator()
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        generator.render_itinerary_pdf(itinerary, paged=paged)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def peak_mb(itinerary: Dict[str, Any], paged: bool) -> float:
+    """Peak memory allocated while rendering, in MB"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        get_pdf_generator().render_itinerary_pdf(itinerary, paged=paged)
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def main(days: List[int], sites: int, runs: int):
+    print(f"{sites} sites per day, median of {runs} runs\n")
+    print(f"{'days':>5} {'eager ms':>10} {'paged ms':>10} {'eager MB':>10} {'paged MB':>10}")
+    for length in days:
+        itinerary = make_itinerary(length, sites_per_day=sites)
+        print(f"{length:>5} {render_ms(itinerary, False, runs):>10.1f} {render_ms(itinerary, True, runs):>10.1f} "
+              f"{peak_mb(itinerary, False):>10.2f} {peak_mb(itinerary, True):>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Long itinerary PDF benchmark")
+    parser.add_argument('--days', type=int, nargs='+', default=[14, 90, 365])
+    parser.add_argument('--sites', type=int, default=12, help='sites listed per day')
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+    main(args.days, args.sites, args.runs)
@@ -0,0 +1,84 @@
+"""
+Concurrent PDF Session Benchmark
+================================
+
+Simulates Streamlit sessions downloading itinerary PDFs at the same time
+(one thread per session, as Streamlit runs them) and compares:
+- shared file: the old app flow, rendering to generated_itinerary.pdf in
+  the working directory and reading it back
+- in memory: render_itinerary_pdf on the shared generator the app uses
+
+Reports throughput and how many downloads did not match the session's
+own PDF (another session's file, or one read while being rewritten).
+
+Usage: python benchmarks/bench_pdf_sessions.py [--sessions N] [--downloads N] [--days N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from pdf_generator import PDFItineraryGenerator, get_pdf_generator
+from synthetic import make_itinerary
+
+SHARED_PDF_PATH = 'generated_itinerary.pdf'
+
+
+def shared_file_download(itinerary: Dict[str, Any]) -> bytes:
+    """Previous app flow: render to a fixed file, then read it back"""
+    PDFItineraryGenerator().generate_itinerary_pdf(itinerary, SHARED_PDF_PATH)
+    with open(SHARED_PDF_PATH, 'rb') as pdf_file:
+        return pdf_file.read()
+
+
+def in_memory_download(itinerary: Dict[str, Any]) -> bytes:
+    return get_pdf_generator().render_itinerary_pdf(itinerary)
+
+
+def run(download: Callable[[Dict[str, Any]], bytes], itineraries: List[Dict[str, Any]],
+        expected_sizes: List[int], downloads: int) -> Dict[str, float]:
+    """Every session downloads its own itinerary ``downloads`` times"""
+    def session(i: int) -> int:
+        return sum(len(download(itineraries[i])) != expected_sizes[i] for _ in range(downloads))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(itineraries)) as pool:
+        mismatches = sum(pool.map(session, range(len(itineraries))))
+    seconds = time.perf_counter() - start
+    total = len(itineraries) * downloads
+    return {'pdfs': total, 'seconds': seconds, 'pdfs_per_second': total / seconds, 'mismatches': mismatches}
+
+
+def main(sessions: int, downloads: int, days: int):
+    # Different trip lengths give every session a PDF of a different size
+    itineraries = [make_itinerary(days + i, seed=i) for i in range(sessions)]
+    expected_sizes = [len(in_memory_download(itinerary)) for itinerary in itineraries]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            print(f"{sessions} sessions x {downloads} downloads, {days}+ day itineraries\n")
+            print(f"{'flow':<12} {'PDFs':>6} {'seconds':>9} {'PDFs/s':>8} {'wrong PDFs':>11}")
+            for name, download in (('shared file', shared_file_download), ('in memory', in_memory_download)):
+                stats = run(download, itineraries, expected_sizes, downloads)
+                print(f"{name:<12} {stats['pdfs']:>6} {stats['seconds']:>9.2f} "
+                      f"{stats['pdfs_per_second']:>8.1f} {stats['mismatches']:>11}")
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrent PDF download benchmark")
+    parser.add_argument('--sessions', type=int, default=8)
+    parser.add_argument('--downloads', type=int, default=10, help='PDFs per session')
+    parser.add_argument('--days', type=int, default=7, help='trip length of the first session')
+    args = parser.parse_args()
+    main(args.sessions, args.downloads, args.days)
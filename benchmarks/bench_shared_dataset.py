@@ -0,0 +1,115 @@
+"""
+Shared Dataset Benchmark
+========================
+
+Starts 1 and 8 worker processes that each load the same dataset through
+EngineCore._load_dataset (so after the engine's column
+projection and dtype compaction), touch every numeric and categorical
+column, and then report their memory while all workers are alive. The
+engine state cache is disabled so every worker really loads the file. RSS counts shared pages in full for every process;
+PSS splits them between the processes mapping them, so the memory-mapped
+.columns format shows up as a lower PSS per worker. Linux only (/proc).
+
+Usage: python benchmarks/bench_shared_dataset.py [rows] [workers ...]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from dataset_store import HAS_PYARROW, save_columnar
+from synthetic import make_dataset
+
+WORKER_SCRIPT = """
+import json, os, sys
+sys.path.insert(0, {root!r})
+os.environ['TOURISM_STATE_CACHE_DIR'] = ''
+import pandas as pd
+from engine_core import EngineCore
+
+def memory_mb(path, field):
+    with open(path) as status:
+        for line in status:
+            if line.startswith(field + ':'):
+                return int(line.split()[1]) / 1024
+
+# Only the load step of the engine's start-up, without preparing
+engine = EngineCore.__new__(EngineCore)
+engine._init_runtime_state()
+df = engine._load_dataset({path!r})
+for column in df.columns:
+    series = df[column]
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series.cat.codes.sum()
+    elif pd.api.types.is_numeric_dtype(series.dtype):
+        series.sum()
+print('ready', flush=True)
+sys.stdin.readline()
+print(json.dumps({{
+    'rss_mb': memory_mb('/proc/self/status', 'VmRSS'),
+    'pss_mb': memory_mb('/proc/self/smaps_rollup', 'Pss'),
+}}), flush=True)
+"""
+
+
+def run_workers(path: str, workers: int) -> dict:
+    """Average per-process memory with ``workers`` processes alive at once"""
+    script = WORKER_SCRIPT.format(root=ROOT, path=path)
+    procs = [
+        subprocess.Popen([sys.executable, '-c', script], stdin=subprocess.PIPE,
+                         stdout=subprocess.PIPE, text=True)
+        for _ in range(workers)
+    ]
+    for proc in procs:
+        assert proc.stdout.readline().strip() == 'ready'
+
+    results = []
+    for proc in procs:
+        proc.stdin.write('go\n')
+        proc.stdin.flush()
+        results.append(json.loads(proc.stdout.readline()))
+    for proc in procs:
+        proc.stdin.close()
+        proc.wait()
+
+    return {
+        'rss_mb': sum(r['rss_mb'] for r in results) / workers,
+        'pss_mb': sum(r['pss_mb'] for r in results) / workers,
+    }
+
+
+def main(rows: int, worker_counts):
+    print(f"Dataset: {rows:,} synthetic records\n")
+    print(f"{'format':>8} {'workers':>8} {'RSS/proc MB':>12} {'PSS/proc MB':>12} {'total PSS MB':>13}")
+    with tempfile.TemporaryDirectory() as tmp:
+        df = make_dataset(rows)
+        # One directory per format, so the CSV is not served from a columnar copy
+        formats = {'csv': 'dataset.csv'}
+        if HAS_PYARROW:
+            formats['parquet'] = 'dataset.parquet'
+        formats['mapped'] = 'dataset.columns'
+        paths = {}
+        for fmt, name in formats.items():
+            os.makedirs(os.path.join(tmp, fmt))
+            paths[fmt] = os.path.join(tmp, fmt, name)
+        df.to_csv(paths['csv'], index=False)
+        for fmt in ('parquet', 'mapped'):
+            if fmt in paths:
+                save_columnar(df, paths[fmt])
+
+        for fmt, path in paths.items():
+            for workers in worker_counts:
+                result = run_workers(path, workers)
+                print(f"{fmt:>8} {workers:>8} {result['rss_mb']:>12.1f} {result['pss_mb']:>12.1f} "
+                      f"{result['pss_mb'] * workers:>13.1f}")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(args[0] if args else 500_000, args[1:] or [1, 8])
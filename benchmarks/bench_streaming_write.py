@@ -0,0 +1,82 @@
+"""
+Streaming Write Benchmark
+=========================
+
+Generates datasets of increasing size with dataset_generator and streams
+them to CSV and Parquet via dataset_store.write_dataset_stream. Every
+run happens in a fresh interpreter and reports its throughput and RSS,
+sampled after every chunk:
+- median RSS over the chunks: the steady-state footprint, which should
+  stay flat as the output grows
+- peak RSS (VmHWM): the highest sample; it drifts up slowly with the
+  number of chunks (allocator noise), not with the data held
+RSS is read from /proc (Linux only).
+
+Usage: python benchmarks/bench_streaming_write.py [records ...]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from dataset_store import HAS_PYARROW
+from synthetic import make_dataset
+
+# Runs in a child process: stream the records, report throughput and RSS (MB)
+WRITE_SCRIPT = """
+import json, os, statistics, sys
+sys.path.insert(0, {root!r})
+import pandas as pd
+from dataset_generator import iter_expanded_dataset, tourist_profiles
+from dataset_store import write_dataset_stream
+
+def memory_mb(field):
+    with open('/proc/self/status') as status:
+        return next(int(line.split()[1]) / 1024 for line in status if line.startswith(field + ':'))
+
+samples = []
+profiles = tourist_profiles(pd.read_csv({source!r}))
+stats = write_dataset_stream(iter_expanded_dataset(profiles, 42, {tourists}), {output!r},
+                             progress=lambda _: samples.append(memory_mb('VmRSS')))
+print(json.dumps({{
+    **stats,
+    'median_mb': statistics.median(samples),
+    'peak_mb': memory_mb('VmHWM'),
+    'size_mb': os.path.getsize({output!r}) / 1024 ** 2,
+}}))
+"""
+
+# Average records generated per tourist (2 cities x 1.5 sites)
+RECORDS_PER_TOURIST = 3.0
+
+
+def main(sizes):
+    formats = ['.csv'] + (['.parquet'] if HAS_PYARROW else [])
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'source.csv')
+        make_dataset(20_000).to_csv(source, index=False)
+
+        print(f"{'records':>12} {'format':>8} {'seconds':>9} {'rows/s':>10} {'file MB':>9} "
+              f"{'median RSS MB':>14} {'peak RSS MB':>12}")
+        for records in sizes:
+            for extension in formats:
+                output = os.path.join(tmp, 'expanded' + extension)
+                script = WRITE_SCRIPT.format(
+                    root=ROOT, source=source, output=output, tourists=int(records / RECORDS_PER_TOURIST)
+                )
+                result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+                stats = json.loads(result.stdout.strip().splitlines()[-1])
+                os.remove(output)
+                print(f"{stats['rows']:>12,} {extension:>8} {stats['seconds']:>9.1f} "
+                      f"{stats['rows_per_second']:>10,.0f} {stats['size_mb']:>9.1f} "
+                      f"{stats['median_mb']:>14.0f} {stats['peak_mb']:>12.0f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1_000_000, 5_000_000, 20_000_000])
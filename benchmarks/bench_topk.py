@@ -0,0 +1,67 @@
+"""
+Top-k Ranking Benchmark
+=======================
+
+Compares full-sort ranking (pandas sort_values / groupby + sort) with the
+argpartition-based engine_scoring.top_k_indices for site and city
+rankings, and checks both return the same results.
+
+Usage: python benchmarks/bench_topk.py [rows ...]
+"""
+
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine_scoring import group_means, top_k_indices
+
+K = 10
+NUM_CITIES = 50
+
+
+def timed(func, repeat: int = 3) -> float:
+    """Best wall time of ``repeat`` runs in milliseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(sizes):
+    print(f"{'rows':>12} {'sites sort ms':>14} {'sites top-k ms':>15} {'cities sort ms':>15} {'cities top-k ms':>16}")
+    for rows in sizes:
+        rng = np.random.default_rng(7)
+        # Rounded scores so the boundary has ties to break
+        scores = rng.uniform(0, 100, rows).round(1)
+        codes = rng.integers(0, NUM_CITIES, rows)
+        df = pd.DataFrame({'final_score': scores, 'city': pd.Categorical.from_codes(
+            codes, [f"City {i:02d}" for i in range(NUM_CITIES)])})
+
+        def sites_sort():
+            return df.sort_values('final_score', ascending=False, kind='stable').index[:K].to_numpy()
+
+        def sites_topk():
+            return top_k_indices(scores, K)
+
+        def cities_sort():
+            means = df.groupby('city', observed=True)['final_score'].mean()
+            return means.sort_values(ascending=False, kind='stable').index[:K].tolist()
+
+        def cities_topk():
+            return top_k_indices(group_means(codes, scores, NUM_CITIES), K)
+
+        assert (sites_sort() == sites_topk()).all(), "site rankings differ"
+        assert cities_sort() == [f"City {i:02d}" for i in cities_topk()], "city rankings differ"
+
+        print(f"{rows:>12,} {timed(sites_sort):>14.2f} {timed(sites_topk):>15.2f} "
+              f"{timed(cities_sort):>15.2f} {timed(cities_topk):>16.2f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000, 10_000_000])
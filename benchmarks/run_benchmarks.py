@@ -0,0 +1,296 @@
+"""
+Backend Benchmark Suite
+=======================
+
+Reproducible latency/throughput benchmarks for the backend engine,
+chatbot and PDF generator on a synthetic dataset (no network, no
+/mnt/user-data paths):
+- Engine cold start (dataset load + prepare) and start from the state cache
+- generate_itinerary, get_recommendations, get_seasonal_recommendations
+- get_analytics (recomputed and memoized)
+- TravelChatbot.chat (mock responses)
+- PDF itinerary generation (in memory, as the app downloads it)
+
+Results are written as JSON (with the git commit, environment and the
+engine's per-stage timings) so runs can be compared across commits:
+
+Usage: python benchmarks/run_benchmarks.py [--rows N] [--iterations N] [--output FILE] [--only NAME ...]
+       python benchmarks/run_benchmarks.py --compare BASELINE.json CANDIDATE.json [--threshold PCT]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import BUDGET_LEVELS, CLIMATES, INTERESTS, SEASONS, make_dataset
+
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+
+BENCHMARKS = [
+    'cold_start', 'cached_start', 'generate_itinerary', 'get_recommendations',
+    'get_seasonal_recommendations', 'get_analytics', 'get_analytics_memoized',
+    'chat', 'pdf'
+]
+
+CHAT_MESSAGES = [
+    "Hello!",
+    "Can you recommend destinations for art lovers?",
+    "Plan a 5-day itinerary",
+    "What are the best summer destinations?",
+    "Tell me about UNESCO World Heritage sites",
+    "What accessibility options are available?",
+]
+
+
+@contextlib.contextmanager
+def state_cache_dir(path: str) -> Iterator[None]:
+    """Point the engine state cache at ``path`` ('' disables it) inside the block"""
+    from engine_state_cache import STATE_CACHE_DIR_ENV
+    previous = os.environ.get(STATE_CACHE_DIR_ENV)
+    os.environ[STATE_CACHE_DIR_ENV] = path
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ[STATE_CACHE_DIR_ENV]
+        else:
+            os.environ[STATE_CACHE_DIR_ENV] = previous
+
+
+def summarize(durations_ms: List[float]) -> Dict[str, float]:
+    """Latency percentiles and throughput of a list of call durations"""
+    values = np.asarray(durations_ms, dtype=np.float64)
+    total_seconds = values.sum() / 1000
+    return {
+        'count': int(len(values)),
+        'mean_ms': float(values.mean()),
+        'p50_ms': float(np.percentile(values, 50)),
+        'p95_ms': float(np.percentile(values, 95)),
+        'p99_ms': float(np.percentile(values, 99)),
+        'min_ms': float(values.min()),
+        'max_ms': float(values.max()),
+        'throughput_per_s': float(len(values) / total_seconds) if total_seconds else 0.0,
+    }
+
+
+def measure(func: Callable[[Any], Any], inputs: List[Any]) -> Dict[str, float]:
+    """Call ``func`` once per input and summarize the durations"""
+    durations = []
+    for value in inputs:
+        start = time.perf_counter()
+        func(value)
+        durations.append((time.perf_counter() - start) * 1000)
+    return summarize(durations)
+
+
+def make_profiles(count: int, seed: int) -> List[Any]:
+    """Random tourist profiles covering every budget, climate and season"""
+    from tourism_backend_engine import TouristProfile
+
+    rng = np.random.default_rng(seed)
+    return [
+        TouristProfile(
+            age=int(rng.integers(18, 80)),
+            interests=[str(i) for i in rng.choice(INTERESTS, rng.integers(1, 4), replace=False)],
+            accessibility_needs=bool(rng.random() < 0.49),
+            preferred_duration=int(rng.integers(3, 15)),
+            budget_preference=str(rng.choice(BUDGET_LEVELS)),
+            climate_preference=str(rng.choice(CLIMATES)) if rng.random() < 0.5 else None,
+            season_preference=str(rng.choice(SEASONS)) if rng.random() < 0.3 else None,
+        )
+        for _ in range(count)
+    ]
+
+
+def git_commit() -> Optional[str]:
+    """Current commit hash, with a -dirty suffix for uncommitted changes"""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip()
+        return commit + ('-dirty' if dirty else '')
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment() -> Dict[str, Any]:
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+    }
+
+
+def run(rows: int, iterations: int, seed: int, only: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Run the selected benchmarks on a fresh synthetic dataset
+
+    Args:
+        rows: Dataset records
+        iterations: Calls per benchmark (engine starts use at most 5)
+        seed: Seed for the dataset and the profiles
+        only: Benchmark names to run (default: all)
+
+    Returns:
+        JSON-serializable results
+    """
+    from tourism_backend_engine import TourismBackendEngine
+    from instrumentation import get_instrumentation
+
+    selected = only or BENCHMARKS
+    results: Dict[str, Any] = {}
+    instrumentation = get_instrumentation()
+
+    with tempfile.TemporaryDirectory(prefix='tourism_bench_') as tmp:
+        dataset_path = os.path.join(tmp, 'master_tourism_dataset_v2_enhanced.csv')
+        make_dataset(rows, seed).to_csv(dataset_path, index=False)
+
+        def start(_):
+            TourismBackendEngine(dataset_path).prepare()
+
+        if 'cold_start' in selected:
+            with state_cache_dir(''):
+                results['cold_start'] = measure(start, range(min(iterations, 5)))
+
+        with state_cache_dir(os.path.join(tmp, 'state_cache')):
+            # The first start fills the cache
+            engine = TourismBackendEngine(dataset_path)
+            engine.prepare()
+            if 'cached_start' in selected:
+                results['cached_start'] = measure(start, range(min(iterations, 5)))
+        engine.configure_result_cache(enabled=False)
+        profiles = make_profiles(iterations, seed)
+        instrumentation.reset()
+
+        if 'generate_itinerary' in selected:
+            results['generate_itinerary'] = measure(
+                lambda profile: engine.generate_itinerary(profile, datetime(2026, 6, 1)), profiles
+            )
+        if 'get_recommendations' in selected:
+            results['get_recommendations'] = measure(
+                lambda profile: engine.get_recommendations(
+                    profile, num_recommendations=10, recommendation_type='all'
+                ),
+                profiles
+            )
+        if 'get_seasonal_recommendations' in selected:
+            results['get_seasonal_recommendations'] = measure(
+                lambda i: engine.get_seasonal_recommendations(
+                    season=SEASONS[i % len(SEASONS)], budget=None, num_recommendations=3
+                ),
+                range(iterations)
+            )
+        if 'get_analytics' in selected:
+            def analytics_cold(_):
+                # A new dataset revision forces recomputation
+                engine.data_revision = getattr(engine, 'data_revision', 0) + 1
+                engine.get_analytics()
+            results['get_analytics'] = measure(analytics_cold, range(iterations))
+        if 'get_analytics_memoized' in selected:
+            engine.get_analytics()
+            results['get_analytics_memoized'] = measure(lambda _: engine.get_analytics(), range(iterations))
+        if 'chat' in selected:
+            from chatbot_integration import TravelChatbot
+            chatbot = TravelChatbot(engine)
+            results['chat'] = measure(
+                lambda i: chatbot.chat(CHAT_MESSAGES[i % len(CHAT_MESSAGES)]), range(iterations)
+            )
+        if 'pdf' in selected:
+            from pdf_generator import PDFItineraryGenerator
+            itinerary = engine.generate_itinerary(profiles[0], datetime(2026, 6, 1))
+            results['pdf'] = measure(
+                lambda _: PDFItineraryGenerator().render_itinerary_pdf(itinerary),
+                range(iterations)
+            )
+
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'environment': environment(),
+        'parameters': {'rows': rows, 'iterations': iterations, 'seed': seed},
+        'benchmarks': results,
+        'stages': instrumentation.metrics()['stages'],
+    }
+
+
+def compare(baseline_path: str, candidate_path: str, threshold: float) -> int:
+    """
+    Print p50/p99 changes between two result files
+
+    Returns:
+        Number of benchmarks whose p50 regressed by more than ``threshold`` percent
+    """
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    with open(candidate_path) as f:
+        candidate = json.load(f)
+
+    print(f"baseline:  {baseline.get('commit')} ({baseline['parameters']})")
+    print(f"candidate: {candidate.get('commit')} ({candidate['parameters']})")
+    print(f"{'benchmark':<30} {'p50 ms':>10} {'new p50':>10} {'change':>8} {'p99 ms':>10} {'new p99':>10}")
+
+    regressions = 0
+    for name, new in candidate['benchmarks'].items():
+        old = baseline['benchmarks'].get(name)
+        if old is None:
+            continue
+        change = (new['p50_ms'] / old['p50_ms'] - 1) * 100 if old['p50_ms'] else 0.0
+        flag = ' !' if change > threshold else ''
+        regressions += bool(flag)
+        print(f"{name:<30} {old['p50_ms']:>10.2f} {new['p50_ms']:>10.2f} {change:>+7.1f}% "
+              f"{old['p99_ms']:>10.2f} {new['p99_ms']:>10.2f}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10_000, help='synthetic dataset records')
+    parser.add_argument('--iterations', type=int, default=50, help='calls per benchmark')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--only', nargs='+', choices=BENCHMARKS, help='benchmarks to run')
+    parser.add_argument('--output', help='result file (default: benchmarks/results/<time>-<commit>.json)')
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CANDIDATE'), help='compare two result files')
+    parser.add_argument('--threshold', type=float, default=10.0, help='p50 regression threshold in percent')
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(1 if compare(*args.compare, args.threshold) else 0)
+
+    results = run(args.rows, args.iterations, args.seed, args.only)
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        output = os.path.join(RESULTS_DIR, f"{stamp}-{(results['commit'] or 'unknown')[:12]}.json")
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    print(f"{'benchmark':<30} {'p50 ms':>10} {'p99 ms':>10} {'ops/s':>10}")
+    for name, stats in results['benchmarks'].items():
+        print(f"{name:<30} {stats['p50_ms']:>10.2f} {stats['p99_ms']:>10.2f} {stats['throughput_per_s']:>10.1f}")
+    print(f"\nSaved {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Synthetic Benchmark Datasets
+============================
+
+Builds datasets with the same columns as master_tourism_dataset_v2_enhanced.csv
+so benchmarks run offline without the real data, and itinerary
+dictionaries shaped like TourismBackendEngine.generate_itinerary output.
+
+Records come from dataset_generator (the same cities, sites and
+geographic hierarchy as the enhanced dataset), expanded from synthetic
+tourist profiles.
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+from dataset_generator import CITY_DATABASE, SEASONS, generate_expanded_dataset
+
+INTERESTS = ['Art', 'History', 'Architecture', 'Cultural', 'Nature']
+AGE_GROUPS = ['18-25', '26-35', '36-50', '51-65', '65+']
+BUDGET_LEVELS = sorted({city['budget_level'] for city in CITY_DATABASE.values()})
+CLIMATES = sorted({city['climate'] for city in CITY_DATABASE.values()})
+
+# Records per tourist drawn by dataset_generator: 1-3 cities, 1-2 sites each
+RECORDS_PER_TOURIST = 3
+
+
+def make_tourists(count: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Generate synthetic tourist profiles (see dataset_generator.tourist_profiles)
+
+    Args:
+        count: Number of tourists
+        seed: Random seed
+
+    Returns:
+        One row per tourist with the dataset's tourist columns
+    """
+    rng = np.random.default_rng(seed)
+    ages = rng.integers(18, 80, count)
+    interest_choices = [
+        INTERESTS[i:i + n] for n in (1, 2, 3) for i in range(len(INTERESTS) - n + 1)
+    ]
+    interests = [interest_choices[i] for i in rng.integers(0, len(interest_choices), count)]
+
+    return pd.DataFrame({
+        'Tourist ID': np.arange(1, count + 1),
+        'Age': ages,
+        'Age_Group': np.array(AGE_GROUPS, dtype=object)[np.minimum((ages - 18) // 12, 4)],
+        'Interests': [str(choice) for choice in interests],
+        'Number_of_Interests': [len(choice) for choice in interests],
+        'Accessibility': rng.random(count) < 0.49,
+        'Preferred Tour Duration': rng.integers(1, 15, count),
+        'Tour Duration': rng.integers(1, 15, count),
+        'Tourist Rating': rng.uniform(1, 5, count).round(1),
+        'Satisfaction': rng.uniform(1, 5, count).round(1),
+        'Recommendation Accuracy': rng.uniform(80, 100, count),
+        'VR Experience Quality': rng.uniform(3, 5, count),
+    })
+
+
+def make_dataset(rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Generate a synthetic v2 tourism dataset
+
+    Args:
+        rows: Number of records
+        seed: Random seed
+
+    Returns:
+        DataFrame with the enhanced dataset's columns (text columns as
+        plain strings, as read from the CSV)
+    """
+    tourists = make_tourists(-(-rows // RECORDS_PER_TOURIST), seed)
+    df = generate_expanded_dataset(tourists, seed)
+    while len(df) < rows:
+        # Unlucky draws: add tourists until there are enough records
+        tourists = make_tourists(len(tourists) * 2, seed)
+        df = generate_expanded_dataset(tourists, seed)
+
+    df = df.iloc[:rows].reset_index(drop=True)
+    categorical = df.columns[[isinstance(dtype, pd.CategoricalDtype) for dtype in df.dtypes]]
+    return df.astype({column: str for column in categorical})
+
+
+def make_itinerary(days: int, seed: int = 42, sites_per_day: int = 2) -> Dict[str, Any]:
+    """
+    Generate a synthetic itinerary as returned by generate_itinerary
+
+    Args:
+        days: Trip length
+        seed: Random seed
+        sites_per_day: Sites listed per day (group tours list many)
+
+    Returns:
+        Itinerary dictionary accepted by PDFItineraryGenerator
+    """
+    rng = np.random.default_rng(seed)
+    names = list(CITY_DATABASE)
+    start = date(2026, 6, 1)
+    schedule = []
+    for day in range(days):
+        city = names[(day // 3 + seed) % len(names)]
+        # Group tours can list more sites than the city's famous ones
+        sites = CITY_DATABASE[city]['famous_sites']
+        sites = sites + [f"{city} Site {i}" for i in range(len(sites), sites_per_day)]
+        schedule.append({
+            'day': day + 1,
+            'date': (start + timedelta(days=day)).isoformat(),
+            'city': city,
+            'sites': [sites[i] for i in rng.choice(len(sites), sites_per_day, replace=False)],
+            'activities': ['Guided tour', 'Local cuisine tasting'][:int(rng.integers(0, 3))],
+            'estimated_cost_usd': float(CITY_DATABASE[city]['avg_cost'] + rng.uniform(-30, 30)),
+            'notes': 'UNESCO World Heritage Site' if rng.random() < 0.3 else '',
+        })
+    total = sum(day['estimated_cost_usd'] for day in schedule)
+    return {
+        'status': 'success',
+        'tourist_profile': {
+            'age': 35,
+            'interests': INTERESTS[:3],
+            'budget': 'Mid-range',
+            'duration': days,
+        },
+        'itinerary': {
+            'start_date': start.isoformat(),
+            'end_date': (start + timedelta(days=days - 1)).isoformat(),
+            'total_days': days,
+            'cities_visited': list(dict.fromkeys(day['city'] for day in schedule)),
+            'total_cost_usd': total,
+            'avg_daily_cost_usd': total / days,
+            'daily_schedule': schedule,
+        },
+        'recommendations': {
+            'best_season': 'Spring',
+            'packing_tips': ['Comfortable walking shoes', 'Light layers', 'Travel adapter'],
+            'accessibility_info': None,
+        },
+    }
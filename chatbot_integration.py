@@ -1,3 +1,85 @@
+"""
+Travel Chatbot Integration
+==========================
+
+Conversational travel assistant for the platform:
+- Answers questions on destinations, costs, seasons, UNESCO sites and
+  accessibility from the backend engine's data
+- Keeps the conversation history per chatbot instance
+- Mock responses for demos; the Gemini API call is sketched for production
+
+Dependencies: tourism_backend_engine (engine passed in by the caller)
+"""
+
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from instrumentation import EVENT_HISTORY_CLEARED
+
+
+class TravelChatbot:
+    """AI travel assistant backed by the tourism engine"""
+    
+    def __init__(self, backend_engine, api_key: Optional[str] = None):
+        """
+        Initialize the chatbot
+        
+        Args:
+            backend_engine: TourismBackendEngine answering data questions
+            api_key: Gemini API key (defaults to the GEMINI_API_KEY
+                environment variable; mock responses are used either way)
+        """
+        self.engine = backend_engine
+        self.api_key = api_key or os.environ.get('GEMINI_API_KEY')
+        self.conversation_history: List[Dict[str, Any]] = []
+    
+    def chat(
+        self,
+        message: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Answer a user message
+        
+        Args:
+            message: User message
+            context: Optional context (e.g. the current itinerary)
+            
+        Returns:
+            Response dictionary with 'message', 'type' and optional
+            'data' and 'suggestions'
+        """
+        self.conversation_history.append({
+            'role': 'user',
+            'content': message,
+            'timestamp': datetime.now().isoformat()
+        })
+        
+        response = self._call_gemini_api(message, context)
+        
+        self.conversation_history.append({
+            'role': 'assistant',
+            'content': response['message'],
+            'timestamp': datetime.now().isoformat()
+        })
+        return response
+    
+    def _call_gemini_api(
+        self,
+        message: str,
+        context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Call Gemini API (placeholder for production)
+        
+        In production, this would make the actual API call:
+        
+        import requests
+        
+        headers = {'Content-Type': 'application/json', 'x-goog-api-key': self.api_key}
+        payload = {'contents': [{'parts': [{'text': message}]}]}
+        
         response = requests.post(
             'https://generativelanguage.googleapis.com/v1/models/gemini-pro:generateContent',
             headers=headers,
@@ -22,7 +104,6 @@
         # Greeting
         if any(word in message_lower for word in ['hello', 'hi', 'hey']):
             return {
-                'message': "Hello! 👋 I'm your AI travel assistant. I can help you plan your perfect cultural tourism experience. What are you interested in exploring?",
                 'message': (
                     "Hello! 👋 I'm your AI travel assistant. I can help you plan a cultural trip, "
                     "suggest destinations, and build itineraries.\n\n"
@@ -37,7 +118,6 @@
                     'Recommend destinations for art lovers',
                     'Plan a 5-day itinerary',
                     'Find budget-friendly options',
-                    'Suggest UNESCO World Heritage sites'
                     'Suggest UNESCO World Heritage sites',
                     'Recommend summer destinations'
                 ]
@@ -150,7 +230,6 @@
         # Default response
         else:
             return {
-                'message': "I'm here to help with your travel planning! I can assist with:\n\n✈️ Services:\n• Destination recommendations\n• Itinerary planning\n• Budget advice\n• Weather information\n• Accessibility options\n• Cultural insights\n\nWhat would you like to explore?",
                 'message': (
                     "I'm here to help with your travel planning! I can assist with:\n\n"
                     "✈️ Services:\n"
@@ -178,7 +257,7 @@
     def clear_history(self):
         """Clear conversation history"""
         self.conversation_history = []
-        print("🗑️ Conversation history cleared")
+        self.engine.instrumentation.event(EVENT_HISTORY_CLEARED)
     
     def analyze_photo(self, photo_path: str, question: str) -> Dict[str, Any]:
         """
@@ -187,3 +266,17 @@
         Args:
             photo_path: Path to photo
             question: Question about the photo
+            
+        Returns:
+            Response dictionary with 'message' and 'type'
+        """
+        # Photo analysis needs the Gemini Vision API; the demo describes
+        # what it would do instead of calling it
+        return {
+            'message': (
+                f"Photo analysis is not available in demo mode. With the Gemini Vision API "
+                f"configured I would look at {os.path.basename(photo_path)} and answer: {question}"
+            ),
+            'type': 'photo_analysis',
+            'requires_api': True
+        }
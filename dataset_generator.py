@@ -1,26 +1,29 @@
 """
-Tourism Dataset Enhancement Script
-===================================
+Tourism Dataset Generator
+=========================
 
-Expands the 5-city dataset to 50+ cities with proper geographic hierarchy:
-- Continent → Country → State/Region → City
+Builds the expanded multi-city dataset (tourist x city x site records)
+with vectorized NumPy sampling instead of per-tourist Python loops:
+- Seeded generators per block of tourists, so the same seed always
+  gives byte-identical output
+- Cities and sites drawn without replacement by ranking random keys
+- Rows expanded with np.repeat and record IDs formatted per column
+- Output produced block by block and streamed to CSV/Parquet in
+  fixed-size chunks, so memory stays bounded at 10M+ rows
 
-Adds realistic tourism data for major destinations worldwide.
+Dependencies: numpy, pandas (optional: pyarrow for Parquet output)
+
+Usage: python dataset_generator.py <source.csv> <output.csv|output.parquet>
+           [--tourists N] [--seed SEED] [--chunk-rows ROWS]
 """
 
-import pandas as pd
+import argparse
+import zlib
 import numpy as np
-from datetime import datetime
-import random
-
-print("=" * 80)
-print("TOURISM DATASET ENHANCEMENT")
-print("=" * 80 + "\n")
+import pandas as pd
+from typing import Any, Dict, Iterator, Optional, Tuple
 
-# Load original dataset
-print("Loading original dataset...")
-df_original = pd.read_csv('/mnt/user-data/uploads/master_clean_tourism_dataset_v1.csv')
-print(f"✓ Original: {len(df_original):,} records, {df_original['city'].nunique()} cities\n")
+from dataset_store import STREAM_CHUNK_ROWS, print_progress, write_dataset_stream
 
 # ============================================================================
 # GEOGRAPHIC HIERARCHY DATABASE
@@ -516,120 +519,340 @@ CITY_DATABASE = {
     },
 }
 
-print(f"✓ Geographic database: {len(CITY_DATABASE)} cities across {len(set(c['continent'] for c in CITY_DATABASE.values()))} continents\n")
+SEASONS = ['Spring', 'Summer', 'Autumn', 'Winter']
 
-# ============================================================================
-# GENERATE EXPANDED DATASET
-# ============================================================================
+# Tourists per generation block; each block draws from its own seeded
+# generator, so output depends only on the seed (not on memory limits)
+TOURIST_BLOCK_SIZE = 65_536
+
+# Tourist columns copied to every generated record (with defaults when
+# the source dataset lacks them)
+TOURIST_COLUMN_DEFAULTS = {
+    'Tourist ID': None,
+    'Age': None,
+    'Age_Group': None,
+    'Interests': None,
+    'Number_of_Interests': None,
+    'Accessibility': None,
+    'Preferred Tour Duration': None,
+    'Tour Duration': None,
+    'Tourist Rating': None,
+    'Satisfaction': None,
+    'Recommendation Accuracy': 90,
+    'VR Experience Quality': 4.5,
+}
 
-print("Generating expanded dataset...")
+# Uniformly sampled experience columns: (low, high)
+EXPERIENCE_RANGES = {
+    'beaches': (1, 5),
+    'nightlife': (2, 5),
+    'cuisine': (3, 5),
+    'wellness': (2, 5),
+    'urban': (3, 5),
+    'seclusion': (1, 4),
+}
 
-# Sample from original to get tourist profiles
-sample_tourists = df_original.groupby('Tourist ID').first().reset_index()
-n_tourists = len(sample_tourists)
 
-# Generate new records for all cities
-new_records = []
+# Powers of ten used to count decimal digits
+_POWERS_OF_TEN = 10 ** np.arange(1, 19, dtype=np.int64)
 
-for idx, tourist_row in sample_tourists.iterrows():
-    # Each tourist visits 1-3 cities from the database
-    num_cities = random.randint(1, 3)
-    visited_cities = random.sample(list(CITY_DATABASE.keys()), num_cities)
-    
-    for city_name in visited_cities:
-        city_data = CITY_DATABASE[city_name]
-        
-        # Select 1-2 sites from this city
-        num_sites = min(len(city_data['famous_sites']), random.randint(1, 2))
-        sites = random.sample(city_data['famous_sites'], num_sites)
-        
-        for site in sites:
-            record = {
-                'record_id': f"REC-{tourist_row['Tourist ID']:05d}-{hash(site) % 100000000:08x}-{len(new_records):06d}",
-                'dataset_version': 'v2.0',
-                'record_status': 'active',
-                'last_validated': '2026-02-01',
-                'Tourist ID': tourist_row['Tourist ID'],
-                'Age': tourist_row['Age'],
-                'Age_Group': tourist_row['Age_Group'],
-                'current_site': site,
-                'Site Name': site,
-                'Sites Visited': str([site]),  # Will be updated later
-                'city': city_name,
-                'country': city_data['country'],
-                'Continent': city_data['continent'],
-                'state': city_data['state'],
-                'region': city_data['region'],
-                'Interests': tourist_row['Interests'],
-                'Number_of_Interests': tourist_row['Number_of_Interests'],
-                'Accessibility': tourist_row['Accessibility'],
-                'Preferred Tour Duration': tourist_row['Preferred Tour Duration'],
-                'Tour Duration': tourist_row['Tour Duration'],
-                'matched_destination': '',
-                'Type': 'Cultural',
-                'Best Season': random.choice(['Spring', 'Summer', 'Autumn', 'Winter']),
-                'UNESCO Site': random.choice([True, False]),
-                'avg_cost_usd': city_data['avg_cost'] + random.uniform(-30, 30),
-                'Cost_Category': '',
-                'budget_level': city_data['budget_level'],
-                'Tourist Rating': tourist_row['Tourist Rating'],
-                'Satisfaction': tourist_row['Satisfaction'],
-                'Avg Rating': random.uniform(3.5, 5.0),
-                'Recommendation Accuracy': tourist_row.get('Recommendation Accuracy', 90),
-                'VR Experience Quality': tourist_row.get('VR Experience Quality', 4.5),
-                'culture': city_data['culture_score'],
-                'adventure': city_data['adventure_score'],
-                'nature': city_data['nature_score'],
-                'beaches': random.uniform(1, 5),
-                'nightlife': random.uniform(2, 5),
-                'cuisine': random.uniform(3, 5),
-                'wellness': random.uniform(2, 5),
-                'urban': random.uniform(3, 5),
-                'seclusion': random.uniform(1, 4),
-                'overall_experience_score': city_data['culture_score'],
-                'yearly_avg_temp': city_data['avg_temp'],
-                'climate_classification': city_data['climate'],
-                'Popularity_Category': ''
-            }
-            
-            new_records.append(record)
-    
-    if (idx + 1) % 500 == 0:
-        print(f"  Processed {idx + 1}/{n_tourists} tourists...")
 
-# Create new dataframe
-df_expanded = pd.DataFrame(new_records)
+def site_hash(site: str) -> str:
+    """Stable 8-hex-digit site tag used in record IDs (same in every process)"""
+    return f"{zlib.crc32(site.encode('utf-8')) % 100000000:08x}"
 
-print(f"\n✓ Generated {len(df_expanded):,} records for {df_expanded['city'].nunique()} cities")
 
-# ============================================================================
-# SAVE ENHANCED DATASET
-# ============================================================================
+def _digits(values: np.ndarray, width: int) -> np.ndarray:
+    """Zero-padded ASCII digits of non-negative integers as a (rows x width) byte matrix"""
+    powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+    return (values[:, None] // powers % 10 + ord('0')).astype(np.uint8)
+
+
+def format_record_ids(tourist_ids: np.ndarray, site_tags: np.ndarray, record_numbers: np.ndarray) -> np.ndarray:
+    """
+    Vectorized f"REC-{tourist_id:05d}-{site_tag}-{record_number:06d}"
+
+    Rows are grouped by the width of their numbers (wider than the
+    padding only for large IDs) and each group is assembled as a byte
+    matrix, so no Python string is formatted per row.
+
+    Args:
+        tourist_ids: Non-negative tourist IDs
+        site_tags: (rows x 8) ASCII bytes of the site tags
+        record_numbers: Non-negative record numbers
+
+    Returns:
+        Unicode array of record IDs
+    """
+    tourist_ids = np.asarray(tourist_ids, dtype=np.int64)
+    record_numbers = np.asarray(record_numbers, dtype=np.int64)
+    tourist_width = np.maximum(5, np.searchsorted(_POWERS_OF_TEN, tourist_ids, side='right') + 1)
+    record_width = np.maximum(6, np.searchsorted(_POWERS_OF_TEN, record_numbers, side='right') + 1)
+
+    widths = tourist_width * 100 + record_width
+    length = 14 + int(tourist_width.max(initial=5)) + int(record_width.max(initial=6))
+    ids = np.empty(len(tourist_ids), dtype=f"U{length}")
+    for key in np.unique(widths):
+        rows = np.flatnonzero(widths == key)
+        t, r = divmod(int(key), 100)
+        chars = np.empty((len(rows), 14 + t + r), dtype=np.uint8)
+        chars[:, :4] = np.frombuffer(b'REC-', dtype=np.uint8)
+        chars[:, 4:4 + t] = _digits(tourist_ids[rows], t)
+        chars[:, 4 + t] = ord('-')
+        chars[:, 5 + t:13 + t] = site_tags[rows]
+        chars[:, 13 + t] = ord('-')
+        chars[:, 14 + t:] = _digits(record_numbers[rows], r)
+        ids[rows] = chars.view(f"S{chars.shape[1]}").ravel().astype(ids.dtype)
+    return ids
+
+
+class _CityTable:
+    """CITY_DATABASE as arrays indexed by city position"""
+
+    def __init__(self, city_database: Dict[str, Dict[str, Any]]):
+        self.names = list(city_database)
+        cities = [city_database[name] for name in self.names]
+
+        self.site_counts = np.array([len(city['famous_sites']) for city in cities])
+        max_sites = int(self.site_counts.max())
+        self.sites = [site for city in cities for site in city['famous_sites']]
+        self.site_offsets = np.concatenate([[0], np.cumsum(self.site_counts)[:-1]])
+        self.site_tags = np.frombuffer(
+            ''.join(site_hash(site) for site in self.sites).encode('ascii'), dtype=np.uint8
+        ).reshape(len(self.sites), 8)
+        # Padding slots rank after every real site
+        self.site_padding = np.arange(max_sites) >= self.site_counts[:, None]
+
+        self.attributes = {
+            key: np.array([city[key] for city in cities])
+            for key in ('country', 'continent', 'state', 'region', 'climate', 'avg_temp',
+                        'culture_score', 'adventure_score', 'nature_score', 'budget_level', 'avg_cost')
+        }
+
+
+def _pick_without_replacement(
+    rng: np.random.Generator,
+    counts: np.ndarray,
+    available: np.ndarray,
+    invalid: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Draw ``counts[i]`` distinct slots for every row i
+
+    Args:
+        rng: Random generator
+        counts: Number of slots per row
+        available: Slots per row (columns of the random key matrix)
+        invalid: Optional (rows x slots) mask of slots that cannot be drawn
+
+    Returns:
+        (row index, slot index) of every draw, in row order
+    """
+    keys = rng.random((len(counts), available))
+    if invalid is not None:
+        keys[invalid] = np.inf
+    k = int(counts.max(initial=0))
+    if k == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    if k < available:
+        # Only the k smallest keys are needed, in order
+        order = np.argpartition(keys, range(k), axis=1)[:, :k]
+    else:
+        order = np.argsort(keys, axis=1)
+    taken = np.arange(order.shape[1]) < counts[:, None]
+    rows = np.broadcast_to(np.arange(len(counts))[:, None], order.shape)
+    return rows[taken], order[taken]
+
+
+def _categorical(values: np.ndarray, codes: np.ndarray) -> pd.Categorical:
+    """Column of ``values[codes]`` without materializing a string per row"""
+    categories, inverse = np.unique(values, return_inverse=True)
+    return pd.Categorical.from_codes(inverse[codes], categories)
+
+
+def _generate_block(
+    tourists: pd.DataFrame,
+    table: _CityTable,
+    rng: np.random.Generator,
+    first_record: int
+) -> pd.DataFrame:
+    """Records for one block of tourists"""
+    n_tourists = len(tourists)
+    num_cities = rng.integers(1, 4, n_tourists)
+    tourist_idx, city_idx = _pick_without_replacement(rng, num_cities, len(table.names))
+
+    num_sites = np.minimum(table.site_counts[city_idx], rng.integers(1, 3, len(city_idx)))
+    visit_idx, site_slot = _pick_without_replacement(
+        rng, num_sites, table.site_padding.shape[1], table.site_padding[city_idx]
+    )
+    tourist_idx = tourist_idx[visit_idx]
+    city_idx = city_idx[visit_idx]
+    site_idx = table.site_offsets[city_idx] + site_slot
+    rows = len(site_idx)
+
+    city = table.attributes
+    site_names = _categorical(np.array(table.sites, dtype=object), site_idx)
+    tourist_ids = tourists['Tourist ID'].to_numpy(dtype=np.int64)[tourist_idx]
+    record_numbers = np.arange(first_record, first_record + rows)
+
+    record_ids = format_record_ids(tourist_ids, table.site_tags[site_idx], record_numbers)
+
+    def tourist_column(column, default):
+        if column in tourists.columns:
+            return tourists[column].array.take(tourist_idx)
+        return np.full(rows, default)
+
+    records = {
+        'record_id': record_ids,
+        'dataset_version': 'v2.0',
+        'record_status': 'active',
+        'last_validated': '2026-02-01',
+        'Tourist ID': tourist_ids,
+        'Age': tourist_column('Age', None),
+        'Age_Group': tourist_column('Age_Group', None),
+        'current_site': site_names,
+        'Site Name': site_names,
+        'Sites Visited': _categorical(np.array([str([site]) for site in table.sites], dtype=object), site_idx),
+        'city': _categorical(np.array(table.names, dtype=object), city_idx),
+        'country': _categorical(city['country'], city_idx),
+        'Continent': _categorical(city['continent'], city_idx),
+        'state': _categorical(city['state'], city_idx),
+        'region': _categorical(city['region'], city_idx),
+    }
+    for column in ('Interests', 'Number_of_Interests', 'Accessibility', 'Preferred Tour Duration', 'Tour Duration'):
+        records[column] = tourist_column(column, TOURIST_COLUMN_DEFAULTS[column])
+    records.update({
+        'matched_destination': '',
+        'Type': 'Cultural',
+        'Best Season': pd.Categorical.from_codes(rng.integers(0, len(SEASONS), rows), SEASONS),
+        'UNESCO Site': rng.random(rows) < 0.5,
+        'avg_cost_usd': city['avg_cost'][city_idx] + rng.uniform(-30, 30, rows),
+        'Cost_Category': '',
+        'budget_level': _categorical(city['budget_level'], city_idx),
+    })
+    for column in ('Tourist Rating', 'Satisfaction'):
+        records[column] = tourist_column(column, TOURIST_COLUMN_DEFAULTS[column])
+    records['Avg Rating'] = rng.uniform(3.5, 5.0, rows)
+    for column in ('Recommendation Accuracy', 'VR Experience Quality'):
+        records[column] = tourist_column(column, TOURIST_COLUMN_DEFAULTS[column])
+    records.update({
+        'culture': city['culture_score'][city_idx],
+        'adventure': city['adventure_score'][city_idx],
+        'nature': city['nature_score'][city_idx],
+    })
+    for column, (low, high) in EXPERIENCE_RANGES.items():
+        records[column] = rng.uniform(low, high, rows)
+    records.update({
+        'overall_experience_score': city['culture_score'][city_idx],
+        'yearly_avg_temp': city['avg_temp'][city_idx],
+        'climate_classification': _categorical(city['climate'], city_idx),
+        'Popularity_Category': '',
+    })
+
+    return pd.DataFrame(records)
+
+
+def tourist_profiles(df: pd.DataFrame) -> pd.DataFrame:
+    """One row per tourist (first record of each Tourist ID)"""
+    return df.groupby('Tourist ID').first().reset_index()
+
+
+def iter_expanded_dataset(
+    tourists: pd.DataFrame,
+    seed: int = 42,
+    num_tourists: Optional[int] = None,
+    city_database: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Generate the expanded dataset block by block
+
+    Every tourist visits 1-3 distinct cities and 1-2 distinct famous sites
+    per city. Blocks hold TOURIST_BLOCK_SIZE tourists, so memory use is
+    bounded regardless of the total size.
+
+    Args:
+        tourists: Tourist profiles (see tourist_profiles)
+        seed: Random seed; the same seed and inputs give identical output
+        num_tourists: Number of tourists to generate; profiles are drawn
+            with replacement and renumbered 1..num_tourists (default: one
+            per given profile, keeping their IDs)
+        city_database: City attributes (defaults to CITY_DATABASE)
+
+    Yields:
+        DataFrames of consecutive records with the v2 dataset columns
+        (a single empty one when there are no tourists)
+
+    Raises:
+        ValueError: num_tourists is positive but there are no profiles
+            to draw the tourists from
+    """
+    if num_tourists and not len(tourists):
+        raise ValueError(f"Cannot generate {num_tourists} tourists without any tourist profiles")
+
+    table = _CityTable(city_database or CITY_DATABASE)
+    tourists = tourists.reset_index(drop=True)
+    # Text columns (Interests, Age_Group, ...) repeat per record; as
+    # categoricals they are copied as integer codes
+    text_columns = tourists.columns[[
+        dtype == object or isinstance(dtype, pd.StringDtype) for dtype in tourists.dtypes
+    ]]
+    tourists = tourists.astype({column: 'category' for column in text_columns})
+    total = len(tourists) if num_tourists is None else num_tourists
+    # No tourists still yields one (empty) block, so consumers get the columns
+    num_blocks = max(1, -(-total // TOURIST_BLOCK_SIZE))
+    profile_seq, *block_seqs = np.random.SeedSequence(seed).spawn(num_blocks + 1)
+
+    if num_tourists is not None:
+        profile_idx = np.random.default_rng(profile_seq).integers(0, len(tourists), total)
+
+    first_record = 0
+    for block, block_seq in enumerate(block_seqs):
+        start = block * TOURIST_BLOCK_SIZE
+        stop = min(start + TOURIST_BLOCK_SIZE, total)
+        if num_tourists is None:
+            block_tourists = tourists.iloc[start:stop]
+        else:
+            block_tourists = tourists.iloc[profile_idx[start:stop]].reset_index(drop=True)
+            block_tourists['Tourist ID'] = np.arange(start + 1, stop + 1)
+
+        df = _generate_block(block_tourists, table, np.random.default_rng(block_seq), first_record)
+        df.index = pd.RangeIndex(first_record, first_record + len(df))
+        first_record += len(df)
+        yield df
+
+
+def generate_expanded_dataset(
+    tourists: pd.DataFrame,
+    seed: int = 42,
+    num_tourists: Optional[int] = None,
+    city_database: Optional[Dict[str, Dict[str, Any]]] = None
+) -> pd.DataFrame:
+    """
+    Generate the whole expanded dataset in memory
+
+    Same arguments as iter_expanded_dataset; use that (or a streaming
+    writer) for outputs too large to hold at once. Without tourists the
+    result is an empty frame with the dataset's columns.
+    """
+    return pd.concat(iter_expanded_dataset(tourists, seed, num_tourists, city_database))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the expanded tourism dataset")
+    parser.add_argument('source', help='dataset with the tourist profiles (CSV)')
+    parser.add_argument('output', help='output .csv or .parquet')
+    parser.add_argument('--tourists', type=int, help='tourists to generate (default: one per source tourist)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--chunk-rows', type=int, default=STREAM_CHUNK_ROWS)
+    args = parser.parse_args()
 
-output_path = '/mnt/user-data/outputs/master_tourism_dataset_v2_enhanced.csv'
-df_expanded.to_csv(output_path, index=False)
-
-print(f"\n✅ Enhanced dataset saved!")
-print(f"   File: {output_path}")
-print(f"   Records: {len(df_expanded):,}")
-print(f"   Cities: {df_expanded['city'].nunique()}")
-print(f"   Countries: {df_expanded['country'].nunique()}")
-print(f"   Continents: {df_expanded['Continent'].nunique()}")
-
-# Statistics
-print(f"\n📊 Geographic Distribution:")
-print(f"   Continents: {sorted(df_expanded['Continent'].unique())}")
-print(f"\n   Cities by Continent:")
-for continent in sorted(df_expanded['Continent'].unique()):
-    cities = df_expanded[df_expanded['Continent'] == continent]['city'].nunique()
-    print(f"     {continent}: {cities} cities")
-
-print(f"\n   Sample cities:")
-for city in sorted(df_expanded['city'].unique())[:10]:
-    count = len(df_expanded[df_expanded['city'] == city])
-    country = df_expanded[df_expanded['city'] == city]['country'].iloc[0]
-    print(f"     {city}, {country}: {count} records")
-
-print("\n" + "=" * 80)
-print("✅ DATASET ENHANCEMENT COMPLETE!")
-print("=" * 80)
+    profiles = tourist_profiles(pd.read_csv(args.source))
+    print(f"Generating from {len(profiles):,} tourist profiles into {args.output}...")
+    stats = write_dataset_stream(
+        iter_expanded_dataset(profiles, args.seed, args.tourists),
+        args.output,
+        args.chunk_rows,
+        progress=print_progress
+    )
+    print(f"✓ {stats['rows']:,} records in {stats['chunks']} chunks, "
+          f"{stats['seconds']:.1f} s ({stats['rows_per_second']:,.0f} rows/s)")
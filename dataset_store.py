@@ -0,0 +1,693 @@
+"""
+Tourism Dataset Store
+=====================
+
+Loading and load-time normalization of the tourism dataset used by
+TourismBackendEngine:
+- Columnar on-disk format (Parquet, or NumPy .npz when pyarrow is missing)
+- Memory-mapped column directory shared read-only across worker processes
+- CSV-to-columnar converter with categorical dtypes
+- Compact dtype plan (categoricals, float32 analytics scores, small ints) and
+  projection to the columns the engine reads
+- Stringified list columns (`Interests`, `Sites Visited`) parsed once
+- Parsed lists interned so identical rows share one tuple object
+- Streaming writer appending fixed-size chunks to CSV or Parquet
+  (through pyarrow when installed)
+- Row-wise concatenation of compacted datasets that keeps categoricals
+
+Dependencies: pandas, numpy (optional: pyarrow)
+
+Usage: python dataset_store.py <dataset.csv> [output.parquet|output.npz|output.columns]
+"""
+
+import ast
+import contextlib
+import json
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Columns stored in the CSV as stringified Python lists
+LIST_COLUMNS = ['Interests', 'Sites Visited']
+
+# Low-cardinality string columns stored as categoricals
+CATEGORY_COLUMNS = [
+    'city', 'country', 'Continent', 'state', 'region',
+    'budget_level', 'climate_classification', 'Best Season', 'Type',
+    'dataset_version', 'record_status', 'Age_Group'
+]
+
+# Explicit dtypes for the v2 dataset. Scores and ratings shown in analytics
+# fit in float32. avg_cost_usd stays float64 because it is summed into trip
+# totals, and so do the columns destinations are scored on (Avg Rating and
+# the experience scores): float32 copies would move final scores away from
+# the float64 values of the CSV.
+DTYPE_SCHEMA = {
+    **{column: 'category' for column in CATEGORY_COLUMNS},
+    'Age': 'int8',
+    'Tourist ID': 'int32',
+    'Accessibility': 'bool',
+    'UNESCO Site': 'bool',
+    'Tourist Rating': 'float32',
+    'Satisfaction': 'float32',
+    'Recommendation Accuracy': 'float32',
+    'overall_experience_score': 'float32',
+    'yearly_avg_temp': 'float32',
+}
+
+# Columns read by the engine, its analytics and the app; the rest of the
+# v2 dataset (bookkeeping and unused experience scores) is dropped on load
+ENGINE_COLUMNS = [
+    'record_id', 'dataset_version', 'record_status',
+    'Tourist ID', 'Age', 'Age_Group', 'Accessibility',
+    'Site Name', 'Sites Visited', 'Interests', 'Type',
+    'city', 'country', 'Continent', 'state', 'region',
+    'Best Season', 'UNESCO Site', 'avg_cost_usd', 'budget_level',
+    'Tourist Rating', 'Satisfaction', 'Avg Rating', 'Recommendation Accuracy',
+    'culture', 'adventure', 'nature', 'overall_experience_score',
+    'yearly_avg_temp', 'climate_classification'
+]
+
+# Memory-mapped directories come first: they are the cheapest to open
+COLUMNAR_EXTENSIONS = ['.columns', '.parquet', '.npz']
+
+MAPPED_MANIFEST = 'manifest.json'
+
+# Rows per chunk appended by the streaming writer
+STREAM_CHUNK_ROWS = 250_000
+
+
+# ============================================================================
+# COLUMNAR FORMAT
+# ============================================================================
+
+def columnar_path(csv_path: str) -> str:
+    """Default columnar file next to a CSV dataset"""
+    extension = '.parquet' if HAS_PYARROW else '.npz'
+    return os.path.splitext(csv_path)[0] + extension
+
+
+def find_columnar(csv_path: str) -> Optional[str]:
+    """Columnar copy of a CSV dataset that is at least as new as the CSV"""
+    stem = os.path.splitext(csv_path)[0]
+    for extension in COLUMNAR_EXTENSIONS:
+        path = stem + extension
+        if extension == '.parquet' and not HAS_PYARROW:
+            continue
+        # A mapped directory is complete once its manifest exists
+        marker = os.path.join(path, MAPPED_MANIFEST) if extension == '.columns' else path
+        if not os.path.exists(marker):
+            continue
+        if os.path.exists(csv_path) and os.path.getmtime(marker) < os.path.getmtime(csv_path):
+            continue
+        return path
+    return None
+
+
+def apply_dtype_schema(df: pd.DataFrame, schema: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Convert columns to the compact dtypes of the schema in place
+
+    Columns that already have their schema dtype are left untouched.
+    Integer and boolean conversions are skipped for columns with missing
+    values, which those dtypes cannot represent.
+    """
+    for column, dtype in (schema or DTYPE_SCHEMA).items():
+        if column not in df.columns or df[column].dtype == dtype:
+            continue
+        if dtype != 'category' and not dtype.startswith('float') and df[column].isna().any():
+            continue
+        df[column] = df[column].astype(dtype)
+    return df
+
+
+def compact_dataset(
+    df: pd.DataFrame,
+    columns: Optional[List[str]] = None,
+    schema: Optional[Dict[str, str]] = None
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Project a dataset to the engine's columns and apply the dtype schema
+
+    Args:
+        df: Loaded dataset
+        columns: Columns to keep (defaults to ENGINE_COLUMNS)
+        schema: Dtypes to apply (defaults to DTYPE_SCHEMA)
+
+    Returns:
+        Compacted dataset and a report with memory before and after (MB)
+        and the dropped columns
+    """
+    before = df.memory_usage(deep=True).sum() / 1024 / 1024
+
+    keep = [column for column in (columns or ENGINE_COLUMNS) if column in df.columns]
+    dropped = [column for column in df.columns if column not in keep]
+    # Kept columns are shared with the input, not copied, so memory-mapped
+    # columns that already have their schema dtype stay memory-mapped
+    df = apply_dtype_schema(pd.DataFrame({column: df[column] for column in keep}, copy=False), schema)
+
+    after = df.memory_usage(deep=True).sum() / 1024 / 1024
+    return df, {'memory_before_mb': before, 'memory_after_mb': after, 'dropped_columns': dropped}
+
+
+def concat_datasets(frames: Sequence[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate compacted datasets row-wise
+
+    Categorical columns of the first frame get the union of the categories
+    of all frames, with the existing codes kept (a plain pd.concat falls
+    back to object dtype when categories differ). Columns follow the first
+    frame; the result has a fresh RangeIndex.
+    """
+    columns = {}
+    for column in frames[0].columns:
+        parts = [frame[column] for frame in frames]
+        if not isinstance(parts[0].dtype, pd.CategoricalDtype):
+            columns[column] = pd.concat(parts, ignore_index=True)
+            continue
+
+        categories = parts[0].cat.categories
+        for part in parts[1:]:
+            part_categories = (part.cat.categories if isinstance(part.dtype, pd.CategoricalDtype)
+                               else pd.Index(part.dropna().unique()))
+            categories = categories.append(part_categories[~part_categories.isin(categories)])
+        # New categories are appended, so codes of the first frame stay valid
+        codes = [parts[0].cat.codes.to_numpy()] + [_category_codes(part, categories) for part in parts[1:]]
+        columns[column] = pd.Categorical.from_codes(
+            np.concatenate(codes), dtype=pd.CategoricalDtype(categories, ordered=parts[0].cat.ordered)
+        )
+    return pd.DataFrame(columns)
+
+
+def _category_codes(values: pd.Series, categories: pd.Index) -> np.ndarray:
+    """Codes of ``values`` in ``categories`` (-1 for missing values)"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Recode through the value's own categories (astype would treat
+        # unordered dtypes with the same categories as equal and keep codes)
+        mapping = np.append(categories.get_indexer(values.cat.categories), -1)
+        return mapping[values.cat.codes.to_numpy()]
+    return categories.get_indexer(values)
+
+
+def save_columnar(df: pd.DataFrame, output_path: str) -> str:
+    """
+    Save a dataset in columnar format
+
+    Args:
+        df: Dataset to save
+        output_path: Destination ending in .parquet, .npz or .columns
+
+    Returns:
+        Path to the saved file
+    """
+    df = apply_dtype_schema(df.copy())
+
+    if output_path.endswith('.parquet'):
+        df.to_parquet(output_path, index=False)
+        return output_path
+
+    if output_path.endswith('.columns'):
+        return save_mapped(df, output_path)
+
+    arrays = {'__columns__': np.array(df.columns, dtype=str)}
+    for i, column in enumerate(df.columns):
+        series = df[column]
+        key = f"c{i}"
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            arrays[f"{key}.codes"] = series.cat.codes.to_numpy()
+            arrays[f"{key}.categories"] = np.array(series.cat.categories, dtype=str)
+        elif series.dtype == object or pd.api.types.is_string_dtype(series.dtype):
+            arrays[f"{key}.nulls"] = series.isna().to_numpy()
+            arrays[f"{key}.strings"] = series.fillna('').astype(str).to_numpy(dtype=str)
+        else:
+            arrays[key] = series.to_numpy()
+    np.savez(output_path, **arrays)
+    return output_path
+
+
+def load_columnar(path: str) -> pd.DataFrame:
+    """Load a dataset saved by save_columnar"""
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+
+    if path.endswith('.columns'):
+        return load_mapped(path)
+
+    with np.load(path, allow_pickle=False) as data:
+        columns = {}
+        for i, column in enumerate(data['__columns__']):
+            key = f"c{i}"
+            if f"{key}.codes" in data:
+                columns[column] = pd.Categorical.from_codes(
+                    data[f"{key}.codes"], data[f"{key}.categories"]
+                )
+            elif f"{key}.strings" in data:
+                values = data[f"{key}.strings"].astype(object)
+                values[data[f"{key}.nulls"]] = None
+                columns[column] = values
+            else:
+                columns[column] = data[key]
+    return pd.DataFrame(columns)
+
+
+def _code_dtype(num_categories: int) -> np.dtype:
+    """Smallest signed integer type able to hold category codes"""
+    for dtype in (np.int8, np.int16, np.int32):
+        if num_categories < np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def _save_categories(categories: pd.Index, entry: Dict[str, Any], output_dir: str):
+    """
+    Store categories so load_mapped gets back the same values and type
+
+    Numeric, boolean and datetime categories go to their own .npy file;
+    string and mixed ones are listed in the manifest with their dtype.
+    """
+    if isinstance(categories.dtype, np.dtype) and categories.dtype.kind in 'biufmM':
+        entry['categories_file'] = os.path.splitext(entry['file'])[0] + '.categories.npy'
+        np.save(os.path.join(output_dir, entry['categories_file']), categories.to_numpy())
+    else:
+        entry['categories'] = [value.item() if isinstance(value, np.generic) else value for value in categories]
+        entry['categories_dtype'] = str(categories.dtype)
+
+
+def _load_categories(path: str, entry: Dict[str, Any]) -> pd.Index:
+    """Categories written by _save_categories"""
+    if 'categories_file' in entry:
+        return pd.Index(np.load(os.path.join(path, entry['categories_file'])))
+    return pd.Index(entry['categories'], dtype=entry.get('categories_dtype'))
+
+
+def _is_numeric(dtype) -> bool:
+    """Stored as raw values: numbers, booleans and numpy datetimes/durations"""
+    return (pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype)
+            or (isinstance(dtype, np.dtype) and dtype.kind in 'mM'))
+
+
+def save_mapped(df: pd.DataFrame, output_dir: str, exact_dtypes: bool = False) -> str:
+    """
+    Save a dataset as a directory of raw .npy column files
+
+    Numeric columns are stored as-is and string columns as category codes,
+    so load_mapped can memory-map them. Strings that are mostly unique
+    (e.g. record IDs) are stored as plain string arrays instead.
+    Categories keep their type (numbers stay numbers).
+
+    Args:
+        df: Dataset to save
+        output_dir: Destination directory (conventionally ending in .columns)
+        exact_dtypes: Record every column's dtype so load_mapped restores it
+            (object columns come back as object instead of category)
+
+    Returns:
+        Path to the directory
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = {'rows': len(df), 'columns': []}
+
+    for i, column in enumerate(df.columns):
+        series = df[column]
+        entry = {'name': column, 'file': f"{i}.npy"}
+        path = os.path.join(output_dir, entry['file'])
+        if exact_dtypes:
+            entry['dtype'] = str(series.dtype)
+
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes, categories = series.cat.codes.to_numpy(), series.cat.categories
+        elif _is_numeric(series.dtype):
+            codes, categories = None, None
+        else:
+            codes, categories = pd.factorize(series)
+            if len(categories) > len(series) // 2:
+                codes, categories = None, None
+
+        if codes is not None:
+            entry['kind'] = 'category'
+            entry['ordered'] = isinstance(series.dtype, pd.CategoricalDtype) and bool(series.cat.ordered)
+            _save_categories(pd.Index(categories), entry, output_dir)
+            np.save(path, codes.astype(_code_dtype(len(categories))))
+        elif _is_numeric(series.dtype) and isinstance(series.dtype, np.dtype):
+            entry['kind'] = 'numeric'
+            np.save(path, series.to_numpy())
+        elif _is_numeric(series.dtype):
+            # Nullable extension type (Int64, boolean, ...): values plus missing positions
+            entry['kind'] = 'numeric'
+            entry['dtype'] = str(series.dtype)
+            entry['nulls'] = series.isna().to_numpy().nonzero()[0].tolist()
+            np.save(path, series.to_numpy(dtype=series.dtype.numpy_dtype, na_value=0))
+        else:
+            entry['kind'] = 'string'
+            entry['nulls'] = series.isna().to_numpy().nonzero()[0].tolist()
+            np.save(path, series.fillna('').astype(str).to_numpy(dtype=str))
+
+        manifest['columns'].append(entry)
+
+    # Written last so a partially written directory is never loaded
+    with open(os.path.join(output_dir, MAPPED_MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    return output_dir
+
+
+def load_mapped(path: str) -> pd.DataFrame:
+    """
+    Open a directory written by save_mapped
+
+    Numeric columns and category codes are memory-mapped read-only, so every
+    process opening the same directory shares one page-cache copy. The
+    categoricals are built over the mapped codes without copying them.
+    Columns saved with exact_dtypes are cast back to their recorded dtype
+    where it differs (which copies them).
+    """
+    with open(os.path.join(path, MAPPED_MANIFEST), encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    columns = {}
+    for entry in manifest['columns']:
+        values = np.load(os.path.join(path, entry['file']), mmap_mode='r')
+        if entry['kind'] == 'category':
+            # Codes were checked when saved; validating would read every page
+            dtype = pd.CategoricalDtype(_load_categories(path, entry), ordered=entry.get('ordered', False))
+            columns[entry['name']] = pd.Categorical.from_codes(values, dtype=dtype, validate=False)
+        elif entry['kind'] == 'string':
+            strings = values.astype(object)
+            strings[entry['nulls']] = None
+            columns[entry['name']] = strings
+        elif 'nulls' in entry:
+            array = pd.array(np.asarray(values), dtype=entry['dtype'])
+            array[entry['nulls']] = pd.NA
+            columns[entry['name']] = array
+        else:
+            columns[entry['name']] = values
+
+    # copy=False keeps the memory-mapped arrays as the column buffers
+    df = pd.DataFrame(columns, copy=False)
+    for entry in manifest['columns']:
+        dtype = entry.get('dtype')
+        if dtype is not None and str(df[entry['name']].dtype) != dtype:
+            df[entry['name']] = df[entry['name']].astype(dtype)
+    return df
+
+
+def convert_csv_to_columnar(csv_path: str, output_path: Optional[str] = None) -> str:
+    """
+    Convert a CSV dataset to columnar format
+
+    Args:
+        csv_path: Source CSV dataset
+        output_path: Destination file (defaults to columnar_path(csv_path))
+
+    Returns:
+        Path to the columnar file
+    """
+    return save_columnar(pd.read_csv(csv_path), output_path or columnar_path(csv_path))
+
+
+def dataset_source(dataset_path: str, prefer_columnar: bool = True) -> str:
+    """File or .columns directory that load_dataset reads for a dataset path"""
+    if prefer_columnar and os.path.splitext(dataset_path)[1] not in COLUMNAR_EXTENSIONS:
+        return find_columnar(dataset_path) or dataset_path
+    return dataset_path
+
+
+def load_dataset(dataset_path: str, prefer_columnar: bool = True) -> pd.DataFrame:
+    """
+    Load the tourism dataset, preferring an up-to-date columnar copy
+
+    Args:
+        dataset_path: CSV dataset path (or a columnar file)
+        prefer_columnar: Use a .columns/.parquet/.npz copy next to the CSV if present
+
+    Returns:
+        Dataset DataFrame
+    """
+    path = dataset_source(dataset_path, prefer_columnar)
+    if os.path.splitext(path)[1] in COLUMNAR_EXTENSIONS:
+        return load_columnar(path)
+    return pd.read_csv(path)
+
+
+# ============================================================================
+# STREAMING WRITER
+# ============================================================================
+
+def rechunk(frames: Iterable[pd.DataFrame], chunk_rows: int) -> Iterator[pd.DataFrame]:
+    """
+    Regroup a stream of frames into chunks of exactly ``chunk_rows`` rows
+
+    Only the last chunk may be shorter. At most one chunk plus one input
+    frame is held at a time. A stream of only empty frames yields the
+    first of them, so writers still get the columns.
+    """
+    if chunk_rows <= 0:
+        raise ValueError(f"chunk_rows must be positive, got {chunk_rows}")
+
+    pending: List[pd.DataFrame] = []
+    pending_rows = 0
+    empty: Optional[pd.DataFrame] = None
+    has_rows = False
+    for frame in frames:
+        if not len(frame):
+            if empty is None:
+                empty = frame
+            continue
+        has_rows = True
+        pending.append(frame)
+        pending_rows += len(frame)
+        if pending_rows < chunk_rows:
+            continue
+        combined = pd.concat(pending) if len(pending) > 1 else pending[0]
+        start = 0
+        while len(combined) - start >= chunk_rows:
+            yield combined.iloc[start:start + chunk_rows]
+            start += chunk_rows
+        pending = [combined.iloc[start:]] if start < len(combined) else []
+        pending_rows = len(combined) - start
+    if pending_rows:
+        yield pd.concat(pending) if len(pending) > 1 else pending[0]
+    elif not has_rows and empty is not None:
+        yield empty
+
+
+class ChunkedDatasetWriter:
+    """
+    Appends DataFrame chunks to a CSV file or to Parquet row groups
+
+    CSV chunks are written with pyarrow.csv when pyarrow is installed
+    (several times faster than DataFrame.to_csv; strings are quoted and
+    booleans written as true/false, which pandas reads back the same).
+    Data is written to a temporary file that replaces ``output_path`` on
+    close, so readers never see a partially written dataset.
+    """
+
+    def __init__(self, output_path: str):
+        """
+        Args:
+            output_path: Destination ending in .csv or .parquet
+        """
+        if not output_path.endswith(('.csv', '.parquet')):
+            raise ValueError(f"Streaming output must be .csv or .parquet, got {output_path}")
+        if output_path.endswith('.parquet') and not HAS_PYARROW:
+            raise ImportError("Writing Parquet requires pyarrow (pip install pyarrow)")
+
+        self.output_path = output_path
+        self.rows = 0
+        self.chunks = 0
+        self._tmp_path = output_path + '.tmp'
+        self._parquet_writer = None
+        self._schema = None
+
+    def write(self, chunk: pd.DataFrame):
+        """Append one chunk"""
+        if self.output_path.endswith('.csv'):
+            self._write_csv(chunk)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            chunk = apply_dtype_schema(chunk.copy())
+            table = pa.Table.from_pandas(chunk, schema=self._schema, preserve_index=False)
+            if self._parquet_writer is None:
+                self._schema = table.schema
+                self._parquet_writer = pq.ParquetWriter(self._tmp_path, self._schema)
+            self._parquet_writer.write_table(table)
+
+        self.rows += len(chunk)
+        self.chunks += 1
+
+    def _write_csv(self, chunk: pd.DataFrame):
+        """Append one chunk to the CSV file (with the header if it is the first)"""
+        if HAS_PYARROW:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+
+            try:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Mixed-type object columns: leave the formatting to pandas
+                table = None
+            if table is not None:
+                options = pa_csv.WriteOptions(include_header=not self.chunks, quoting_style='needed')
+                with open(self._tmp_path, 'ab' if self.chunks else 'wb') as f:
+                    pa_csv.write_csv(table, f, write_options=options)
+                return
+        chunk.to_csv(self._tmp_path, mode='a' if self.chunks else 'w', header=not self.chunks, index=False)
+
+    def close(self):
+        """Finish the file and move it into place"""
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+        if os.path.exists(self._tmp_path):
+            os.replace(self._tmp_path, self.output_path)
+
+    def __enter__(self) -> 'ChunkedDatasetWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+            return
+        # Leave no partial output behind
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+
+def write_dataset_stream(
+    frames: Iterable[pd.DataFrame],
+    output_path: Union[str, Sequence[str]],
+    chunk_rows: int = STREAM_CHUNK_ROWS,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """
+    Write a stream of frames to CSV or Parquet in fixed-size chunks
+
+    Memory use is bounded by the chunk size (one chunk plus one input
+    frame are held at a time), not by the output size.
+
+    Args:
+        frames: Dataset frames (e.g. dataset_generator.iter_expanded_dataset)
+        output_path: Destination ending in .csv or .parquet, or several
+            destinations written from the same chunks (e.g. CSV + Parquet)
+        chunk_rows: Rows per CSV append / Parquet row group
+        progress: Called after every chunk with chunk, rows, seconds and
+            rows_per_second (see print_progress)
+
+    Returns:
+        Path, total rows, chunks, seconds and rows per second
+    """
+    paths = [output_path] if isinstance(output_path, str) else list(output_path)
+    start = time.perf_counter()
+    with contextlib.ExitStack() as stack:
+        writers = [stack.enter_context(ChunkedDatasetWriter(path)) for path in paths]
+        writer = writers[0]
+        for chunk in rechunk(frames, chunk_rows):
+            chunk_start = time.perf_counter()
+            for each in writers:
+                each.write(chunk)
+            if progress is not None:
+                now = time.perf_counter()
+                progress({
+                    'chunk': writer.chunks,
+                    'rows': writer.rows,
+                    'chunk_seconds': now - chunk_start,
+                    'seconds': now - start,
+                    'rows_per_second': writer.rows / (now - start),
+                })
+
+    seconds = time.perf_counter() - start
+    return {
+        'path': output_path,
+        'rows': writer.rows,
+        'chunks': writer.chunks,
+        'seconds': seconds,
+        'rows_per_second': writer.rows / seconds if seconds else 0.0,
+    }
+
+
+def print_progress(stats: Dict[str, Any]):
+    """Progress callback for write_dataset_stream printing one line per chunk"""
+    print(f"  Chunk {stats['chunk']:>4}: {stats['rows']:>12,} rows, "
+          f"{stats['seconds']:7.1f} s, {stats['rows_per_second']:>10,.0f} rows/s")
+
+
+# ============================================================================
+# LIST COLUMNS
+# ============================================================================
+
+def parse_list_value(value: Any) -> Optional[Tuple[str, ...]]:
+    """
+    Parse one list cell into a tuple of interned strings
+
+    Args:
+        value: List, tuple or stringified list such as "['Art', 'History']"
+
+    Returns:
+        Tuple of strings, or None if the value is not a list
+    """
+    if isinstance(value, str):
+        try:
+            value = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return None
+    if not isinstance(value, (list, tuple)):
+        return None
+    return tuple(sys.intern(str(item)) for item in value)
+
+
+def parse_list_column(column: pd.Series) -> pd.Series:
+    """Parse a list column, evaluating each distinct raw value only once"""
+    parsed: Dict[Any, Optional[Tuple[str, ...]]] = {}
+    values = []
+    for value in column:
+        key = tuple(value) if isinstance(value, list) else value
+        if key not in parsed:
+            parsed[key] = parse_list_value(value)
+        values.append(parsed[key])
+    return pd.Series(values, index=column.index, name=column.name, dtype=object)
+
+
+def parse_list_columns(
+    df: pd.DataFrame,
+    columns: Optional[List[str]] = None
+) -> Dict[str, float]:
+    """
+    Parse stringified list columns in place
+
+    Args:
+        df: Dataset to normalize
+        columns: Columns to parse (defaults to LIST_COLUMNS)
+
+    Returns:
+        Parsing time in milliseconds per column
+    """
+    timings = {}
+    for column in columns or LIST_COLUMNS:
+        if column not in df.columns:
+            continue
+        start = time.perf_counter()
+        df[column] = parse_list_column(df[column])
+        timings[f"parse {column}"] = (time.perf_counter() - start) * 1000
+    return timings
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python dataset_store.py <dataset.csv> [output.parquet|output.npz|output.columns]")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    path = convert_csv_to_columnar(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
+    print(f"✓ Columnar dataset saved: {path} ({time.perf_counter() - start:.2f}s)")
@@ -0,0 +1,307 @@
+"""
+Engine Result Caching
+=====================
+
+Caches for TourismBackendEngine results:
+- Per-dataset-version memoization for whole-dataset computations
+  (e.g. get_analytics), invalidated when the dataset changes
+- Bounded LRU/TTL cache for per-profile results (generate_itinerary,
+  get_recommendations) keyed on the profile fields each method uses
+- Cached results frozen once, so hits are served without copying them
+- Hit/miss/eviction counters to confirm caches are effective under load
+
+Dependencies: none (standard library only)
+"""
+
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# Defaults for the per-profile result cache
+RESULT_CACHE_SIZE = 256
+RESULT_CACHE_TTL_SECONDS = 3600
+
+
+@dataclass
+class CacheStats:
+    """Cache effectiveness counters"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served from the cache (0-1)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Counters plus hit rate"""
+        return {**asdict(self), 'hit_rate': self.hit_rate}
+
+
+class VersionedValue:
+    """A single value recomputed only when its version token changes"""
+
+    def __init__(self):
+        self.version: Optional[Hashable] = None
+        self.value: Any = None
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, version: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for ``version``, computing it on a miss
+
+        The lock ensures concurrent sessions compute a new version once.
+        """
+        with self._lock:
+            if self.version is not None and self.version == version:
+                self.stats.hits += 1
+                return self.value
+
+            self.stats.misses += 1
+            self.value = compute()
+            self.version = version
+            return self.value
+
+    def put(self, version: Hashable, value: Any):
+        """Store a value computed elsewhere (e.g. restored from disk) for ``version``"""
+        with self._lock:
+            self.version = version
+            self.value = value
+
+    def invalidate(self):
+        """Force recomputation on the next lookup"""
+        with self._lock:
+            self.version = None
+            self.value = None
+
+
+def memoize_per_dataset_version(method: Callable) -> Callable:
+    """
+    Cache a no-argument engine method until its dataset version changes
+
+    The engine must provide ``dataset_version()`` and create a
+    VersionedValue in the wrapper's ``cache_attr`` attribute when it is
+    constructed. The returned value is shared between callers and must be
+    treated as read-only.
+    """
+    attr = f"_{method.__name__}_cache"
+
+    @functools.wraps(method)
+    def wrapper(self):
+        return getattr(self, attr).get(self.dataset_version(), lambda: method(self))
+
+    wrapper.cache_attr = attr
+    return wrapper
+
+
+class LRUCache:
+    """Thread-safe bounded cache with least-recently-used eviction and TTL"""
+
+    _MISSING = object()
+
+    def __init__(self, maxsize: int = RESULT_CACHE_SIZE, ttl: Optional[float] = RESULT_CACHE_TTL_SECONDS):
+        """
+        Args:
+            maxsize: Maximum number of entries (0 disables caching)
+            ttl: Seconds an entry stays valid (None for no expiry)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Cached value for ``key``, or ``default`` (counted as a miss)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                self.stats.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.stats.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any):
+        """Store ``value``, evicting the least recently used entries if full"""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Cached value for ``key``, computing and storing it on a miss"""
+        value = self.get(key, self._MISSING)
+        if value is self._MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+
+def profile_cache_key(profile: Any) -> Tuple:
+    """
+    Canonical key of a TouristProfile for itinerary caching
+
+    Every field generate_itinerary reads is included (age reaches the
+    packing tips); interests are compared as a sorted tuple so their
+    order does not matter.
+    """
+    return (
+        int(profile.age),
+        tuple(sorted(profile.interests)),
+        bool(profile.accessibility_needs),
+        int(profile.preferred_duration),
+        profile.budget_preference,
+        profile.climate_preference,
+        profile.season_preference,
+    )
+
+
+def recommendation_cache_key(profile: Any) -> Tuple:
+    """
+    Canonical key of a TouristProfile for recommendation caching
+
+    get_recommendations only reads the preference filters and the
+    interests, so profiles differing in age, accessibility needs or trip
+    length share an entry.
+    """
+    return (
+        tuple(sorted(profile.interests)),
+        profile.budget_preference,
+        profile.climate_preference,
+        profile.season_preference,
+    )
+
+
+def _normalize_argument(value: Any) -> Hashable:
+    """Hashable cache-key form of a method argument"""
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (list, set)):
+        return tuple(sorted(value))
+    if isinstance(value, dict):
+        return tuple(sorted(value.items()))
+    return value
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} of a cached result is read-only")
+
+
+class FrozenDict(dict):
+    """Read-only dict of a cached result (still a dict for json, ==, isinstance)"""
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only list of a cached result"""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def freeze_result(value: Any) -> Any:
+    """Read-only version of a result built from dicts and lists (frozen values are returned as they are)"""
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze_result(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList(freeze_result(item) for item in value)
+    return value
+
+
+def with_caller_profile(result: Any, profile: Any) -> Any:
+    """
+    Frozen result echoing the caller's interests
+
+    The result is frozen once (see freeze_result) and then shared by all
+    callers: only the echoed `tourist_profile` is rebuilt per caller, so
+    a cache hit does not copy the itinerary.
+    """
+    result = freeze_result(result)
+    echoed = result.get('tourist_profile') if isinstance(result, dict) else None
+    if isinstance(echoed, dict) and 'interests' in echoed:
+        echoed = FrozenDict({**echoed, 'interests': FrozenList(profile.interests)})
+        result = FrozenDict({**result, 'tourist_profile': echoed})
+    return result
+
+
+def cache_by_profile(
+    method: Callable,
+    profile_key: Callable[[Any], Tuple] = profile_cache_key
+) -> Callable:
+    """
+    Serve a per-profile engine method from the engine's LRU result cache
+
+    The key combines the method name, the dataset version, the profile
+    key (only the fields the method reads, e.g. recommendation_cache_key)
+    and the remaining arguments (datetimes are reduced to their date; an
+    omitted start date means today). Pass ``use_cache=False`` to bypass
+    the cache for one call; the engine's ``result_cache_enabled`` flag
+    bypasses it entirely. Cached results are read-only (see
+    with_caller_profile).
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, use_cache: bool = True, **kwargs):
+        cache = self.get_result_cache()
+        if not use_cache or not getattr(self, 'result_cache_enabled', True) or cache.maxsize <= 0:
+            return method(self, *args, **kwargs)
+
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        del arguments['self']
+        profile = arguments.pop('tourist_profile')
+        if 'start_date' in arguments and arguments['start_date'] is None:
+            arguments['start_date'] = date.today()
+
+        key = (
+            method.__name__,
+            self.dataset_version(),
+            profile_key(profile),
+            tuple((name, _normalize_argument(value)) for name, value in sorted(arguments.items())),
+        )
+        result = cache.get_or_compute(key, lambda: freeze_result(method(self, *args, **kwargs)))
+        return with_caller_profile(result, profile)
+
+    return wrapper
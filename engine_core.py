@@ -0,0 +1,690 @@
+"""
+Engine Core
+===========
+
+Dataset lifecycle and ranking shared by TourismBackendEngine:
+- Loading (columnar copy, compact dtypes, engine state cache) and
+  preparing the dataset once before serving requests
+- Appending record batches with snapshot swaps; requests pin the
+  dataset version they started on
+- Preference filtering, vectorized scoring and top-k ranking of sites
+  and cities, for one profile, a batch or a process pool
+- Result cache and instrumentation settings
+
+TourismBackendEngine adds itinerary building and analytics on top.
+
+Dependencies: numpy, pandas
+"""
+
+import contextlib
+import threading
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from dataset_store import compact_dataset, load_dataset
+from engine_cache import (
+    LRUCache, VersionedValue, cache_by_profile, freeze_result, memoize_per_dataset_version,
+    profile_cache_key, recommendation_cache_key, with_caller_profile
+)
+from engine_index import FILTER_COLUMNS, CitySummary, DatasetSnapshot, FilterIndex, pin_snapshot
+from engine_parallel import DEFAULT_CHUNK_SIZE, SharedScoringArrays, score_profiles_parallel
+from engine_state_cache import CachedState, EngineStateCache
+from instrumentation import (
+    STAGE_APPEND, STAGE_FILTER, STAGE_LOAD, STAGE_PREPARE, STAGE_SCORE, STAGE_SELECT,
+    Instrumentation, get_instrumentation, timed_stage
+)
+from engine_scoring import (
+    SCORING_COLUMNS, InterestEncoder, best_in_groups, compute_destination_scores,
+    compute_destination_scores_batch, group_means, top_k_indices
+)
+
+# Site columns shown with recommendations, besides the scoring columns
+RECOMMENDATION_COLUMNS = ['Site Name', 'city', 'country', 'UNESCO Site', 'avg_cost_usd']
+
+
+@dataclass
+class TouristProfile:
+    """Tourist profile data model"""
+    age: int
+    interests: List[str]
+    accessibility_needs: bool
+    preferred_duration: int
+    budget_preference: str  # 'Budget', 'Mid-range', 'Luxury'
+    climate_preference: Optional[str] = None  # 'Cold', 'Temperate', 'Warm'
+    season_preference: Optional[str] = None  # 'Spring', 'Summer', 'Autumn', 'Winter'
+    
+    def __post_init__(self):
+        """Validate tourist profile"""
+        if self.age < 18 or self.age > 100:
+            raise ValueError(f"Age must be between 18 and 100, got {self.age}")
+        if self.preferred_duration < 1:
+            raise ValueError(f"Duration must be at least 1 day, got {self.preferred_duration}")
+
+
+class EngineCore:
+    """
+    Loaded dataset with its indexes, and the ranking built on them
+    
+    Subclasses provide generate_itinerary (used by
+    generate_itineraries_batch) and may extend get_analytics.
+    """
+    
+    def __init__(self, dataset_path: str):
+        """
+        Load the dataset; prepare() indexes it before the first request
+        
+        Args:
+            dataset_path: CSV dataset (or a columnar copy, see dataset_store)
+        """
+        self._init_runtime_state()
+        self.df = self._load_dataset(dataset_path)
+    
+    def _init_runtime_state(self):
+        """Locks, per-thread state and caches every engine starts with"""
+        # Serializes preparing and appending (readers never wait on it)
+        self._dataset_lock = threading.RLock()
+        # Per-thread pinned dataset version (see snapshot) and state of
+        # generate_itineraries_batch
+        self._snapshot_state = threading.local()
+        self._batch_state = threading.local()
+        
+        self._snapshot: Optional[DatasetSnapshot] = None
+        self._unprepared_df: Optional[pd.DataFrame] = None
+        self._cached_state: Optional[CachedState] = None
+        self._pending_state_cache: Optional[Tuple[EngineStateCache, pd.DataFrame]] = None
+        self._instrumentation: Optional[Instrumentation] = None
+        self.data_revision = 0
+        self.load_timings: Optional[Dict[str, float]] = None
+        self.memory_report: Dict[str, Any] = {}
+        setattr(self, self.get_analytics.cache_attr, VersionedValue())
+        self.result_cache = LRUCache()
+        self.result_cache_enabled = True
+    
+    def get_recommendations(
+        self,
+        tourist_profile: TouristProfile,
+        num_recommendations: int = 5,
+        recommendation_type: str = 'all'
+    ) -> Dict[str, Any]:
+        """
+        Best-matching sites and/or cities for a tourist profile
+        
+        Only the scoring and display columns of the matching rows are
+        copied, and the best sites are picked with a top-k selection
+        instead of sorting every scored row. Cities are ranked from the
+        precomputed city summary.
+        
+        Args:
+            tourist_profile: Tourist profile
+            num_recommendations: Number of recommendations
+            recommendation_type: 'sites', 'cities' or 'all' (both, merged
+                by score)
+            
+        Returns:
+            Dictionary with status, count and the recommendations, best first
+        """
+        k = num_recommendations
+        recommendations = []
+        
+        if recommendation_type in ('all', 'sites'):
+            filtered = self._filter_by_preferences(tourist_profile, SCORING_COLUMNS + RECOMMENDATION_COLUMNS)
+            scored = self._score_destinations(filtered, tourist_profile)
+            top = self._rank_destinations(scored, k, distinct='Site Name')
+            for row in top.to_dict('records'):
+                recommendations.append({
+                    'type': 'site',
+                    'name': row['Site Name'],
+                    'city': row['city'],
+                    'country': row['country'],
+                    'unesco_site': bool(row['UNESCO Site']),
+                    'score': float(row['final_score']),
+                    'cost_usd': float(row['avg_cost_usd']),
+                    'reason': f"{row['interest_score']:.0f}% interest match, rated {row['Avg Rating']:.1f}/5",
+                })
+        
+        if recommendation_type in ('all', 'cities'):
+            # City means come from the city summary, without scoring site rows
+            table = self.city_summary.table
+            for city in self._rank_cities(tourist_profile, k).itertuples(index=False):
+                recommendations.append({
+                    'type': 'city',
+                    'name': city.city,
+                    'country': table.at[city.city, 'country'] if 'country' in table.columns else None,
+                    'score': float(city.final_score),
+                    'avg_cost_usd': float(table.at[city.city, 'avg_cost_usd']),
+                    'reason': f"{city.site_count} matching site visits",
+                })
+        
+        # Stable sort keeps sites ahead of cities with the same score
+        recommendations = sorted(recommendations, key=lambda rec: -rec['score'])[:k]
+        return {
+            'status': 'success',
+            'count': len(recommendations),
+            'recommendation_type': recommendation_type,
+            'recommendations': recommendations,
+        }
+    
+    def generate_itineraries_batch(
+        self,
+        profiles: List[TouristProfile],
+        start_date: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate itineraries for many tourist profiles at once
+        
+        Profiles are grouped by budget/climate/season: each group is
+        filtered once and scored for all of its distinct interest sets in
+        one vectorized pass. Profiles with the same cache key are built
+        once.
+        
+        Args:
+            profiles: Tourist profiles
+            start_date: Trip start date shared by all itineraries
+            
+        Returns:
+            One itinerary dictionary per profile, in input order, with the
+            same structure as generate_itinerary (read-only, like cached
+            results; profiles with the same cache key share one)
+        """
+        self.prepare()
+        
+        unique: Dict[tuple, TouristProfile] = {}
+        groups: Dict[tuple, Dict[tuple, None]] = {}
+        for profile in profiles:
+            unique.setdefault(profile_cache_key(profile), profile)
+            criteria_key = tuple(sorted(self._filter_criteria(profile).items()))
+            groups.setdefault(criteria_key, {})[tuple(sorted(profile.interests))] = None
+        
+        batch = self._batch_state
+        batch.filtered, batch.scored = {}, {}
+        df = self._current_snapshot().df
+        for criteria_key, interest_sets in groups.items():
+            filtered = df.iloc[self.filter_index.select(dict(criteria_key))]
+            interest_sets = list(interest_sets)
+            scores = compute_destination_scores_batch(
+                filtered,
+                self._get_interest_masks(filtered),
+                [self.interest_encoder.encode(interests) for interests in interest_sets],
+                [len(interests) for interests in interest_sets]
+            )
+            batch.filtered[criteria_key] = filtered
+            for j, interests in enumerate(interest_sets):
+                scored = filtered.copy(deep=False)
+                for column, values in scores.items():
+                    scored[column] = values[:, j] if values.ndim == 2 else values
+                batch.scored[(criteria_key, interests)] = scored
+        
+        batch.active = True
+        try:
+            results = {
+                key: freeze_result(self.generate_itinerary(profile, start_date, use_cache=False))
+                for key, profile in unique.items()
+            }
+        finally:
+            batch.active = False
+            batch.filtered, batch.scored = {}, {}
+        
+        return [
+            with_caller_profile(results[profile_cache_key(profile)], profile)
+            for profile in profiles
+        ]
+    
+    def score_profiles_parallel(
+        self,
+        profiles: List[TouristProfile],
+        k: int = 10,
+        workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> List[pd.DataFrame]:
+        """
+        Score many tourist profiles across a process pool
+        
+        Scoring arrays are exported once to memory-mapped files that every
+        worker maps read-only, so the dataset is never pickled. Each result
+        matches ranking the output of _score_destinations for the profile.
+        For full itineraries across processes see
+        engine_parallel.generate_itineraries_parallel.
+        
+        Args:
+            profiles: Tourist profiles
+            k: Top destinations per profile
+            workers: Worker processes (defaults to the CPU count)
+            chunk_size: Profiles per task sent to a worker
+        
+        Returns:
+            One frame of the top-k sites per profile, best first, with a
+            final_score column
+        """
+        self.prepare()
+        tasks = [
+            (self._filter_criteria(profile), self.interest_encoder.encode(profile.interests), len(profile.interests))
+            for profile in profiles
+        ]
+        df = self._current_snapshot().df
+        with SharedScoringArrays(df, self._get_interest_masks(df), FILTER_COLUMNS) as shared:
+            ranked = score_profiles_parallel(shared, tasks, k, workers, chunk_size)
+        
+        results = []
+        for positions, scores in ranked:
+            top = df.iloc[positions].copy(deep=False)
+            top['final_score'] = scores
+            results.append(top)
+        return results
+    
+    def _active_batch(self) -> Optional[threading.local]:
+        """Batch state if this thread is inside generate_itineraries_batch"""
+        batch = self._batch_state
+        return batch if getattr(batch, 'active', False) else None
+    
+    def _filter_by_preferences(
+        self,
+        profile: TouristProfile,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Filter destinations by tourist preferences
+        
+        Args:
+            profile: Tourist profile
+            columns: Only copy these columns of the matching rows (e.g.
+                SCORING_COLUMNS plus the columns shown to the user);
+                all columns when omitted
+        """
+        batch = self._active_batch()
+        if batch is not None and columns is None:
+            criteria_key = tuple(sorted(self._filter_criteria(profile).items()))
+            if criteria_key in batch.filtered:
+                return batch.filtered[criteria_key]
+        
+        positions = self._filter_positions(profile)
+        df = self._current_snapshot().df
+        if columns is None:
+            return df.iloc[positions]
+        return df.iloc[positions, df.columns.get_indexer([c for c in columns if c in df.columns])]
+    
+    def _filter_positions(self, profile: TouristProfile) -> np.ndarray:
+        """Row positions matching the tourist's budget, climate and season"""
+        self.prepare()
+        return self.filter_index.select(self._filter_criteria(profile))
+    
+    def _filter_criteria(self, profile: TouristProfile) -> Dict[str, str]:
+        """Required value per filter column for a tourist profile"""
+        criteria = {
+            'budget_level': profile.budget_preference,
+            'climate_classification': profile.climate_preference,
+            'Best Season': profile.season_preference,
+        }
+        
+        # Filter by accessibility if needed
+        # Note: This would require accessibility data in the dataset
+        
+        return {column: value for column, value in criteria.items() if value}
+    
+    def _score_destinations(
+        self, 
+        df: pd.DataFrame, 
+        profile: TouristProfile
+    ) -> pd.DataFrame:
+        """
+        Score destinations based on tourist interests
+        
+        Uses a weighted scoring system:
+        - Interest match: 40%
+        - Rating: 30%
+        - Experience scores: 30%
+        """
+        batch = self._active_batch()
+        if batch is not None:
+            criteria_key = tuple(sorted(self._filter_criteria(profile).items()))
+            if df is batch.filtered.get(criteria_key):
+                # Shallow copy: callers may add columns without affecting
+                # the other profiles of the batch
+                return batch.scored[(criteria_key, tuple(sorted(profile.interests)))].copy(deep=False)
+        
+        # Shallow copy: score columns are added without copying the data
+        df = df.copy(deep=False)
+        
+        # Interest match (0-100), rating and experience scores computed
+        # over all rows at once from the pre-encoded interest masks
+        interest_masks = self._get_interest_masks(df)
+        scores = compute_destination_scores(
+            df,
+            interest_masks,
+            self.interest_encoder.encode(profile.interests),
+            len(profile.interests)
+        )
+        for column, values in scores.items():
+            df[column] = values
+        
+        return df
+    
+    def _load_dataset(self, dataset_path: str) -> pd.DataFrame:
+        """
+        Load the dataset, preferring a columnar copy next to the CSV
+        
+        A .columns directory, .parquet or .npz file written by the
+        enhancement script or `python dataset_store.py <csv>` is used when
+        it is at least as new as the CSV; otherwise the CSV is parsed.
+        A .columns directory is memory-mapped read-only, so all worker
+        processes serving the same dataset share one page-cache copy.
+        
+        Columns the engine never reads are dropped and the rest converted
+        to compact dtypes (see dataset_store.DTYPE_SCHEMA).
+        
+        When the dataset's fingerprint matches an entry of the engine state
+        cache (see engine_state_cache), the prepared rows, indexes and
+        analytics are restored from it instead and prepare() has nothing
+        left to do. Otherwise prepare() stores them for the next start.
+        """
+        with self.instrumentation.stage(STAGE_LOAD) as event:
+            state_cache = EngineStateCache.for_dataset(dataset_path)
+            cached = state_cache.load() if state_cache is not None else None
+            if cached is not None:
+                df, report = cached.snapshot.df, cached.memory_report
+                self._cached_state = cached
+            else:
+                df, report = compact_dataset(load_dataset(dataset_path))
+                if state_cache is not None:
+                    self._pending_state_cache = (state_cache, df)
+            self.memory_report = report
+            event.update(records=len(df), state_cache_hit=cached is not None, **report)
+        return df
+    
+    def _rank_destinations(
+        self,
+        scored: pd.DataFrame,
+        k: int,
+        recommendation_type: str = 'sites',
+        distinct: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Top-k scored destinations without sorting the whole frame
+        
+        Args:
+            scored: Output of _score_destinations
+            k: Number of results
+            recommendation_type: 'sites' ranks rows; 'cities' ranks cities
+                by their mean final score
+            distinct: ('sites' only) keep just the best row per value of
+                this column, e.g. 'Site Name'
+        
+        Returns:
+            Best-first rows ('sites') or a city/final_score/site_count
+            frame ('cities'); ties are ordered by position or city name
+        """
+        scores = scored['final_score'].to_numpy()
+        
+        if recommendation_type == 'cities':
+            codes, cities = pd.factorize(scored['city'], sort=True)
+            means = group_means(codes, scores, len(cities))
+            top = top_k_indices(means, k)
+            return pd.DataFrame({
+                'city': np.asarray(cities)[top],
+                'final_score': means[top],
+                'site_count': np.bincount(codes, minlength=len(cities))[top],
+            })
+        
+        if distinct is not None:
+            # Same rows as a stable sort followed by drop_duplicates(distinct)
+            rows = best_in_groups(pd.factorize(scored[distinct], use_na_sentinel=False)[0], scores)
+            return scored.iloc[rows[top_k_indices(scores[rows], k)]]
+        
+        return scored.iloc[top_k_indices(scores, k)]
+    
+    def _rank_cities(self, profile: TouristProfile, k: int) -> pd.DataFrame:
+        """
+        Top-k cities for a profile, read from the precomputed city summary
+        
+        Same result as ranking _score_destinations output with
+        recommendation_type='cities', without touching the site rows.
+        """
+        self.prepare()
+        encoder = self.interest_encoder
+        profile_bits = sorted({encoder.bits[i] for i in profile.interests if i in encoder.bits})
+        return self.city_summary.rank_cities(
+            self._filter_criteria(profile),
+            profile_bits,
+            len(profile.interests),
+            k
+        )
+    
+    def prepare(self) -> Dict[str, float]:
+        """
+        Normalize the loaded dataset once, before serving requests
+        
+        Parses the `Interests` and `Sites Visited` list columns and encodes
+        interests as bitmasks, so request handling never re-parses them.
+        Calling it again is a no-op.
+        
+        Returns:
+            Preparation time in milliseconds per stage
+        """
+        if self._snapshot is not None:
+            return self.load_timings
+        
+        with self._dataset_lock:
+            if self._snapshot is None:
+                with self.instrumentation.stage(STAGE_PREPARE) as event:
+                    snapshot = DatasetSnapshot.build(self._unprepared_df)
+                    event['timings'] = snapshot.timings
+                self.load_timings = snapshot.timings
+                self._snapshot = snapshot
+                self._unprepared_df = None
+                self._save_state(snapshot)
+        return self.load_timings
+    
+    def _save_state(self, snapshot: DatasetSnapshot):
+        """Store freshly prepared state (with analytics) in the state cache"""
+        pending, self._pending_state_cache = self._pending_state_cache, None
+        state_cache, loaded_df = pending or (None, None)
+        if state_cache is None or snapshot.df is not loaded_df:
+            return
+        state_cache.save(snapshot, self.get_analytics(), self.memory_report)
+    
+    def _restore_state(self, cached: CachedState):
+        """Publish state restored from the state cache as the current version"""
+        self._snapshot = cached.snapshot
+        self._unprepared_df = None
+        self.load_timings = {'load state cache': cached.load_ms}
+        if cached.analytics is not None:
+            getattr(self, self.get_analytics.cache_attr).put(self.dataset_version(), cached.analytics)
+    
+    def append_records(self, records: Union[pd.DataFrame, str]) -> Dict[str, Any]:
+        """
+        Append a batch of records and swap in the new dataset version
+        
+        Only the new records are compacted, parsed, encoded and indexed:
+        the filter bitmaps and city sums of the current version are
+        extended, not rebuilt. The new version is published with a single
+        assignment; requests already running finish on the version they
+        started with (see snapshot), later requests see the new records.
+        Cached results and analytics are invalidated by the version bump.
+        
+        Args:
+            records: New records (DataFrame, or path to a CSV or columnar file)
+        
+        Returns:
+            Number of appended and total records, and timings in
+            milliseconds per stage
+        """
+        if isinstance(records, str):
+            records = load_dataset(records)
+        
+        self.prepare()
+        with self._dataset_lock:
+            current = self._snapshot
+            if len(records):
+                with self.instrumentation.stage(STAGE_APPEND, records=len(records)) as event:
+                    snapshot = current.append(records)
+                    event.update(total_records=len(snapshot.df), timings=snapshot.timings)
+                self._snapshot = snapshot
+                self.data_revision += 1
+            else:
+                snapshot = current
+        
+        return {
+            'appended': len(records),
+            'records': len(snapshot.df),
+            'timings': snapshot.timings if snapshot is not current else {},
+        }
+    
+    @contextlib.contextmanager
+    def snapshot(self) -> Iterator[DatasetSnapshot]:
+        """
+        Pin the current dataset version for the calling thread
+        
+        Inside the block, `df`, `interest_encoder`, `filter_index` and
+        `city_summary` all come from the pinned version, even if
+        append_records swaps in a newer one meanwhile. Nested blocks reuse
+        the outer pin. Public request methods pin automatically.
+        """
+        local = self._snapshot_state
+        pinned = getattr(local, 'snapshot', None)
+        if pinned is not None:
+            yield pinned
+            return
+        
+        self.prepare()
+        local.snapshot = self._snapshot
+        try:
+            yield local.snapshot
+        finally:
+            local.snapshot = None
+    
+    def _current_snapshot(self) -> DatasetSnapshot:
+        """Dataset version read by this thread: its pinned one, else the latest"""
+        snapshot = getattr(self._snapshot_state, 'snapshot', None)
+        if snapshot is None:
+            self.prepare()
+            snapshot = self._snapshot
+        return snapshot
+    
+    @property
+    def df(self) -> pd.DataFrame:
+        """Dataset rows (of the pinned version inside a request)"""
+        if self._snapshot is None:
+            return self._unprepared_df
+        return self._current_snapshot().df
+    
+    @df.setter
+    def df(self, df: pd.DataFrame):
+        """Replace the whole dataset; prepare() rebuilds its indexes"""
+        with self._dataset_lock:
+            self._unprepared_df = df
+            self._snapshot = None
+            self.load_timings = None
+            self.data_revision += 1
+            
+            # Rows just restored by _load_dataset come with their indexes
+            cached, self._cached_state = self._cached_state, None
+            if cached is not None and cached.snapshot.df is df:
+                self._restore_state(cached)
+    
+    @property
+    def interest_encoder(self) -> InterestEncoder:
+        """Interest bit assignment of the dataset version"""
+        return self._current_snapshot().interest_encoder
+    
+    @property
+    def filter_index(self) -> FilterIndex:
+        """Filter bitmaps of the dataset version"""
+        return self._current_snapshot().filter_index
+    
+    @property
+    def city_summary(self) -> CitySummary:
+        """City aggregates of the dataset version"""
+        return self._current_snapshot().city_summary
+    
+    def _get_interest_masks(self, df: pd.DataFrame) -> np.ndarray:
+        """Interest bitmasks aligned with the rows of ``df``"""
+        self.prepare()
+        if 'interest_mask' in df.columns:
+            return df['interest_mask'].to_numpy()
+        return self.interest_encoder.encode_column(df['Interests'])
+    
+    def dataset_version(self) -> Tuple[int, int, int]:
+        """
+        Token that changes whenever the engine's dataset changes
+        
+        Replacing `self.df` and append_records increment `data_revision`;
+        other code that modifies the dataset must do the same so cached
+        results are invalidated.
+        """
+        df = self._current_snapshot().df
+        return (self.data_revision, id(df), len(df))
+    
+    def get_result_cache(self) -> LRUCache:
+        """LRU cache of itinerary and recommendation results"""
+        return self.result_cache
+    
+    def configure_result_cache(
+        self,
+        maxsize: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        enabled: bool = True
+    ):
+        """
+        Configure the itinerary/recommendation result cache
+        
+        Args:
+            maxsize: Maximum cached results (0 disables caching)
+            ttl_seconds: Lifetime of a cached result
+            enabled: False bypasses the cache for every call
+        """
+        cache = self.get_result_cache()
+        if maxsize is not None or ttl_seconds is not None:
+            self.result_cache = LRUCache(
+                maxsize=cache.maxsize if maxsize is None else maxsize,
+                ttl=cache.ttl if ttl_seconds is None else ttl_seconds
+            )
+        self.result_cache_enabled = enabled
+    
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hit/miss/eviction counters of the engine's result caches"""
+        analytics_cache = getattr(self, self.get_analytics.cache_attr)
+        result_cache = self.get_result_cache()
+        return {
+            'analytics': analytics_cache.stats.as_dict(),
+            'results': {**result_cache.stats.as_dict(), 'size': len(result_cache)},
+        }
+    
+    @property
+    def instrumentation(self) -> Instrumentation:
+        """Receiver of stage timings and events (process-wide default unless set)"""
+        return self._instrumentation or get_instrumentation()
+    
+    @instrumentation.setter
+    def instrumentation(self, instrumentation: Optional[Instrumentation]):
+        self._instrumentation = instrumentation
+    
+    @property
+    def cities(self) -> List[str]:
+        """Cities in the dataset, most records first"""
+        self.prepare()
+        return self.city_summary.cities()
+    
+    def get_analytics(self) -> Dict[str, Any]:
+        """Whole-dataset analytics (TourismBackendEngine provides the full set)"""
+        return {}
+    
+    # Analytics cover the whole dataset, so compute them once per version
+    get_analytics = memoize_per_dataset_version(get_analytics)
+    
+    # Forms with the same filters, interests and options share results
+    get_recommendations = cache_by_profile(get_recommendations, recommendation_cache_key)
+    
+    # Each request reads one dataset version from start to finish, even
+    # while append_records swaps in a new one
+    get_analytics = pin_snapshot(get_analytics)
+    get_recommendations = pin_snapshot(get_recommendations)
+    generate_itineraries_batch = pin_snapshot(generate_itineraries_batch)
+    score_profiles_parallel = pin_snapshot(score_profiles_parallel)
+    
+    # Per-stage timings (see instrumentation.STAGES)
+    _filter_by_preferences = timed_stage(STAGE_FILTER)(_filter_by_preferences)
+    _score_destinations = timed_stage(STAGE_SCORE)(_score_destinations)
+    _rank_destinations = timed_stage(STAGE_SELECT)(_rank_destinations)
+    _rank_cities = timed_stage(STAGE_SELECT)(_rank_cities)
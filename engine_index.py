@@ -0,0 +1,478 @@
+"""
+Engine Dataset Indexes
+======================
+
+Precomputed lookup structures built once when TourismBackendEngine
+prepares its dataset:
+- Packed bitmaps per distinct value of each preference filter column
+- Per-city aggregate table (costs, ratings, experience scores, UNESCO,
+  season and interest histograms) for city-level ranking
+- Immutable dataset snapshots bundling the rows with their indexes;
+  appending records extends the indexes instead of rebuilding them
+
+Dependencies: numpy, pandas
+"""
+
+import functools
+import time
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from dataset_store import LIST_COLUMNS, compact_dataset, concat_datasets, parse_list_columns
+from engine_scoring import (
+    EXPERIENCE_WEIGHT, INTEREST_WEIGHT, NEUTRAL_INTEREST_SCORE, RATING_WEIGHT,
+    UNPARSED_BIT, InterestEncoder, experience_scores, top_k_indices
+)
+
+# Dataset columns the engine filters tourist preferences on
+FILTER_COLUMNS = ['budget_level', 'climate_classification', 'Best Season']
+
+
+class FilterIndex:
+    """Packed bitmaps of matching rows for each value of the filter columns"""
+
+    def __init__(self, df: pd.DataFrame, columns: Optional[List[str]] = None):
+        """
+        Build bitmaps for every distinct value of the given columns
+
+        Args:
+            df: Dataset to index (row positions refer to this frame)
+            columns: Columns to index (defaults to FILTER_COLUMNS)
+        """
+        self.num_rows = len(df)
+        self.bitmaps: Dict[str, Dict[Any, np.ndarray]] = {}
+
+        for column in columns or FILTER_COLUMNS:
+            if column not in df.columns:
+                continue
+            codes, values = pd.factorize(df[column])
+            self.bitmaps[column] = {
+                value: np.packbits(codes == code)
+                for code, value in enumerate(values)
+            }
+
+    def select(self, criteria: Dict[str, Any]) -> np.ndarray:
+        """
+        Row positions matching all criteria
+
+        Args:
+            criteria: Required value per column; columns that are not
+                indexed are ignored
+
+        Returns:
+            Sorted array of matching row positions
+        """
+        combined = None
+        for column, value in criteria.items():
+            bitmaps = self.bitmaps.get(column)
+            if bitmaps is None:
+                continue
+            bitmap = bitmaps.get(value)
+            if bitmap is None:
+                return np.empty(0, dtype=np.intp)
+            combined = bitmap if combined is None else combined & bitmap
+
+        if combined is None:
+            return np.arange(self.num_rows)
+        return np.flatnonzero(np.unpackbits(combined, count=self.num_rows))
+
+    def extend(self, df: pd.DataFrame) -> 'FilterIndex':
+        """
+        Index of this index's rows followed by the rows of ``df``
+
+        Only the new rows are factorized; each existing bitmap is copied
+        and the new bits are packed after its last partial byte.
+        """
+        extended = FilterIndex.__new__(FilterIndex)
+        extended.num_rows = self.num_rows + len(df)
+        extended.bitmaps = {}
+        no_rows = np.zeros(-(-self.num_rows // 8), dtype=np.uint8)
+        no_new_rows = np.zeros(len(df), dtype=bool)
+
+        for column, bitmaps in self.bitmaps.items():
+            codes, values = pd.factorize(df[column])
+            new_bits = {value: codes == code for code, value in enumerate(values)}
+            extended.bitmaps[column] = {
+                value: _append_bits(bitmaps.get(value, no_rows), self.num_rows, new_bits.get(value, no_new_rows))
+                for value in {**bitmaps, **new_bits}
+            }
+        return extended
+
+    def to_state(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        """
+        JSON-serializable description plus named arrays (see from_state)
+
+        Bitmaps of a column are listed in the order of its values.
+        """
+        info = {'num_rows': self.num_rows, 'columns': {}}
+        arrays = {}
+        for column, bitmaps in self.bitmaps.items():
+            info['columns'][column] = list(bitmaps)
+            for i, bitmap in enumerate(bitmaps.values()):
+                arrays[f"{column}/{i}"] = bitmap
+        return info, arrays
+
+    @classmethod
+    def from_state(cls, info: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> 'FilterIndex':
+        """Index written by to_state"""
+        index = cls.__new__(cls)
+        index.num_rows = info['num_rows']
+        index.bitmaps = {
+            column: {value: arrays[f"{column}/{i}"] for i, value in enumerate(values)}
+            for column, values in info['columns'].items()
+        }
+        return index
+
+
+def _append_bits(bitmap: np.ndarray, num_rows: int, bits: np.ndarray) -> np.ndarray:
+    """Packed bitmap of ``num_rows`` rows with ``bits`` appended"""
+    full, partial = divmod(num_rows, 8)
+    tail = np.unpackbits(bitmap[full:], count=partial).astype(bool)
+    return np.concatenate([bitmap[:full], np.packbits(np.concatenate([tail, bits]))])
+
+
+class CitySummary:
+    """
+    City aggregates built once from the site rows
+
+    Sums are kept per cell (city x filter values), so city-level means
+    for any budget/climate/season filter are exact and cost O(cells)
+    instead of a groupby over all rows.
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        interest_masks: np.ndarray,
+        interests: List[str],
+        filter_columns: Optional[List[str]] = None
+    ):
+        """
+        Args:
+            df: Dataset rows
+            interest_masks: Interest bitmasks aligned with ``df`` rows
+            interests: Interest names by bit position (InterestEncoder.interests)
+            filter_columns: Filter columns kept per cell (defaults to FILTER_COLUMNS)
+        """
+        self.interests = list(interests)
+        self.filter_columns = [c for c in (filter_columns or FILTER_COLUMNS) if c in df.columns]
+
+        keys = ['city'] + self.filter_columns
+        cell_codes, cells = pd.MultiIndex.from_frame(df[keys].astype(object)).factorize()
+        self.cells = cells.set_names(keys).to_frame(index=False)
+        num_cells = len(self.cells)
+
+        def cell_sum(values) -> np.ndarray:
+            return np.bincount(cell_codes, weights=np.asarray(values, dtype=np.float64), minlength=num_cells)
+
+        masks = np.asarray(interest_masks, dtype=np.uint64)
+        self.counts = np.bincount(cell_codes, minlength=num_cells).astype(np.float64)
+        self.sums = {
+            'avg_cost_usd': cell_sum(df['avg_cost_usd']),
+            'Avg Rating': cell_sum(df['Avg Rating']),
+            'culture': cell_sum(df['culture']),
+            'adventure': cell_sum(df['adventure']),
+            'nature': cell_sum(df['nature']),
+            # Per-row experience score (0-100), missing scores skipped as in scoring
+            'experience_score': cell_sum(experience_scores(df)),
+            'unesco_records': cell_sum(df['UNESCO Site'].astype(bool)) if 'UNESCO Site' in df.columns
+            else np.zeros(num_cells),
+            'unparsed_interests': cell_sum((masks & UNPARSED_BIT) != 0),
+        }
+        self.interest_counts = np.column_stack([
+            cell_sum(((masks >> np.uint64(bit)) & np.uint64(1)) & ((masks & UNPARSED_BIT) == 0))
+            for bit in range(len(self.interests))
+        ]) if self.interests else np.zeros((num_cells, 0))
+
+        # Row-level facts the city table needs besides the cell sums
+        self.countries = (
+            df.drop_duplicates('city').set_index('city')['country'].astype(object)
+            if 'country' in df.columns else None
+        )
+        self.unesco_pairs = (
+            df.loc[df['UNESCO Site'].astype(bool), ['city', 'Site Name']].astype(object).drop_duplicates()
+            if 'UNESCO Site' in df.columns and 'Site Name' in df.columns else None
+        )
+        self._index_cities()
+
+    def to_state(self) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+        """JSON-serializable description plus named arrays (see from_state)"""
+        info = {
+            'interests': self.interests,
+            'filter_columns': self.filter_columns,
+            'cells': {column: self.cells[column].tolist() for column in self.cells.columns},
+            'sums': list(self.sums),
+            'countries': None if self.countries is None else [
+                self.countries.index.tolist(), self.countries.tolist()
+            ],
+            'unesco_pairs': None if self.unesco_pairs is None else self.unesco_pairs.to_numpy().tolist(),
+        }
+        arrays = {'counts': self.counts, 'interest_counts': self.interest_counts}
+        arrays.update({f"sums/{name}": values for name, values in self.sums.items()})
+        return info, arrays
+
+    @classmethod
+    def from_state(cls, info: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> 'CitySummary':
+        """Summary written by to_state"""
+        summary = cls.__new__(cls)
+        summary.interests = info['interests']
+        summary.filter_columns = info['filter_columns']
+        summary.cells = pd.DataFrame({
+            column: pd.Series(values, dtype=object) for column, values in info['cells'].items()
+        })
+        summary.counts = arrays['counts']
+        summary.interest_counts = arrays['interest_counts']
+        summary.sums = {name: arrays[f"sums/{name}"] for name in info['sums']}
+        summary.countries = None
+        if info['countries'] is not None:
+            cities, countries = info['countries']
+            summary.countries = pd.Series(countries, index=pd.Index(cities, dtype=object, name='city'),
+                                          dtype=object, name='country')
+        summary.unesco_pairs = None
+        if info['unesco_pairs'] is not None:
+            summary.unesco_pairs = pd.DataFrame(info['unesco_pairs'], columns=['city', 'Site Name'], dtype=object)
+        summary._index_cities()
+        return summary
+
+    def _index_cities(self):
+        """Map cells to cities and build the per-city table"""
+        self.cell_values = {column: self.cells[column].to_numpy() for column in self.cells.columns}
+        self.city_codes, self.city_names = pd.factorize(self.cells['city'], sort=True)
+        self.city_names = np.asarray(self.city_names, dtype=object)
+        self.table = self._build_table()
+
+    def extend(
+        self,
+        df: pd.DataFrame,
+        interest_masks: np.ndarray,
+        interests: List[str]
+    ) -> 'CitySummary':
+        """
+        Summary of this summary's rows plus the rows of ``df``
+
+        Only the new rows are aggregated; their cell sums are added to the
+        existing ones, so the cost is O(new rows + cells).
+
+        Args:
+            df: New rows
+            interest_masks: Interest bitmasks aligned with ``df`` rows
+            interests: Interest names by bit position; must start with
+                this summary's interests (InterestEncoder only appends)
+        """
+        delta = CitySummary(df, interest_masks, interests, self.filter_columns)
+        extended = CitySummary.__new__(CitySummary)
+        extended.interests = delta.interests
+        extended.filter_columns = self.filter_columns
+
+        keys = ['city'] + self.filter_columns
+        cell_codes, cells = pd.MultiIndex.from_frame(
+            pd.concat([self.cells, delta.cells], ignore_index=True).astype(object)
+        ).factorize()
+        extended.cells = cells.set_names(keys).to_frame(index=False)
+        num_cells = len(extended.cells)
+
+        def merge(old: np.ndarray, new: np.ndarray) -> np.ndarray:
+            return np.bincount(cell_codes, weights=np.concatenate([old, new]), minlength=num_cells)
+
+        extended.counts = merge(self.counts, delta.counts)
+        extended.sums = {column: merge(self.sums[column], delta.sums[column]) for column in self.sums}
+        old_counts = np.zeros((len(self.cells), len(delta.interests)))
+        old_counts[:, :len(self.interests)] = self.interest_counts
+        extended.interest_counts = np.column_stack([
+            merge(old_counts[:, bit], delta.interest_counts[:, bit]) for bit in range(len(delta.interests))
+        ]) if delta.interests else np.zeros((num_cells, 0))
+
+        extended.countries = None if self.countries is None else pd.concat([self.countries, delta.countries])
+        if extended.countries is not None:
+            extended.countries = extended.countries[~extended.countries.index.duplicated()]
+        extended.unesco_pairs = None if self.unesco_pairs is None else pd.concat(
+            [self.unesco_pairs, delta.unesco_pairs], ignore_index=True
+        ).drop_duplicates()
+        extended._index_cities()
+        return extended
+
+    def _city_sum(self, values: np.ndarray, cell_mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Sum cell values into cities, optionally over a subset of cells"""
+        weights = values if cell_mask is None else np.where(cell_mask, values, 0)
+        return np.bincount(self.city_codes, weights=weights, minlength=len(self.city_names))
+
+    def _build_table(self) -> pd.DataFrame:
+        """Per-city table over all rows"""
+        counts = self._city_sum(self.counts)
+        table = pd.DataFrame({
+            'records': counts.astype(int),
+            'avg_cost_usd': self._city_sum(self.sums['avg_cost_usd']) / counts,
+            'avg_rating': self._city_sum(self.sums['Avg Rating']) / counts,
+            'culture': self._city_sum(self.sums['culture']) / counts,
+            'adventure': self._city_sum(self.sums['adventure']) / counts,
+            'nature': self._city_sum(self.sums['nature']) / counts,
+            'unesco_records': self._city_sum(self.sums['unesco_records']).astype(int),
+        }, index=pd.Index(self.city_names, name='city'))
+
+        if self.countries is not None:
+            table.insert(0, 'country', self.countries.reindex(table.index).to_numpy())
+        if self.unesco_pairs is not None:
+            table['unesco_sites'] = self.unesco_pairs.groupby('city').size().reindex(table.index).fillna(0).astype(int)
+        if 'Best Season' in self.filter_columns:
+            seasons = self.cell_values['Best Season']
+            for season in sorted(set(seasons) - {None}, key=str):
+                table[f"season_{season}"] = self._city_sum(self.counts, seasons == season).astype(int)
+        for bit, interest in enumerate(self.interests):
+            table[f"interest_{interest}"] = self._city_sum(self.interest_counts[:, bit]).astype(int)
+        return table
+
+    def cities(self) -> List[str]:
+        """City names, most records first (ties by name)"""
+        order = top_k_indices(self.table['records'].to_numpy(), len(self.table))
+        return self.table.index[order].tolist()
+
+    def cell_mask(self, criteria: Dict[str, Any]) -> np.ndarray:
+        """Cells whose filter values match all criteria"""
+        mask = np.ones(len(self.cells), dtype=bool)
+        for column, value in criteria.items():
+            if column in self.filter_columns:
+                mask &= self.cell_values[column] == value
+        return mask
+
+    def rank_cities(
+        self,
+        criteria: Dict[str, Any],
+        profile_bits: List[int],
+        num_profile_interests: int,
+        k: int
+    ) -> pd.DataFrame:
+        """
+        Top-k cities by mean final score of their matching rows
+
+        Gives the same scores as averaging the per-row final scores of
+        _score_destinations by city, computed from the cell sums.
+
+        Args:
+            criteria: Filter values per column (as for FilterIndex.select)
+            profile_bits: Bit positions of the profile's known interests
+            num_profile_interests: Number of interests in the profile
+            k: Number of cities
+
+        Returns:
+            Frame with city, final_score and site_count columns, best first
+        """
+        mask = self.cell_mask(criteria)
+        counts = self._city_sum(self.counts, mask)
+        present = counts > 0
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if num_profile_interests:
+                matches = self._city_sum(self.interest_counts[:, profile_bits].sum(axis=1), mask)
+                unparsed = self._city_sum(self.sums['unparsed_interests'], mask)
+                interest = (matches * 100 / num_profile_interests + unparsed * NEUTRAL_INTEREST_SCORE) / counts
+            else:
+                interest = np.full(len(counts), NEUTRAL_INTEREST_SCORE)
+            rating = self._city_sum(self.sums['Avg Rating'], mask) / counts / 5 * 100
+            experience = self._city_sum(self.sums['experience_score'], mask) / counts
+
+        scores = INTEREST_WEIGHT * interest + RATING_WEIGHT * rating + EXPERIENCE_WEIGHT * experience
+        scores[~present] = np.nan
+
+        top = top_k_indices(scores, min(k, int(present.sum())))
+        return pd.DataFrame({
+            'city': self.city_names[top],
+            'final_score': scores[top],
+            'site_count': counts[top].astype(int),
+        })
+
+
+def _elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
+
+
+@dataclass(frozen=True)
+class DatasetSnapshot:
+    """
+    One version of the dataset together with its derived indexes
+
+    Snapshots are never modified once built: appending records produces a
+    new snapshot, so a request holding an older one keeps seeing rows and
+    indexes that agree with each other.
+    """
+    df: pd.DataFrame
+    interest_encoder: InterestEncoder
+    filter_index: FilterIndex
+    city_summary: CitySummary
+    timings: Dict[str, float]
+
+    @classmethod
+    def build(cls, df: pd.DataFrame) -> 'DatasetSnapshot':
+        """
+        Prepare a loaded dataset and build its indexes
+
+        Parses the list columns and adds the `interest_mask` column in place.
+        """
+        timings = parse_list_columns(df, LIST_COLUMNS)
+
+        start = time.perf_counter()
+        encoder = InterestEncoder()
+        df['interest_mask'] = encoder.encode_column(df['Interests'])
+        timings['encode Interests'] = _elapsed_ms(start)
+
+        start = time.perf_counter()
+        filter_index = FilterIndex(df, FILTER_COLUMNS)
+        timings['build filter index'] = _elapsed_ms(start)
+
+        start = time.perf_counter()
+        city_summary = CitySummary(df, df['interest_mask'].to_numpy(), encoder.interests, FILTER_COLUMNS)
+        timings['build city summary'] = _elapsed_ms(start)
+
+        return cls(df, encoder, filter_index, city_summary, timings)
+
+    def append(self, records: pd.DataFrame) -> 'DatasetSnapshot':
+        """
+        New snapshot with ``records`` appended after the existing rows
+
+        The records are compacted to this snapshot's columns and dtypes;
+        only they are parsed, encoded and indexed. Existing row positions
+        are unchanged. This snapshot is left untouched.
+        """
+        start = time.perf_counter()
+        columns = [column for column in self.df.columns if column != 'interest_mask']
+        delta, _ = compact_dataset(records, columns)
+        delta = delta.reindex(columns=columns)
+        timings = {'compact records': _elapsed_ms(start)}
+        timings.update(parse_list_columns(delta, LIST_COLUMNS))
+
+        # Copy the encoder: new interests get new bits without touching
+        # the one older snapshots still use
+        start = time.perf_counter()
+        encoder = InterestEncoder(self.interest_encoder.interests)
+        delta['interest_mask'] = encoder.encode_column(delta['Interests'])
+        timings['encode Interests'] = _elapsed_ms(start)
+
+        start = time.perf_counter()
+        df = concat_datasets([self.df, delta])
+        timings['concatenate'] = _elapsed_ms(start)
+
+        start = time.perf_counter()
+        filter_index = self.filter_index.extend(delta)
+        timings['extend filter index'] = _elapsed_ms(start)
+
+        start = time.perf_counter()
+        city_summary = self.city_summary.extend(delta, delta['interest_mask'].to_numpy(), encoder.interests)
+        timings['extend city summary'] = _elapsed_ms(start)
+
+        return DatasetSnapshot(df, encoder, filter_index, city_summary, timings)
+
+
+def pin_snapshot(method: Callable) -> Callable:
+    """
+    Run an engine method on one dataset version from start to finish
+
+    The engine must provide a ``snapshot()`` context manager pinning its
+    current DatasetSnapshot for the calling thread.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.snapshot():
+            return method(self, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,272 @@
+"""
+Parallel Batch Scoring
+======================
+
+Process-pool execution for large offline batches (e.g. nightly scoring of
+synthetic profiles) in TourismBackendEngine:
+- Scoring arrays exported once to memory-mapped .npy files (in /dev/shm
+  when available); workers map them instead of receiving a pickled DataFrame
+- Profiles scored in configurable chunks with top-k results per profile
+- Itinerary generation fanned out to workers that open their own engine
+  on a shared memory-mapped dataset (see dataset_store.save_mapped)
+
+Dependencies: numpy, pandas
+"""
+
+import functools
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from engine_scoring import (
+    EXPERIENCE_WEIGHT, INTEREST_WEIGHT, RATING_WEIGHT,
+    experience_scores, interest_match_scores, top_k_indices
+)
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Scoring arrays mapped by the current worker process
+_worker_arrays: Dict[str, Any] = {}
+
+
+def _shared_tmp_dir(required_bytes: int = 0) -> Optional[str]:
+    """
+    RAM-backed directory for exported arrays when the system has one
+
+    Falls back to the regular temp directory (None) when /dev/shm is
+    missing or has less than ``required_bytes`` free, e.g. the 64 MB
+    default of a Docker container.
+    """
+    if not os.path.isdir('/dev/shm'):
+        return None
+    try:
+        free = shutil.disk_usage('/dev/shm').free
+    except OSError:
+        return None
+    return '/dev/shm' if free >= required_bytes else None
+
+
+def _chunks(items: Sequence, size: int) -> Iterator[Sequence]:
+    """Consecutive slices of at most ``size`` items"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class SharedScoringArrays:
+    """
+    Read-only scoring arrays exported to memory-mapped files
+
+    Holds everything a worker needs to filter and score rows: interest
+    masks, the rating/experience part of the final score, and integer
+    codes of the filter columns.
+    """
+
+    def __init__(self, df: pd.DataFrame, interest_masks: np.ndarray, filter_columns: List[str]):
+        """
+        Args:
+            df: Prepared engine dataset
+            interest_masks: Interest bitmasks aligned with ``df`` rows
+            filter_columns: Columns profiles can be filtered on
+        """
+        filter_columns = [c for c in filter_columns if c in df.columns]
+        # uint64 interest masks, float64 base scores, int32 filter codes
+        required_bytes = len(df) * (8 + 8 + 4 * len(filter_columns))
+        self.directory = tempfile.mkdtemp(prefix='tourism_scoring_', dir=_shared_tmp_dir(required_bytes))
+        self.categories: Dict[str, Dict[Any, int]] = {}
+
+        try:
+            rating = df['Avg Rating'].to_numpy(dtype=np.float64) / 5 * 100
+            experience = experience_scores(df)
+
+            self._save('interest_mask', np.asarray(interest_masks, dtype=np.uint64))
+            self._save('base_score', RATING_WEIGHT * rating + EXPERIENCE_WEIGHT * experience)
+            for i, column in enumerate(filter_columns):
+                codes, values = pd.factorize(df[column])
+                self.categories[column] = {value: code for code, value in enumerate(values)}
+                self._save(f"filter_{i}", codes.astype(np.int32))
+        except BaseException:
+            # Partial exports would otherwise stay in (RAM-backed) storage
+            shutil.rmtree(self.directory, ignore_errors=True)
+            raise
+
+    def _save(self, name: str, values: np.ndarray):
+        np.save(os.path.join(self.directory, f"{name}.npy"), values)
+
+    @property
+    def spec(self) -> Dict[str, Any]:
+        """Picklable description passed to worker initializers"""
+        return {'directory': self.directory, 'categories': self.categories}
+
+    def close(self):
+        """Remove the exported files"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def __enter__(self) -> 'SharedScoringArrays':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def map_scoring_arrays(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Memory-map exported scoring arrays read-only
+
+    Args:
+        spec: SharedScoringArrays.spec
+
+    Returns:
+        Arrays in the form score_chunk expects
+    """
+    def load(name):
+        return np.load(os.path.join(spec['directory'], f"{name}.npy"), mmap_mode='r')
+
+    return {
+        'interest_mask': load('interest_mask'),
+        'base_score': load('base_score'),
+        'filters': {
+            column: (load(f"filter_{i}"), codes)
+            for i, (column, codes) in enumerate(spec['categories'].items())
+        },
+    }
+
+
+def _init_scoring_worker(spec: Dict[str, Any]):
+    """Map the exported scoring arrays once per worker process"""
+    _worker_arrays.clear()
+    _worker_arrays.update(map_scoring_arrays(spec))
+
+
+def score_chunk(
+    tasks: List[Tuple[Dict[str, Any], np.uint64, int]],
+    k: int,
+    arrays: Optional[Dict[str, Any]] = None
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Filter, score and rank rows for a chunk of encoded profiles
+
+    Args:
+        tasks: (filter criteria, interest mask, number of interests) per profile
+        k: Results per profile
+        arrays: Scoring arrays (defaults to the worker's mapped arrays)
+
+    Returns:
+        (row positions, final scores) of the top-k rows per profile
+    """
+    arrays = arrays or _worker_arrays
+    masks, base_score = arrays['interest_mask'], arrays['base_score']
+
+    results = []
+    for criteria, profile_mask, num_interests in tasks:
+        selected = np.ones(len(masks), dtype=bool)
+        for column, value in criteria.items():
+            if column not in arrays['filters']:
+                continue
+            codes, categories = arrays['filters'][column]
+            code = categories.get(value)
+            selected &= (codes == code) if code is not None else False
+        positions = np.flatnonzero(selected)
+
+        scores = (
+            INTEREST_WEIGHT * interest_match_scores(masks[positions], profile_mask, num_interests)
+            + base_score[positions]
+        )
+        top = top_k_indices(scores, k)
+        results.append((positions[top], scores[top]))
+    return results
+
+
+def score_profiles_parallel(
+    shared: SharedScoringArrays,
+    tasks: List[Tuple[Dict[str, Any], np.uint64, int]],
+    k: int = 10,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Score encoded profiles across a process pool
+
+    Args:
+        shared: Exported scoring arrays
+        tasks: (filter criteria, interest mask, number of interests) per profile
+        k: Results per profile
+        workers: Worker processes (defaults to the CPU count)
+        chunk_size: Profiles per task sent to a worker
+
+    Returns:
+        (row positions, final scores) per profile, in input order
+    """
+    results: List[Tuple[np.ndarray, np.ndarray]] = []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_scoring_worker,
+        initargs=(shared.spec,)
+    ) as pool:
+        for chunk_results in pool.map(functools.partial(score_chunk, k=k), _chunks(tasks, chunk_size)):
+            results.extend(chunk_results)
+    return results
+
+
+# ============================================================================
+# PARALLEL ITINERARIES
+# ============================================================================
+
+# Engine opened by the current worker process
+_worker_engine: Dict[str, Any] = {}
+
+
+def _init_itinerary_worker(dataset_path: str):
+    """Open one engine per worker on the (memory-mapped) dataset"""
+    # Imported here: the engine modules import this one
+    from tourism_backend_engine import TourismBackendEngine
+
+    engine = TourismBackendEngine(dataset_path)
+    engine.prepare()
+    _worker_engine['engine'] = engine
+
+
+def _itinerary_chunk(profiles: List[Any], start_date: Optional[datetime]) -> List[Dict[str, Any]]:
+    """Generate itineraries for a chunk of profiles in a worker"""
+    return _worker_engine['engine'].generate_itineraries_batch(profiles, start_date)
+
+
+def generate_itineraries_parallel(
+    dataset_path: str,
+    profiles: List[Any],
+    start_date: Optional[datetime] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> List[Dict[str, Any]]:
+    """
+    Generate itineraries for many profiles across a process pool
+
+    Every worker opens its own engine on ``dataset_path``; convert the
+    dataset to a .columns directory first so workers share one
+    memory-mapped copy instead of each parsing the CSV.
+
+    Args:
+        dataset_path: Dataset used by the engine
+        profiles: Tourist profiles
+        start_date: Trip start date shared by all itineraries
+        workers: Worker processes (defaults to the CPU count)
+        chunk_size: Profiles per generate_itineraries_batch call
+
+    Returns:
+        One itinerary dictionary per profile, in input order
+    """
+    results: List[Dict[str, Any]] = []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_itinerary_worker,
+        initargs=(dataset_path,)
+    ) as pool:
+        chunk_task = functools.partial(_itinerary_chunk, start_date=start_date)
+        for chunk_results in pool.map(chunk_task, _chunks(profiles, chunk_size)):
+            results.extend(chunk_results)
+    return results
@@ -0,0 +1,308 @@
+"""
+Vectorized Destination Scoring
+==============================
+
+Array-based scoring primitives for TourismBackendEngine:
+- Interest lists encoded once as 64-bit masks
+- Interest overlap computed with a popcount over all rows at once
+- Weighted final score (interest 40%, rating 30%, experience 30%)
+- Top-k ranking with np.argpartition and deterministic tie-breaking
+- Best row per group (e.g. per site) without sorting all rows
+
+Dependencies: numpy, pandas
+"""
+
+import ast
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, Iterable, List, Optional
+
+# Scoring weights (must add up to 1.0)
+INTEREST_WEIGHT = 0.4
+RATING_WEIGHT = 0.3
+EXPERIENCE_WEIGHT = 0.3
+
+EXPERIENCE_COLUMNS = ['culture', 'adventure', 'nature']
+
+# Columns ranking reads from prepared engine rows (interest_mask is added
+# by engine_index.DatasetSnapshot)
+SCORING_COLUMNS = ['interest_mask', 'Avg Rating'] + EXPERIENCE_COLUMNS
+
+# Score used when a row has no usable interest list or the profile has no interests
+NEUTRAL_INTEREST_SCORE = 50.0
+
+# Bit 63 flags rows whose interests could not be parsed; bits 0-62 are interests
+UNPARSED_BIT = np.uint64(1 << 63)
+MAX_INTERESTS = 63
+
+# Number of set bits for every byte value, used to popcount uint64 arrays
+_POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def popcount(values: np.ndarray) -> np.ndarray:
+    """Count set bits of every element of a uint64 array"""
+    values = np.ascontiguousarray(values, dtype=np.uint64)
+    as_bytes = values.view(np.uint8).reshape(len(values), 8)
+    return _POPCOUNT_TABLE[as_bytes].sum(axis=1, dtype=np.uint8)
+
+
+class InterestEncoder:
+    """Assigns a bit to every distinct interest and encodes interest lists as masks"""
+
+    def __init__(self, interests: Iterable[str] = ()):
+        self.bits: Dict[str, int] = {}
+        for interest in interests:
+            self.add(interest)
+
+    def add(self, interest: str) -> int:
+        """Register an interest and return its bit position"""
+        if interest not in self.bits:
+            if len(self.bits) >= MAX_INTERESTS:
+                raise ValueError(f"At most {MAX_INTERESTS} distinct interests are supported")
+            self.bits[interest] = len(self.bits)
+        return self.bits[interest]
+
+    @property
+    def interests(self) -> List[str]:
+        """Known interests ordered by bit position"""
+        return sorted(self.bits, key=self.bits.get)
+
+    def encode(self, interests: Iterable[str], grow: bool = False) -> np.uint64:
+        """
+        Encode a list of interests as a bitmask
+
+        Args:
+            interests: Interest names
+            grow: Register unknown interests instead of ignoring them
+
+        Returns:
+            Bitmask with one bit per known interest
+        """
+        mask = 0
+        for interest in interests:
+            if grow:
+                mask |= 1 << self.add(interest)
+            elif interest in self.bits:
+                mask |= 1 << self.bits[interest]
+        return np.uint64(mask)
+
+    def encode_value(self, value: Any) -> np.uint64:
+        """Encode one dataset cell (list or stringified list)"""
+        if isinstance(value, str):
+            try:
+                value = ast.literal_eval(value)
+            except (ValueError, SyntaxError):
+                return UNPARSED_BIT
+        if not isinstance(value, (list, tuple, set)):
+            return UNPARSED_BIT
+        return self.encode(value, grow=True)
+
+    def encode_column(self, column: pd.Series) -> np.ndarray:
+        """Encode an `Interests` column, parsing each distinct value only once"""
+        cache: Dict[Any, np.uint64] = {}
+        masks = np.empty(len(column), dtype=np.uint64)
+        for i, value in enumerate(column):
+            key = tuple(value) if isinstance(value, list) else value
+            try:
+                mask = cache.get(key)
+            except TypeError:
+                mask = self.encode_value(value)
+            else:
+                if mask is None:
+                    mask = cache[key] = self.encode_value(value)
+            masks[i] = mask
+        return masks
+
+
+def interest_match_scores(
+    interest_masks: np.ndarray,
+    profile_mask: np.uint64,
+    num_profile_interests: int
+) -> np.ndarray:
+    """
+    Interest match (0-100) for every row
+
+    Share of the profile's interests found in each row's interests.
+    Rows without a parsed interest list score NEUTRAL_INTEREST_SCORE.
+    """
+    interest_masks = np.asarray(interest_masks, dtype=np.uint64)
+    if num_profile_interests == 0:
+        return np.full(len(interest_masks), NEUTRAL_INTEREST_SCORE)
+
+    matches = popcount(interest_masks & np.uint64(profile_mask))
+    scores = matches / num_profile_interests * 100
+    unparsed = (interest_masks & UNPARSED_BIT) != 0
+    scores[unparsed] = NEUTRAL_INTEREST_SCORE
+    return scores
+
+
+def experience_scores(df: pd.DataFrame, experience_columns: Optional[List[str]] = None) -> np.ndarray:
+    """
+    Experience score (0-100): mean of the experience columns of every row
+
+    Missing values are skipped like pandas' mean(axis=1) does, so a row
+    lacking one score is rated on the others (NaN only if all are missing).
+    Without any experience column every row scores NEUTRAL_INTEREST_SCORE.
+    """
+    columns = [c for c in (experience_columns or EXPERIENCE_COLUMNS) if c in df.columns]
+    if not columns:
+        return np.full(len(df), NEUTRAL_INTEREST_SCORE)
+
+    values = df[columns].to_numpy(dtype=np.float64)
+    present = ~np.isnan(values)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        experience = np.where(present, values, 0.0).sum(axis=1) / present.sum(axis=1)
+    return experience / 5 * 100
+
+
+def compute_destination_scores(
+    df: pd.DataFrame,
+    interest_masks: np.ndarray,
+    profile_mask: np.uint64,
+    num_profile_interests: int,
+    experience_columns: Optional[List[str]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Compute all score components for a frame of destinations
+
+    Args:
+        df: Destination rows
+        interest_masks: Interest bitmasks aligned with ``df`` rows
+        profile_mask: Encoded tourist interests
+        num_profile_interests: Number of interests in the tourist profile
+        experience_columns: Experience score columns (1-5 scale)
+
+    Returns:
+        Dictionary of score arrays keyed by column name
+    """
+    interest_score = interest_match_scores(interest_masks, profile_mask, num_profile_interests)
+
+    rating_score = df['Avg Rating'].to_numpy(dtype=np.float64) / 5 * 100
+    experience_score = experience_scores(df, experience_columns)
+
+    final_score = (
+        INTEREST_WEIGHT * interest_score
+        + RATING_WEIGHT * rating_score
+        + EXPERIENCE_WEIGHT * experience_score
+    )
+
+    return {
+        'interest_score': interest_score,
+        'rating_score': rating_score,
+        'experience_score': experience_score,
+        'final_score': final_score,
+    }
+
+
+def compute_destination_scores_batch(
+    df: pd.DataFrame,
+    interest_masks: np.ndarray,
+    profile_masks: List[np.uint64],
+    num_profile_interests: List[int],
+    experience_columns: Optional[List[str]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Score one frame of destinations for many interest profiles at once
+
+    Rating and experience scores are computed once; interest and final
+    scores are returned as (rows x profiles) matrices whose column j
+    equals compute_destination_scores for profile j.
+    """
+    base = compute_destination_scores(df, interest_masks, np.uint64(0), 0, experience_columns)
+    interest_score = np.column_stack([
+        interest_match_scores(interest_masks, mask, count)
+        for mask, count in zip(profile_masks, num_profile_interests)
+    ]) if profile_masks else np.empty((len(df), 0))
+
+    # Same order of additions as compute_destination_scores, so the scores
+    # are bit-identical to scoring each profile on its own
+    final_score = (
+        INTEREST_WEIGHT * interest_score
+        + (RATING_WEIGHT * base['rating_score'])[:, None]
+        + (EXPERIENCE_WEIGHT * base['experience_score'])[:, None]
+    )
+
+    return {
+        'interest_score': interest_score,
+        'rating_score': base['rating_score'],
+        'experience_score': base['experience_score'],
+        'final_score': final_score,
+    }
+
+
+def top_k_indices(
+    scores: np.ndarray,
+    k: int,
+    tiebreak: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Positions of the k highest scores, best first, without a full sort
+
+    Ties are broken by ascending ``tiebreak`` value when given, then by
+    ascending position, so the result never depends on partition order.
+    NaN scores rank last.
+
+    Args:
+        scores: Score per row (or per group)
+        k: Number of results
+        tiebreak: Optional secondary sort key per row
+
+    Returns:
+        Array of at most k positions
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    scores = np.where(np.isnan(scores), -np.inf, scores)
+    n = len(scores)
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    if k < n:
+        # Everything strictly above the k-th best score is in; fill the
+        # remaining slots from the rows tied at the threshold
+        threshold = scores[np.argpartition(-scores, k - 1)[k - 1]]
+        above = np.flatnonzero(scores > threshold)
+        tied = np.flatnonzero(scores == threshold)
+        if tiebreak is not None:
+            tied = tied[np.argsort(np.asarray(tiebreak)[tied], kind='stable')]
+        candidates = np.concatenate([above, tied[:k - len(above)]])
+    else:
+        candidates = np.arange(n)
+
+    keys = [candidates, -scores[candidates]]
+    if tiebreak is not None:
+        keys.insert(1, np.asarray(tiebreak)[candidates])
+    return candidates[np.lexsort(keys)]
+
+
+def best_in_groups(codes: np.ndarray, scores: np.ndarray) -> np.ndarray:
+    """
+    Position of the best score of every group, in ascending position order
+
+    Ties within a group go to the first position and NaN scores rank
+    last, matching a stable descending sort followed by keeping the first
+    row per group.
+
+    Args:
+        codes: Group code per row (0..n_groups-1)
+        scores: Score per row
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    scores = np.where(np.isnan(scores), -np.inf, scores)
+    codes = np.asarray(codes)
+    if not len(codes):
+        return np.empty(0, dtype=np.intp)
+
+    best = np.full(codes.max() + 1, -np.inf)
+    np.maximum.at(best, codes, scores)
+    candidates = np.flatnonzero(scores == best[codes])
+    _, first = np.unique(codes[candidates], return_index=True)
+    return np.sort(candidates[first])
+
+
+def group_means(codes: np.ndarray, values: np.ndarray, num_groups: int) -> np.ndarray:
+    """Mean of ``values`` per group code (codes in 0..num_groups-1)"""
+    sums = np.bincount(codes, weights=values, minlength=num_groups)
+    counts = np.bincount(codes, minlength=num_groups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return sums / counts
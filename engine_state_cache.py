@@ -0,0 +1,372 @@
+"""
+Engine State Cache
+==================
+
+On-disk cache of the state TourismBackendEngine derives from its dataset
+(parsed list columns, interest bitmasks, filter bitmaps, city summary and
+analytics), so a restart with an unchanged dataset skips loading and
+preparing it:
+- Dataset fingerprint: size, modification time and BLAKE2b content hash
+  of the files the loader reads; the content is only re-hashed when size
+  or modification time change
+- One entry per fingerprint: rows as a memory-mapped column directory
+  (see dataset_store.save_mapped) with their exact dtypes, indexes as
+  arrays in an .npz file and everything else as JSON
+- No pickle: reading an entry only parses JSON and numeric arrays, so a
+  tampered cache directory cannot run code (analytics that JSON cannot
+  represent exactly are not cached and recomputed instead)
+- Entries written to a temporary directory and renamed into place
+- Stale entries replaced and corrupt ones discarded and rebuilt
+
+The cache lives in `.engine_cache` next to the dataset unless the
+TOURISM_STATE_CACHE_DIR environment variable names another directory
+(an empty value disables it).
+
+Dependencies: numpy, pandas
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+import warnings
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from dataset_store import LIST_COLUMNS, dataset_source, load_mapped, save_mapped
+from engine_index import CitySummary, DatasetSnapshot, FilterIndex
+from engine_scoring import InterestEncoder
+
+# Bump when the layout or the derived structures change; older entries
+# are then treated as stale
+STATE_FORMAT_VERSION = 3
+
+STATE_CACHE_DIR_ENV = 'TOURISM_STATE_CACHE_DIR'
+DEFAULT_CACHE_DIRNAME = '.engine_cache'
+
+# Last fingerprint per source, so unchanged files are not re-hashed
+SOURCES_INDEX = 'sources.json'
+ENTRY_MANIFEST = 'entry.json'
+ROWS_DIR = 'rows.columns'
+STATE_FILE = 'state.json'
+ARRAYS_FILE = 'arrays.npz'
+
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def default_cache_dir(dataset_path: str) -> Optional[str]:
+    """Cache directory for a dataset (None when disabled by the environment)"""
+    configured = os.environ.get(STATE_CACHE_DIR_ENV)
+    if configured is not None:
+        return configured or None
+    return os.path.join(os.path.dirname(os.path.abspath(dataset_path)), DEFAULT_CACHE_DIRNAME)
+
+
+def _source_files(path: str) -> List[str]:
+    """Files making up a dataset source (a file or a .columns directory)"""
+    if os.path.isdir(path):
+        return sorted(os.path.join(path, name) for name in os.listdir(path))
+    return [path]
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _json_scalar(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _exact_json(value: Any) -> Any:
+    """``value`` as plain JSON types, or None if JSON would change it (tuples, non-string keys, ...)"""
+    try:
+        converted = json.loads(json.dumps(value, default=_json_scalar))
+    except (TypeError, ValueError):
+        return None
+    return converted if converted == value else None
+
+
+def _file_digest(path: str) -> str:
+    with open(path, 'rb') as f:
+        return _digest(f.read())
+
+
+@dataclass(frozen=True)
+class DatasetFingerprint:
+    """Identity of a dataset source's content"""
+    path: str
+    size: int
+    mtime_ns: int
+    content_hash: str
+
+    @classmethod
+    def of(cls, path: str, previous: Optional[Dict[str, Any]] = None) -> 'DatasetFingerprint':
+        """
+        Fingerprint a dataset file or .columns directory
+
+        Args:
+            path: Source path
+            previous: Fingerprint recorded for the path earlier (as a
+                dict); its content hash is reused when size and
+                modification time are unchanged
+
+        Returns:
+            Fingerprint of the current content
+        """
+        files = _source_files(path)
+        stats = [os.stat(name) for name in files]
+        size = sum(stat.st_size for stat in stats)
+        mtime_ns = max(stat.st_mtime_ns for stat in stats)
+
+        if previous and previous.get('size') == size and previous.get('mtime_ns') == mtime_ns:
+            return cls(path, size, mtime_ns, previous['content_hash'])
+
+        content = hashlib.blake2b(digest_size=16)
+        for name in files:
+            content.update(os.path.basename(name).encode('utf-8'))
+            with open(name, 'rb') as f:
+                for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+                    content.update(block)
+        return cls(path, size, mtime_ns, content.hexdigest())
+
+    @property
+    def key(self) -> str:
+        """Cache entry name: content plus everything the derived state depends on"""
+        return _digest(json.dumps(
+            [STATE_FORMAT_VERSION, pd.__version__, np.__version__, self.size, self.content_hash]
+        ).encode('utf-8'))
+
+
+@dataclass
+class CachedState:
+    """Derived engine state restored from the cache"""
+    snapshot: DatasetSnapshot
+    analytics: Optional[Dict[str, Any]]
+    memory_report: Dict[str, Any]
+    load_ms: float
+
+
+class EngineStateCache:
+    """Derived state of one dataset, stored under a cache directory"""
+
+    def __init__(self, dataset_path: str, cache_dir: str):
+        """
+        Args:
+            dataset_path: Dataset path as given to the engine
+            cache_dir: Directory holding the cache entries
+        """
+        self.dataset_path = dataset_path
+        self.cache_dir = cache_dir
+        self.source = os.path.abspath(dataset_source(dataset_path))
+        self._fingerprint: Optional[DatasetFingerprint] = None
+
+    @classmethod
+    def for_dataset(cls, dataset_path: str) -> Optional['EngineStateCache']:
+        """Cache in the default directory, or None when caching is disabled"""
+        cache_dir = default_cache_dir(dataset_path)
+        return cls(dataset_path, cache_dir) if cache_dir else None
+
+    def fingerprint(self) -> DatasetFingerprint:
+        """Fingerprint of the dataset source (computed once per instance)"""
+        if self._fingerprint is None:
+            previous = self._read_sources().get(self.source)
+            self._fingerprint = DatasetFingerprint.of(self.source, previous)
+        return self._fingerprint
+
+    def entry_path(self) -> str:
+        return os.path.join(self.cache_dir, self.fingerprint().key)
+
+    def load(self) -> Optional[CachedState]:
+        """
+        Restore the cached state of the current dataset content
+
+        Returns:
+            The cached state, or None when there is no valid entry (a
+            corrupt entry is removed so the caller rebuilds it)
+        """
+        start = time.perf_counter()
+        path = self.entry_path()
+        if not os.path.exists(os.path.join(path, ENTRY_MANIFEST)):
+            return None
+
+        try:
+            state = self._read_entry(path)
+        except Exception as e:
+            warnings.warn(f"Discarding corrupt engine state cache {path}: {e}")
+            shutil.rmtree(path, ignore_errors=True)
+            return None
+
+        self._record_source()
+        return CachedState(
+            snapshot=state['snapshot'],
+            analytics=state['analytics'],
+            memory_report=state['memory_report'],
+            load_ms=(time.perf_counter() - start) * 1000
+        )
+
+    def _read_entry(self, path: str) -> Dict[str, Any]:
+        """Read and validate an entry (raises on any inconsistency)"""
+        with open(os.path.join(path, ENTRY_MANIFEST), encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest['key'] != os.path.basename(path) or manifest['format'] != STATE_FORMAT_VERSION:
+            raise ValueError("entry does not match its fingerprint")
+        for name, size in manifest['files'].items():
+            if os.path.getsize(os.path.join(path, name)) != size:
+                raise ValueError(f"{name} has the wrong size")
+
+        for name, digest in manifest['digests'].items():
+            if _file_digest(os.path.join(path, name)) != digest:
+                raise ValueError(f"{name} checksum mismatch")
+        with open(os.path.join(path, STATE_FILE), encoding='utf-8') as f:
+            state = json.load(f)
+        with np.load(os.path.join(path, ARRAYS_FILE), allow_pickle=False) as npz:
+            arrays = {name: npz[name] for name in npz.files}
+
+        df = load_mapped(os.path.join(path, ROWS_DIR))
+        if len(df) != manifest['rows']:
+            raise ValueError("row count mismatch")
+        # List columns are stored as codes into their distinct parsed values
+        for column, parsed in state['list_values'].items():
+            values = np.empty(len(parsed) + 1, dtype=object)
+            values[:-1] = [None if value is None else tuple(value) for value in parsed]
+            df[column] = pd.Series(values[np.asarray(df[column])], index=df.index, name=column, dtype=object)
+
+        filter_index = FilterIndex.from_state(state['filter_index'], {
+            name[len('filter/'):]: values for name, values in arrays.items() if name.startswith('filter/')
+        })
+        city_summary = CitySummary.from_state(state['city_summary'], {
+            name[len('city/'):]: values for name, values in arrays.items() if name.startswith('city/')
+        })
+        encoder = InterestEncoder(state['interests'])
+        snapshot = DatasetSnapshot(df, encoder, filter_index, city_summary, state['timings'])
+        return {**state, 'snapshot': snapshot}
+
+    def save(
+        self,
+        snapshot: DatasetSnapshot,
+        analytics: Optional[Dict[str, Any]],
+        memory_report: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Store derived state for the current dataset content
+
+        Failures (read-only or full disk) only warn: the cache is an
+        optimization and the engine works without it.
+
+        Returns:
+            Entry path, or None if it could not be written
+        """
+        path = self.entry_path()
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = tempfile.mkdtemp(prefix='.tmp-', dir=self.cache_dir)
+            try:
+                self._write_entry(tmp, snapshot, analytics, memory_report)
+                if os.path.exists(path):
+                    shutil.rmtree(path, ignore_errors=True)
+                os.replace(tmp, path)
+            finally:
+                shutil.rmtree(tmp, ignore_errors=True)
+            self._record_source()
+        except OSError as e:
+            warnings.warn(f"Could not write engine state cache {path}: {e}")
+            return None
+        return path
+
+    def _write_entry(
+        self,
+        path: str,
+        snapshot: DatasetSnapshot,
+        analytics: Optional[Dict[str, Any]],
+        memory_report: Dict[str, Any]
+    ):
+        """Write all files of an entry into ``path``, manifest last"""
+        df = snapshot.df.copy(deep=False)
+        list_values = {}
+        for column in LIST_COLUMNS:
+            if column in df.columns:
+                codes, uniques = pd.factorize(df[column])
+                # Missing values get code -1, i.e. the trailing None added on load
+                list_values[column] = [None if value is None else list(value) for value in uniques]
+                df[column] = codes.astype(np.int32)
+        save_mapped(df, os.path.join(path, ROWS_DIR), exact_dtypes=True)
+
+        filter_info, filter_arrays = snapshot.filter_index.to_state()
+        city_info, city_arrays = snapshot.city_summary.to_state()
+        arrays = {f"filter/{name}": values for name, values in filter_arrays.items()}
+        arrays.update({f"city/{name}": values for name, values in city_arrays.items()})
+        np.savez(os.path.join(path, ARRAYS_FILE), **arrays)
+
+        state = {
+            'interests': snapshot.interest_encoder.interests,
+            'filter_index': filter_info,
+            'city_summary': city_info,
+            'timings': snapshot.timings,
+            'list_values': list_values,
+            'analytics': _exact_json(analytics),
+            'memory_report': _exact_json(memory_report) or {},
+        }
+        with open(os.path.join(path, STATE_FILE), 'w', encoding='utf-8') as f:
+            json.dump(state, f, default=_json_scalar)
+
+        files = {}
+        for root, _, names in os.walk(path):
+            for name in names:
+                full = os.path.join(root, name)
+                files[os.path.relpath(full, path)] = os.path.getsize(full)
+        manifest = {
+            'key': os.path.basename(self.entry_path()),
+            'format': STATE_FORMAT_VERSION,
+            'source': self.source,
+            'rows': len(df),
+            'digests': {name: _file_digest(os.path.join(path, name)) for name in (STATE_FILE, ARRAYS_FILE)},
+            'files': files,
+        }
+        with open(os.path.join(path, ENTRY_MANIFEST), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+
+    def _read_sources(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(os.path.join(self.cache_dir, SOURCES_INDEX), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _record_source(self):
+        """
+        Remember this source's fingerprint and entry
+
+        The entry previously recorded for the source is deleted when no
+        other source uses it (the dataset changed since it was written).
+        """
+        fingerprint = self.fingerprint()
+        sources = self._read_sources()
+        record = {
+            'size': fingerprint.size,
+            'mtime_ns': fingerprint.mtime_ns,
+            'content_hash': fingerprint.content_hash,
+            'key': fingerprint.key,
+        }
+        if sources.get(self.source) == record:
+            return
+        previous = sources.get(self.source, {}).get('key')
+        sources[self.source] = record
+        if previous and previous != fingerprint.key and all(
+            entry.get('key') != previous for entry in sources.values()
+        ):
+            shutil.rmtree(os.path.join(self.cache_dir, previous), ignore_errors=True)
+
+        try:
+            fd, tmp = tempfile.mkstemp(prefix='.tmp-', dir=self.cache_dir)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(sources, f, indent=1)
+            os.replace(tmp, os.path.join(self.cache_dir, SOURCES_INDEX))
+        except OSError as e:
+            warnings.warn(f"Could not update engine state cache index: {e}")
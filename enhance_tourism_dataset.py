@@ -0,0 +1,200 @@
+"""
+Tourism Dataset Enhancement Script
+===================================
+
+Expands the 5-city dataset to 50+ cities with proper geographic hierarchy:
+- Continent → Country → State/Region → City
+
+Adds realistic tourism data for major destinations worldwide.
+
+Importable pipeline: enhance_dataset() reads the original dataset,
+generates the expanded one (see dataset_generator), streams it to CSV
+plus a columnar copy (Parquet, or a memory-mapped .columns directory
+without pyarrow), and returns statistics gathered while writing.
+
+Usage: python enhance_tourism_dataset.py [--input CSV] [--output CSV]
+           [--seed SEED] [--tourists N] [--no-columnar] [--quiet]
+"""
+
+import argparse
+import os
+import pandas as pd
+from typing import Any, Dict, List, Optional
+
+from dataset_generator import CITY_DATABASE, iter_expanded_dataset, tourist_profiles
+from dataset_store import (
+    ENGINE_COLUMNS, HAS_PYARROW, apply_dtype_schema, columnar_path, concat_datasets,
+    print_progress, save_mapped, write_dataset_stream
+)
+
+DEFAULT_INPUT_PATH = '/mnt/user-data/uploads/master_clean_tourism_dataset_v1.csv'
+DEFAULT_OUTPUT_PATH = '/mnt/user-data/outputs/master_tourism_dataset_v2_enhanced.csv'
+
+# Random seed: the same seed reproduces the same dataset byte for byte
+SEED = 42
+
+# Columns of the geographic hierarchy counted while writing
+GEOGRAPHY_COLUMNS = ['Continent', 'country', 'city']
+
+
+class GeographyStatistics:
+    """Record counts per continent/country/city accumulated chunk by chunk"""
+
+    def __init__(self):
+        self._counts = []
+
+    def add(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Count one chunk (one groupby pass) and return it unchanged"""
+        self._counts.append(df.groupby(GEOGRAPHY_COLUMNS, observed=True).size())
+        return df
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals, cities per continent and records per city"""
+        if not self._counts:
+            return {'records': 0, 'cities': 0, 'countries': 0, 'continents': 0,
+                    'cities_by_continent': {}, 'city_records': pd.DataFrame()}
+
+        counts = pd.concat(self._counts).groupby(level=GEOGRAPHY_COLUMNS, observed=True).sum()
+        cities = counts.reset_index(name='records')
+        return {
+            'records': int(cities['records'].sum()),
+            'cities': cities['city'].nunique(),
+            'countries': cities['country'].nunique(),
+            'continents': cities['Continent'].nunique(),
+            'cities_by_continent': cities.groupby('Continent', observed=True)['city'].nunique().to_dict(),
+            'city_records': cities[['city', 'country', 'records']].sort_values('city', ignore_index=True),
+        }
+
+
+class EngineColumns:
+    """Blocks projected to the engine's columns and compact dtypes, for the mapped copy"""
+
+    def __init__(self):
+        self._blocks: List[pd.DataFrame] = []
+
+    def add(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Keep the engine columns of one block and return it unchanged"""
+        columns = {column: df[column] for column in ENGINE_COLUMNS if column in df.columns}
+        self._blocks.append(apply_dtype_schema(pd.DataFrame(columns, copy=False)))
+        return df
+
+    def save(self, output_dir: str) -> str:
+        """Write the kept blocks as a memory-mapped .columns directory"""
+        return save_mapped(concat_datasets(self._blocks), output_dir)
+
+
+def enhance_dataset(
+    input_path: str = DEFAULT_INPUT_PATH,
+    output_path: str = DEFAULT_OUTPUT_PATH,
+    seed: int = SEED,
+    num_tourists: Optional[int] = None,
+    columnar: bool = True,
+    verbose: bool = True
+) -> Dict[str, Any]:
+    """
+    Generate the enhanced multi-city dataset
+
+    Args:
+        input_path: Original dataset (one or more records per tourist)
+        output_path: Enhanced CSV to write
+        seed: Random seed
+        num_tourists: Tourists to generate (default: one per original tourist)
+        columnar: Also write a columnar copy next to the CSV for fast
+            loading: Parquet streamed from the same chunks, or without
+            pyarrow a memory-mapped .columns directory of the engine's
+            columns (held in memory in compact form until the CSV is done)
+        verbose: Print progress and statistics
+
+    Returns:
+        Output paths, write statistics and geography statistics
+    """
+    df_original = pd.read_csv(input_path)
+    if verbose:
+        print(f"✓ Original: {len(df_original):,} records, {df_original['city'].nunique()} cities")
+        print(f"✓ Geographic database: {len(CITY_DATABASE)} cities across "
+              f"{len(set(c['continent'] for c in CITY_DATABASE.values()))} continents\n")
+        print("Generating expanded dataset...")
+
+    # One profile per tourist; each visits 1-3 cities and 1-2 sites per city
+    statistics = GeographyStatistics()
+    blocks = (statistics.add(block) for block in
+              iter_expanded_dataset(tourist_profiles(df_original), seed, num_tourists))
+
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    outputs = [output_path]
+    columnar_output_path = None
+    engine_columns = None
+    if columnar and HAS_PYARROW:
+        # Parquet row groups are written from the same chunks as the CSV
+        columnar_output_path = columnar_path(output_path)
+        outputs.append(columnar_output_path)
+    elif columnar:
+        # The .npz format needs the whole raw frame; the compact engine
+        # columns are a fraction of it
+        engine_columns = EngineColumns()
+        blocks = (engine_columns.add(block) for block in blocks)
+    written = write_dataset_stream(blocks, outputs, progress=print_progress if verbose else None)
+    if engine_columns is not None:
+        columnar_output_path = engine_columns.save(os.path.splitext(output_path)[0] + '.columns')
+
+    return {
+        'output_path': output_path,
+        'columnar_path': columnar_output_path,
+        'write': written,
+        'statistics': statistics.summary(),
+    }
+
+
+def print_statistics(result: Dict[str, Any]):
+    """Print the summary of an enhance_dataset run"""
+    stats = result['statistics']
+    print(f"\n✅ Enhanced dataset saved!")
+    print(f"   File: {result['output_path']}")
+    if result['columnar_path']:
+        print(f"   Columnar: {result['columnar_path']}")
+    print(f"   Records: {stats['records']:,}")
+    print(f"   Cities: {stats['cities']}")
+    print(f"   Countries: {stats['countries']}")
+    print(f"   Continents: {stats['continents']}")
+
+    print(f"\n📊 Geographic Distribution:")
+    print(f"   Continents: {sorted(stats['cities_by_continent'])}")
+    print(f"\n   Cities by Continent:")
+    for continent, cities in sorted(stats['cities_by_continent'].items()):
+        print(f"     {continent}: {cities} cities")
+
+    print(f"\n   Sample cities:")
+    for row in stats['city_records'].head(10).itertuples(index=False):
+        print(f"     {row.city}, {row.country}: {row.records} records")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the enhanced multi-city tourism dataset")
+    parser.add_argument('--input', default=DEFAULT_INPUT_PATH, help='original dataset CSV')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH, help='enhanced dataset CSV')
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--tourists', type=int, help='tourists to generate (default: one per original tourist)')
+    parser.add_argument('--no-columnar', action='store_true', help='skip the columnar copy')
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args()
+
+    verbose = not args.quiet
+    if verbose:
+        print("=" * 80)
+        print("TOURISM DATASET ENHANCEMENT")
+        print("=" * 80 + "\n")
+        print(f"Loading original dataset ({os.path.basename(args.input)})...")
+
+    result = enhance_dataset(
+        args.input, args.output, args.seed, args.tourists, not args.no_columnar, verbose
+    )
+
+    if verbose:
+        print_statistics(result)
+        print("\n" + "=" * 80)
+        print("✅ DATASET ENHANCEMENT COMPLETE!")
+        print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+Stage Timing Instrumentation
+============================
+
+Structured timing and progress events for the engine, chatbot and PDF
+generator, replacing per-call prints to stdout:
+- Stable stage names (load, prepare, append, filter, score, select,
+  schedule, recommendations, pdf_build) for dashboards and p99 alerts
+- Per-stage counters and latency percentiles kept in memory
+- Pluggable hooks receiving every event (metrics exporters, loggers)
+- Console progress messages only when printing is enabled
+
+Dependencies: none (standard library only)
+"""
+
+import contextlib
+import functools
+import threading
+import time
+import warnings
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+# Stage names (stable: used as metric names)
+STAGE_LOAD = 'load'
+STAGE_PREPARE = 'prepare'
+STAGE_APPEND = 'append'
+STAGE_FILTER = 'filter'
+STAGE_SCORE = 'score'
+STAGE_SELECT = 'select'
+STAGE_SCHEDULE = 'schedule'
+STAGE_RECOMMENDATIONS = 'recommendations'
+STAGE_PDF_BUILD = 'pdf_build'
+
+STAGES = [
+    STAGE_LOAD, STAGE_PREPARE, STAGE_APPEND, STAGE_FILTER, STAGE_SCORE, STAGE_SELECT,
+    STAGE_SCHEDULE, STAGE_RECOMMENDATIONS, STAGE_PDF_BUILD
+]
+
+# Event names for completed operations (no duration of their own)
+EVENT_ITINERARY = 'itinerary_generated'
+EVENT_HISTORY_CLEARED = 'chat_history_cleared'
+
+# Durations kept per stage for percentiles
+LATENCY_WINDOW = 1024
+
+# Console messages shown when printing is enabled
+_MESSAGES: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    STAGE_LOAD: lambda a: (
+        f"✓ Loaded {a['records']:,} records{' from state cache' if a.get('state_cache_hit') else ''} "
+        f"in {a['duration_ms']:.0f} ms\n"
+        f"✓ Memory: {a['memory_before_mb']:.1f} MB → {a['memory_after_mb']:.1f} MB"
+    ),
+    STAGE_PREPARE: lambda a: f"✓ Prepared dataset in {a['duration_ms']:.1f} ms",
+    STAGE_APPEND: lambda a: (
+        f"✓ Appended {a['records']:,} records in {a['duration_ms']:.1f} ms ({a['total_records']:,} total)"
+    ),
+    STAGE_PDF_BUILD: lambda a: f"✓ PDF generated: {a['output']}",
+    EVENT_ITINERARY: lambda a: (
+        f"✓ Generated {a['days']}-day itinerary\n"
+        f"✓ Total cost: ${a['total_cost']:,.2f}\n"
+        f"✓ Cities: {', '.join(a['cities'])}"
+    ),
+    EVENT_HISTORY_CLEARED: lambda a: "🗑️ Conversation history cleared",
+}
+
+
+@dataclass
+class InstrumentationEvent:
+    """A timed stage or a completed operation"""
+    name: str
+    duration_ms: Optional[float] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = field(default_factory=time.time)
+
+
+class StageMetrics:
+    """Call count and latency distribution of one stage"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.recent: Deque[float] = deque(maxlen=window)
+
+    def record(self, duration_ms: float):
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.recent.append(duration_ms)
+
+    def percentile(self, q: float) -> float:
+        """Latency percentile (0-100) over the recent window"""
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ms / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(50),
+            'p99_ms': self.percentile(99),
+            'max_ms': self.max_ms,
+        }
+
+
+class Instrumentation:
+    """
+    Collects stage timings and events and forwards them to hooks
+
+    Timings are always aggregated in memory (see ``metrics()``); hooks
+    are called synchronously for every event, so they should be cheap
+    (e.g. increment a counter or enqueue for an exporter).
+    """
+
+    def __init__(self, print_events: bool = False):
+        """
+        Args:
+            print_events: Print progress messages to stdout
+        """
+        self.print_events = print_events
+        self.hooks: List[Callable[[InstrumentationEvent], None]] = []
+        self.counters: Dict[str, int] = {}
+        self._stages: Dict[str, StageMetrics] = {}
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook: Callable[[InstrumentationEvent], None]):
+        """Call ``hook`` with every event"""
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[InstrumentationEvent], None]):
+        """Stop calling ``hook``"""
+        self.hooks.remove(hook)
+
+    @contextlib.contextmanager
+    def stage(self, name: str, **attributes) -> Iterator[Dict[str, Any]]:
+        """
+        Time a block as stage ``name``
+
+        Yields the event attributes, so the block can add details
+        (e.g. row counts) that hooks receive with the timing.
+        """
+        start = time.perf_counter()
+        try:
+            yield attributes
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000, **attributes)
+
+    def record(self, name: str, duration_ms: float, **attributes):
+        """Record an externally measured stage duration"""
+        with self._lock:
+            metrics = self._stages.get(name)
+            if metrics is None:
+                metrics = self._stages[name] = StageMetrics()
+            metrics.record(duration_ms)
+        self._emit(InstrumentationEvent(name, duration_ms, attributes))
+
+    def event(self, name: str, **attributes):
+        """Record a completed operation"""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + 1
+        self._emit(InstrumentationEvent(name, None, attributes))
+
+    def _emit(self, event: InstrumentationEvent):
+        if self.print_events and event.name in _MESSAGES:
+            attributes = dict(event.attributes, duration_ms=event.duration_ms)
+            try:
+                print(_MESSAGES[event.name](attributes))
+            except KeyError:
+                pass
+        for hook in list(self.hooks):
+            try:
+                hook(event)
+            except Exception as e:
+                warnings.warn(f"Instrumentation hook failed for {event.name}: {e}")
+
+    def metrics(self) -> Dict[str, Any]:
+        """Per-stage latency summaries and event counters"""
+        with self._lock:
+            return {
+                'stages': {name: metrics.as_dict() for name, metrics in self._stages.items()},
+                'events': dict(self.counters),
+            }
+
+    def reset(self):
+        """Clear all collected metrics (hooks are kept)"""
+        with self._lock:
+            self._stages.clear()
+            self.counters.clear()
+
+
+_default = Instrumentation()
+
+
+def get_instrumentation() -> Instrumentation:
+    """Process-wide instrumentation used unless a component is given its own"""
+    return _default
+
+
+def set_instrumentation(instrumentation: Instrumentation):
+    """Replace the process-wide instrumentation"""
+    global _default
+    _default = instrumentation
+
+
+def timed_stage(name: str) -> Callable:
+    """
+    Time every call of a method as stage ``name``
+
+    The owning object must provide an ``instrumentation`` attribute.
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.instrumentation.stage(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
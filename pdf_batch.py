@@ -0,0 +1,247 @@
+"""
+Bulk PDF Itinerary Generation
+=============================
+
+Renders many itinerary PDFs across a process pool (ReportLab layout is
+CPU-bound and holds the GIL, so threads do not help):
+- Itineraries consumed lazily from any iterable; at most `max_pending`
+  documents are queued or held in memory at once (backpressure)
+- Results yielded as they complete, each with its render time and size
+- Output to a directory (workers write the files themselves) or into a
+  ZIP archive written to a path or any binary stream
+- A failing itinerary is reported in its result without stopping the batch
+
+Dependencies: reportlab (see pdf_generator)
+"""
+
+import os
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from instrumentation import STAGE_PDF_BUILD, Instrumentation, get_instrumentation
+
+# Documents queued per worker when max_pending is not given
+PENDING_PER_WORKER = 2
+
+
+@dataclass
+class RenderedPDF:
+    """Outcome of rendering one itinerary of a batch"""
+    index: int
+    filename: str
+    render_ms: float
+    size_bytes: int = 0
+    data: Optional[bytes] = None
+    path: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def default_filename(index: int, itinerary: Dict[str, Any]) -> str:
+    """itinerary_0001.pdf, itinerary_0002.pdf, ... in input order"""
+    return f"itinerary_{index + 1:04d}.pdf"
+
+
+def _render(index: int, filename: str, itinerary: Dict[str, Any], output_dir: Optional[str]) -> RenderedPDF:
+    """Render one itinerary in a worker: to ``output_dir`` if given, else to bytes"""
+    start = time.perf_counter()
+    try:
+        from pdf_generator import get_pdf_generator
+        generator = get_pdf_generator()
+        if output_dir is None:
+            data, path = generator.render_itinerary_pdf(itinerary), None
+            size = len(data)
+        else:
+            data, path = None, os.path.join(output_dir, filename)
+            generator.generate_itinerary_pdf(itinerary, path)
+            size = os.path.getsize(path)
+    except Exception as e:
+        return RenderedPDF(index, filename, (time.perf_counter() - start) * 1000,
+                           error=f"{type(e).__name__}: {e}")
+    return RenderedPDF(index, filename, (time.perf_counter() - start) * 1000, size, data, path)
+
+
+def _collect(future: Future, index: int, filename: str) -> RenderedPDF:
+    """Result of a finished document, or a failed one if the pool could not render it"""
+    try:
+        return future.result()
+    except Exception as e:
+        # e.g. an itinerary that cannot be pickled, or a crashed worker
+        return RenderedPDF(index, filename, 0.0, error=f"{type(e).__name__}: {e}")
+
+
+def _init_worker():
+    """Build the shared styles once per worker, before the first document"""
+    from pdf_generator import get_pdf_generator
+    get_pdf_generator()
+
+
+def render_itineraries(
+    itineraries: Iterable[Dict[str, Any]],
+    workers: Optional[int] = None,
+    max_pending: Optional[int] = None,
+    output_dir: Optional[str] = None,
+    filename: Callable[[int, Dict[str, Any]], str] = default_filename,
+    instrumentation: Optional[Instrumentation] = None
+) -> Iterator[RenderedPDF]:
+    """
+    Render itinerary PDFs in a process pool, yielding them as they complete
+
+    Args:
+        itineraries: Itinerary dictionaries from the backend engine (read
+            lazily, so a generator of any length is fine)
+        workers: Worker processes (defaults to the CPU count)
+        max_pending: Documents submitted but not yet consumed; the input
+            is not read further until results are taken (defaults to
+            PENDING_PER_WORKER per worker)
+        output_dir: Write PDFs into this directory instead of returning
+            their bytes
+        filename: File name for (index, itinerary)
+        instrumentation: Receiver of per-document pdf_build timings
+            (process-wide default if omitted)
+
+    Yields:
+        One RenderedPDF per itinerary, in completion order (use .index to
+        restore input order)
+    """
+    instrumentation = instrumentation or get_instrumentation()
+    workers = workers or os.cpu_count() or 1
+    max_pending = max(1, max_pending or PENDING_PER_WORKER * workers)
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+
+    documents = iter(enumerate(itineraries))
+    # Index and file name of every submitted document, to report failures
+    pending: Dict[Future, Tuple[int, str]] = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        def submit(count: int):
+            for index, itinerary in documents:
+                name = filename(index, itinerary)
+                try:
+                    future = pool.submit(_render, index, name, itinerary, output_dir)
+                except Exception as e:
+                    # Broken pool: report the document like any other failure
+                    future = Future()
+                    future.set_exception(e)
+                pending[future] = (index, name)
+                count -= 1
+                if count == 0:
+                    return
+
+        try:
+            submit(max_pending)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                results = [_collect(future, *pending.pop(future)) for future in done]
+                for result in sorted(results, key=lambda result: result.index):
+                    instrumentation.record(
+                        STAGE_PDF_BUILD, result.render_ms,
+                        output=result.path or result.filename, batch=True, ok=result.ok
+                    )
+                    yield result
+                    # Refill only after the consumer took a result
+                    submit(1)
+        finally:
+            # Consumer stopped early: drop queued documents instead of rendering them
+            for future in pending:
+                future.cancel()
+
+
+def write_pdf_directory(
+    itineraries: Iterable[Dict[str, Any]],
+    output_dir: str,
+    workers: Optional[int] = None,
+    max_pending: Optional[int] = None,
+    filename: Callable[[int, Dict[str, Any]], str] = default_filename,
+    progress: Optional[Callable[[RenderedPDF], None]] = None
+) -> Dict[str, Any]:
+    """
+    Render itinerary PDFs into a directory
+
+    Args:
+        itineraries: Itinerary dictionaries
+        output_dir: Destination directory (created if missing)
+        workers: Worker processes (defaults to the CPU count)
+        max_pending: See render_itineraries
+        filename: File name for (index, itinerary)
+        progress: Called with every result as it completes
+
+    Returns:
+        Batch summary (see summarize_batch)
+    """
+    start = time.perf_counter()
+    results = []
+    for result in render_itineraries(itineraries, workers, max_pending, output_dir, filename):
+        results.append(result)
+        if progress:
+            progress(result)
+    return summarize_batch(results, time.perf_counter() - start)
+
+
+def write_pdf_zip(
+    itineraries: Iterable[Dict[str, Any]],
+    output: Union[str, BinaryIO],
+    workers: Optional[int] = None,
+    max_pending: Optional[int] = None,
+    filename: Callable[[int, Dict[str, Any]], str] = default_filename,
+    progress: Optional[Callable[[RenderedPDF], None]] = None
+) -> Dict[str, Any]:
+    """
+    Render itinerary PDFs into a ZIP archive as they complete
+
+    Each PDF is added to the archive and released as soon as it arrives,
+    so memory holds at most ``max_pending`` documents. The stream does
+    not need to be seekable (e.g. an HTTP response body).
+
+    Args:
+        itineraries: Itinerary dictionaries
+        output: ZIP file path or writable binary stream
+        workers: Worker processes (defaults to the CPU count)
+        max_pending: See render_itineraries
+        filename: Archive member name for (index, itinerary)
+        progress: Called with every result as it completes
+
+    Returns:
+        Batch summary (see summarize_batch); failed documents are listed
+        there and left out of the archive
+    """
+    start = time.perf_counter()
+    results = []
+    # PDF content is already compressed, so members are stored as-is
+    with zipfile.ZipFile(output, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for result in render_itineraries(itineraries, workers, max_pending, None, filename):
+            if result.ok:
+                archive.writestr(result.filename, result.data)
+                result.data = None
+            results.append(result)
+            if progress:
+                progress(result)
+    return summarize_batch(results, time.perf_counter() - start)
+
+
+def summarize_batch(results: Iterable[RenderedPDF], seconds: float) -> Dict[str, Any]:
+    """Document counts, throughput, render-time percentiles and failures"""
+    results = sorted(results, key=lambda result: result.index)
+    times = sorted(result.render_ms for result in results if result.ok)
+
+    def percentile(q: float) -> float:
+        return times[min(len(times) - 1, int(q / 100 * len(times)))] if times else 0.0
+
+    return {
+        'documents': len(results),
+        'failed': [{'index': r.index, 'filename': r.filename, 'error': r.error} for r in results if not r.ok],
+        'bytes': sum(result.size_bytes for result in results),
+        'seconds': seconds,
+        'documents_per_second': len(results) / seconds if seconds else 0.0,
+        'render_ms': {'p50': percentile(50), 'p95': percentile(95), 'max': times[-1] if times else 0.0},
+        'documents_detail': [
+            {'index': r.index, 'filename': r.filename, 'render_ms': r.render_ms, 'size_bytes': r.size_bytes}
+            for r in results if r.ok
+        ],
+    }
@@ -0,0 +1,240 @@
+"""
+PDF Itinerary Caching
+=====================
+
+Content-addressed cache in front of PDFItineraryGenerator, so repeated
+"Download PDF Itinerary" clicks do not re-render the same document:
+- Key: BLAKE2b hash of the canonical JSON of the itinerary plus the
+  "Generated on" date, so a cached PDF shows exactly what a fresh render
+  on the same day would and entries roll over at midnight
+- Memory tier: bounded LRU (engine_cache.LRUCache)
+- Optional disk tier shared by processes: one <key>.pdf file per entry,
+  least recently used files evicted once the directory exceeds its size
+  budget
+- Hit/miss/eviction counters per tier
+
+The disk tier is enabled by the TOURISM_PDF_CACHE_DIR environment
+variable (unset or empty keeps the cache in memory only).
+
+Dependencies: none (standard library only; rendering is passed in)
+"""
+
+import functools
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import warnings
+from datetime import date
+from typing import Any, Callable, Dict, Optional
+
+from engine_cache import CacheStats, LRUCache
+
+# Defaults for the in-memory tier (entries) and the disk tier (bytes)
+PDF_CACHE_SIZE = 64
+PDF_DISK_CACHE_BYTES = 256 * 1024 * 1024
+
+PDF_CACHE_DIR_ENV = 'TOURISM_PDF_CACHE_DIR'
+PDF_SUFFIX = '.pdf'
+
+
+def pdf_cache_key(itinerary: Dict[str, Any], generated_on: date) -> str:
+    """
+    Stable key of the PDF for an itinerary rendered on ``generated_on``
+
+    Key order does not matter; values JSON cannot encode (dates, numpy
+    scalars) are keyed by their string form.
+    """
+    payload = json.dumps(
+        [generated_on.isoformat(), itinerary],
+        sort_keys=True, separators=(',', ':'), default=str
+    )
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class DiskPDFCache:
+    """PDF files in a directory, bounded by total size"""
+
+    def __init__(self, directory: str, max_bytes: int = PDF_DISK_CACHE_BYTES):
+        """
+        Args:
+            directory: Directory holding the cached PDFs (created if missing)
+            max_bytes: Size budget; least recently used files beyond it are removed
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._bytes = sum(size for _, _, size in self._entries())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + PDF_SUFFIX)
+
+    def _entries(self):
+        """(last use, path, size) of every cached file"""
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(PDF_SUFFIX) and entry.is_file():
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                yield stat.st_mtime_ns, entry.path, stat.st_size
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Cached PDF for ``key``, or None (counted as a miss)"""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            # Modification time doubles as last use for eviction
+            os.utime(path)
+        except OSError:
+            data = None
+        with self._lock:
+            if data is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes):
+        """
+        Store a PDF, then evict least recently used files over budget
+
+        Failures (read-only or full disk) only warn.
+        """
+        if len(data) > self.max_bytes:
+            return
+        path = self._path(key)
+        try:
+            # An existing entry for the key is replaced, not added to
+            replaced = os.path.getsize(path)
+        except OSError:
+            replaced = 0
+        try:
+            fd, tmp = tempfile.mkstemp(prefix='.tmp-', dir=self.directory)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError as e:
+            warnings.warn(f"Could not write PDF cache entry {path}: {e}")
+            return
+
+        with self._lock:
+            self._bytes += len(data) - replaced
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Remove least recently used files until the directory fits its budget"""
+        # Rescan: other processes may share the directory
+        entries = sorted(self._entries())
+        self._bytes = sum(size for _, _, size in entries)
+        for _, path, size in entries:
+            if self._bytes <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            self._bytes -= size
+            self.stats.evictions += 1
+
+    def clear(self):
+        """Remove all cached files (counters are kept)"""
+        with self._lock:
+            for _, path, _ in list(self._entries()):
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+            self._bytes = 0
+
+
+class PDFCache:
+    """Memory LRU in front of an optional disk tier"""
+
+    def __init__(self, maxsize: int = PDF_CACHE_SIZE, disk: Optional[DiskPDFCache] = None):
+        """
+        Args:
+            maxsize: PDFs kept in memory (0 disables the memory tier)
+            disk: Disk tier consulted on memory misses
+        """
+        # The date in the key expires entries, so no TTL
+        self.memory = LRUCache(maxsize=maxsize, ttl=None)
+        self.disk = disk
+
+    def get_or_render(
+        self,
+        itinerary: Dict[str, Any],
+        render: Callable[..., bytes],
+        generated_on: Optional[date] = None
+    ) -> bytes:
+        """
+        Cached PDF for an itinerary, rendering and storing it on a miss
+
+        Args:
+            itinerary: Itinerary dictionary from backend engine
+            render: Renderer called as render(itinerary, generated_on=...),
+                e.g. PDFItineraryGenerator.render_itinerary_pdf
+            generated_on: Cover page date (today if omitted)
+
+        Returns:
+            PDF file contents
+        """
+        generated_on = generated_on or date.today()
+        key = pdf_cache_key(itinerary, generated_on)
+
+        data = self.memory.get(key)
+        if data is None and self.disk is not None:
+            data = self.disk.get(key)
+            if data is not None:
+                self.memory.put(key, data)
+        if data is None:
+            data = render(itinerary, generated_on=generated_on)
+            self.memory.put(key, data)
+            if self.disk is not None:
+                self.disk.put(key, data)
+        return data
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters per tier plus the share of requests served without rendering"""
+        memory = self.memory.stats
+        disk = self.disk.stats if self.disk is not None else CacheStats()
+        lookups = memory.hits + memory.misses
+        report = {
+            'memory': {**memory.as_dict(), 'entries': len(self.memory)},
+            'hit_rate': (memory.hits + disk.hits) / lookups if lookups else 0.0,
+        }
+        if self.disk is not None:
+            report['disk'] = {**disk.as_dict(), 'size_bytes': self.disk.size_bytes}
+        return report
+
+    def clear(self):
+        """Drop all cached PDFs (counters are kept)"""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+
+@functools.lru_cache(maxsize=None)
+def get_pdf_cache() -> PDFCache:
+    """Process-wide PDF cache, with a disk tier when TOURISM_PDF_CACHE_DIR is set"""
+    directory = os.environ.get(PDF_CACHE_DIR_ENV)
+    disk = None
+    if directory:
+        try:
+            disk = DiskPDFCache(directory)
+        except OSError as e:
+            warnings.warn(f"PDF disk cache disabled, {directory} is not usable: {e}")
+    return PDFCache(disk=disk)
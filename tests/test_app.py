@@ -0,0 +1,89 @@
+"""Streamlit app smoke tests: deferred imports and page routing"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from pdf_cache import get_pdf_cache
+from synthetic import make_dataset
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, 'app.py')
+DATASET = 'master_tourism_dataset_v2_enhanced.csv'
+DEFERRED = ['tourism_backend_engine', 'chatbot_integration', 'pdf_generator', 'reportlab']
+
+testing = pytest.importorskip('streamlit.testing.v1')
+
+
+def test_import_defers_backend_modules():
+    script = (
+        "import sys, app; "
+        f"print(' '.join(m for m in {DEFERRED!r} if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, '-c', script], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ''
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """App run from a directory holding a small synthetic dataset"""
+    monkeypatch.setenv('TOURISM_STATE_CACHE_DIR', '')
+    make_dataset(500).to_csv(tmp_path / DATASET, index=False)
+    monkeypatch.chdir(tmp_path)
+    return testing.AppTest.from_file(APP, default_timeout=60)
+
+
+def select_page(app, page: str):
+    [radio] = [radio for radio in app.sidebar.radio if page in radio.options]
+    radio.set_value(page).run()
+    assert not app.exception
+
+
+def test_home_page_loads_the_engine(app):
+    app.run()
+
+    assert not app.exception
+    assert app.session_state.backend_engine is not None
+    assert '🌍 AI Cultural Tourism Platform' in [title.value for title in app.title]
+
+
+def test_about_page_returns_before_loading_the_engine(app):
+    app.run()
+    app.session_state.backend_engine = None
+
+    select_page(app, "ℹ️ About")
+
+    assert app.session_state.backend_engine is None
+    assert 'ℹ️ About This Platform' in [title.value for title in app.title]
+
+
+def test_travel_assistant_answers_suggestions(app):
+    app.run()
+    select_page(app, "💬 Travel Assistant")
+
+    app.button[0].click().run()
+
+    assert not app.exception
+    assert [entry['role'] for entry in app.session_state.chat_history] == ['user', 'assistant']
+
+
+def test_pdf_download_is_rendered_in_memory_and_cached(app, tmp_path):
+    cache = get_pdf_cache()
+    cache.clear()
+    hits = cache.stats()['memory']['hits']
+    app.run()
+    select_page(app, "✈️ Plan Your Trip")
+    app.button[0].click().run()
+
+    for _ in range(2):
+        [download] = [button for button in app.button if 'Download PDF' in button.label]
+        download.click().run()
+        assert not app.exception and not app.error
+        assert [button.label for button in app.get('download_button')] == ['⬇️ Download Your Itinerary']
+
+    # The second click is served from the cache; nothing lands on disk
+    assert cache.stats()['memory']['hits'] == hits + 1
+    assert sorted(os.listdir(tmp_path)) == [DATASET]
@@ -0,0 +1,65 @@
+"""Travel chatbot responses and history"""
+
+import pytest
+
+from chatbot_integration import TravelChatbot
+from instrumentation import EVENT_HISTORY_CLEARED, Instrumentation
+from synthetic import make_dataset
+from tourism_backend_engine import TourismBackendEngine
+
+
+@pytest.fixture(scope='module')
+def engine(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('chatbot') / 'dataset.csv')
+    make_dataset(1_000).to_csv(path, index=False)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv('TOURISM_STATE_CACHE_DIR', '')
+        engine = TourismBackendEngine(path)
+        engine.prepare()
+    return engine
+
+
+@pytest.mark.parametrize('message, response_type', [
+    ("Hello!", 'greeting'),
+    ("Can you recommend destinations for art lovers?", 'recommendation'),
+    ("Plan a 5-day itinerary", 'itinerary_planning'),
+    ("What's the average cost per day?", 'cost_info'),
+    ("What are the best summer destinations?", 'season_recommendation'),
+    ("Tell me about UNESCO World Heritage sites", 'unesco_info'),
+    ("What accessibility options are available?", 'accessibility_info'),
+    ("Tell me more", 'help'),
+])
+def test_chat_answers_from_the_engine(engine, message, response_type):
+    response = TravelChatbot(engine).chat(message)
+    assert response['type'] == response_type
+    assert response['message']
+
+
+def test_answers_use_engine_data(engine):
+    chatbot = TravelChatbot(engine)
+
+    recommended = chatbot.chat("Can you recommend destinations for art lovers?")
+    assert recommended['data']['cities'] == engine.cities[:3]
+
+    cost = chatbot.chat("What's the average cost per day?")
+    assert cost['data']['avg_cost'] == engine.get_analytics()['cost_analysis']['avg_daily_cost_usd']
+
+    seasonal = chatbot.chat("What are the best summer destinations?")
+    cities = [rec['city'] for rec in seasonal['data']['recommendations']]
+    assert len(cities) == 3 and all(city in seasonal['message'] for city in cities)
+
+
+def test_history_and_clear_event(engine):
+    engine.instrumentation = Instrumentation()
+    chatbot = TravelChatbot(engine)
+    chatbot.chat("Hello!")
+    chatbot.chat("Plan a 5-day itinerary")
+
+    history = chatbot.get_conversation_history()
+    assert [entry['role'] for entry in history] == ['user', 'assistant'] * 2
+    assert history[2]['content'] == "Plan a 5-day itinerary"
+
+    chatbot.clear_history()
+
+    assert chatbot.get_conversation_history() == []
+    assert engine.instrumentation.metrics()['events'] == {EVENT_HISTORY_CLEARED: 1}
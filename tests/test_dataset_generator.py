@@ -0,0 +1,49 @@
+"""Expanded dataset generation"""
+
+import pandas as pd
+import pytest
+
+from dataset_generator import generate_expanded_dataset, iter_expanded_dataset, tourist_profiles
+from dataset_store import rechunk, write_dataset_stream
+from synthetic import make_dataset
+
+
+def profiles() -> pd.DataFrame:
+    return tourist_profiles(make_dataset(300))
+
+
+def test_same_seed_same_dataset():
+    first = generate_expanded_dataset(profiles(), seed=7, num_tourists=50)
+    pd.testing.assert_frame_equal(first, generate_expanded_dataset(profiles(), seed=7, num_tourists=50))
+    assert first['Tourist ID'].between(1, 50).all()
+
+
+def test_no_tourists_gives_empty_frame_with_columns():
+    expected = generate_expanded_dataset(profiles(), num_tourists=5)
+    empty = generate_expanded_dataset(profiles(), num_tourists=0)
+
+    assert empty.empty
+    assert list(empty.columns) == list(expected.columns)
+    assert len(list(iter_expanded_dataset(profiles(), num_tourists=0))) == 1
+
+
+def test_streaming_no_tourists_writes_header_only_csv(tmp_path):
+    path = tmp_path / 'empty.csv'
+    frames = iter_expanded_dataset(profiles(), num_tourists=0)
+
+    stats = write_dataset_stream(frames, str(path), chunk_rows=100)
+
+    expected = generate_expanded_dataset(profiles(), num_tourists=5)
+    assert stats['rows'] == 0
+    assert path.read_text().splitlines()[1:] == []
+    assert list(pd.read_csv(path).columns) == list(expected.columns)
+
+
+def test_rechunk_rejects_non_positive_chunk_rows():
+    with pytest.raises(ValueError):
+        list(rechunk(iter_expanded_dataset(profiles(), num_tourists=5), 0))
+
+
+def test_tourists_without_profiles_rejected():
+    with pytest.raises(ValueError, match='without any tourist profiles'):
+        next(iter_expanded_dataset(profiles().iloc[:0], num_tourists=10))
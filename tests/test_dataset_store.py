@@ -0,0 +1,96 @@
+"""Columnar and memory-mapped dataset round trips"""
+
+import numpy as np
+import pandas as pd
+
+from dataset_store import compact_dataset, load_mapped, save_mapped, write_dataset_stream
+from engine_scoring import InterestEncoder, compute_destination_scores
+from synthetic import make_dataset
+
+
+def is_memory_mapped(array) -> bool:
+    """Whether ``array`` is a view of a np.memmap"""
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = getattr(array, 'base', None)
+    return False
+
+
+def test_mapped_categories_keep_their_type(tmp_path):
+    df = pd.DataFrame({
+        'numbers': pd.Categorical([3, 1, 3, 3]),
+        'flags': pd.Categorical([True, False, True, True]),
+        'dates': pd.Categorical(pd.to_datetime(['2024-01-01', '2024-06-01', '2024-01-01', '2024-01-01'])),
+        'sizes': pd.Categorical(['S', 'L', 'S', 'M'], categories=['S', 'M', 'L'], ordered=True),
+        'mixed': pd.Series([1, 'one', 1, 1], dtype=object),
+    })
+    loaded = load_mapped(save_mapped(df, str(tmp_path / 'data.columns')))
+
+    for column in ['numbers', 'flags', 'dates', 'sizes']:
+        assert loaded[column].dtype == df[column].dtype, column
+        assert loaded[column].tolist() == df[column].tolist(), column
+    assert list(loaded['mixed'].cat.categories) == [1, 'one']
+    assert loaded['mixed'].astype(object).tolist() == df['mixed'].tolist()
+
+
+def test_mapped_categorical_codes_stay_memory_mapped(tmp_path):
+    df = pd.DataFrame({
+        'city': pd.Categorical(['Paris', 'Rome'] * 50),
+        'rating': np.linspace(1, 5, 100, dtype=np.float32),
+    })
+    loaded = load_mapped(save_mapped(df, str(tmp_path / 'data.columns')))
+
+    assert is_memory_mapped(loaded['city'].array.codes)
+    assert is_memory_mapped(loaded['rating'].to_numpy())
+
+
+def test_compact_keeps_mapped_columns_mapped(tmp_path):
+    source = pd.DataFrame({
+        'city': pd.Categorical(['Paris', 'Rome'] * 50),
+        'Satisfaction': np.linspace(1, 5, 100, dtype=np.float32),
+        'avg_cost_usd': np.linspace(10, 500, 100),
+        'unused': np.arange(100),
+    })
+    loaded = load_mapped(save_mapped(source, str(tmp_path / 'data.columns')))
+    df, report = compact_dataset(loaded)
+
+    assert list(df.columns) == ['city', 'avg_cost_usd', 'Satisfaction']
+    assert report['dropped_columns'] == ['unused']
+    assert is_memory_mapped(df['city'].array.codes)
+    assert is_memory_mapped(df['Satisfaction'].to_numpy())
+    assert is_memory_mapped(df['avg_cost_usd'].to_numpy())
+
+
+def test_compact_converts_only_differing_dtypes():
+    source = pd.DataFrame({'Age': np.array([30, 40], dtype=np.int64), 'Satisfaction': np.array([3.0, 4.0])})
+    df, _ = compact_dataset(source)
+
+    assert df['Age'].dtype == np.int8
+    assert df['Satisfaction'].dtype == np.float32
+    # The input frame is left as it was
+    assert source['Age'].dtype == np.int64
+
+
+def test_compact_dataset_scores_like_the_csv():
+    source = make_dataset(2_000)
+    df, _ = compact_dataset(source)
+
+    def final_scores(frame):
+        encoder = InterestEncoder()
+        masks = encoder.encode_column(frame['Interests'])
+        return compute_destination_scores(frame, masks, encoder.encode(['Art', 'Nature']), 2)['final_score']
+
+    np.testing.assert_array_equal(final_scores(df), final_scores(source))
+
+
+def test_streamed_csv_reads_back_like_to_csv(tmp_path):
+    df = make_dataset(1_000)
+    df.loc[3, 'Avg Rating'] = np.nan
+    frames = (df.iloc[start:start + 300] for start in range(0, len(df), 300))
+
+    stats = write_dataset_stream(frames, str(tmp_path / 'streamed.csv'), chunk_rows=400)
+    df.to_csv(tmp_path / 'reference.csv', index=False)
+
+    assert (stats['rows'], stats['chunks']) == (1_000, 3)
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / 'streamed.csv'), pd.read_csv(tmp_path / 'reference.csv'))
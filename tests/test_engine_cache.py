@@ -0,0 +1,86 @@
+"""Per-profile result caching"""
+
+import json
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pytest
+
+from engine_cache import LRUCache, cache_by_profile, profile_cache_key, recommendation_cache_key
+
+
+@dataclass
+class Profile:
+    age: int
+    interests: List[str]
+    accessibility_needs: bool = False
+    preferred_duration: int = 3
+    budget_preference: str = 'Budget'
+    climate_preference: Optional[str] = None
+    season_preference: Optional[str] = None
+
+
+class FakeEngine:
+    def __init__(self):
+        self.cache = LRUCache()
+        self.calls = 0
+
+    def get_result_cache(self):
+        return self.cache
+
+    def dataset_version(self):
+        return (0,)
+
+    def recommend(self, tourist_profile, num_recommendations=5):
+        self.calls += 1
+        return {
+            'tourist_profile': {'age': tourist_profile.age, 'interests': list(tourist_profile.interests)},
+            'recommendations': [{'name': 'Louvre', 'tips': ['Book ahead']}],
+        }
+
+    recommend = cache_by_profile(recommend)
+
+    def recommend_sites(self, tourist_profile, num_recommendations=5):
+        self.calls += 1
+        return {'recommendations': [{'name': 'Louvre'}]}
+
+    recommend_sites = cache_by_profile(recommend_sites, recommendation_cache_key)
+
+
+def test_cached_results_are_read_only_and_shared():
+    engine = FakeEngine()
+    first = engine.recommend(Profile(30, ['Art', 'History']))
+    with pytest.raises(TypeError):
+        first['recommendations'][0]['tips'].append('changed')
+    with pytest.raises(TypeError):
+        first['recommendations'].clear()
+    with pytest.raises(TypeError):
+        first['status'] = 'changed'
+
+    second = engine.recommend(Profile(30, ['History', 'Art']))
+    assert engine.calls == 1
+    assert second['recommendations'] == [{'name': 'Louvre', 'tips': ['Book ahead']}]
+    # Only the echoed profile is rebuilt per caller
+    assert second['recommendations'] is first['recommendations']
+    assert second['tourist_profile']['interests'] == ['History', 'Art']
+    assert first['tourist_profile']['interests'] == ['Art', 'History']
+    assert json.loads(json.dumps(second))['recommendations'] == [{'name': 'Louvre', 'tips': ['Book ahead']}]
+
+
+def test_recommendation_key_ignores_fields_recommendations_do_not_read():
+    engine = FakeEngine()
+    engine.recommend_sites(Profile(30, ['Art'], accessibility_needs=False, preferred_duration=3))
+    engine.recommend_sites(Profile(70, ['Art'], accessibility_needs=True, preferred_duration=10))
+    assert engine.calls == 1
+    assert engine.cache.stats.hits == 1
+
+    engine.recommend_sites(Profile(30, ['Art'], budget_preference='Luxury'))
+    assert engine.calls == 2
+
+
+def test_age_is_part_of_the_key():
+    engine = FakeEngine()
+    assert engine.recommend(Profile(30, ['Art']))['tourist_profile']['age'] == 30
+    assert engine.recommend(Profile(70, ['Art']))['tourist_profile']['age'] == 70
+    assert engine.calls == 2
+    assert profile_cache_key(Profile(30, ['Art', 'Food'])) == profile_cache_key(Profile(30, ['Food', 'Art']))
@@ -0,0 +1,102 @@
+"""Engine load path, ranking, batches and dataset snapshots"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataset_store import save_columnar
+from engine_cache import cache_by_profile
+from engine_core import EngineCore, TouristProfile
+from engine_index import pin_snapshot
+from synthetic import make_dataset
+from test_dataset_store import is_memory_mapped
+
+
+class ItineraryEngine(EngineCore):
+    """Engine whose itineraries are the best distinct sites for the trip length"""
+
+    def generate_itinerary(self, tourist_profile, start_date=None):
+        scored = self._score_destinations(self._filter_by_preferences(tourist_profile), tourist_profile)
+        top = self._rank_destinations(scored, tourist_profile.preferred_duration, distinct='Site Name')
+        return {
+            'start_date': start_date,
+            'sites': top['Site Name'].tolist(),
+            'scores': top['final_score'].tolist(),
+        }
+
+    generate_itinerary = pin_snapshot(cache_by_profile(generate_itinerary))
+
+
+@pytest.fixture
+def no_state_cache(monkeypatch):
+    monkeypatch.setenv('TOURISM_STATE_CACHE_DIR', '')
+
+
+def load_only(path: str) -> pd.DataFrame:
+    """The engine's load step, without preparing the dataset"""
+    engine = EngineCore.__new__(EngineCore)
+    engine._init_runtime_state()
+    return engine._load_dataset(path)
+
+
+def test_load_dataset_keeps_columns_memory_mapped(tmp_path, no_state_cache):
+    path = save_columnar(make_dataset(500), str(tmp_path / 'dataset.columns'))
+    df = load_only(path)
+
+    assert is_memory_mapped(df['city'].array.codes)
+    for column in ['Tourist ID', 'avg_cost_usd']:
+        assert is_memory_mapped(df[column].to_numpy()), column
+
+
+def make_engine(tmp_path, rows: int = 2_000) -> ItineraryEngine:
+    path = str(tmp_path / 'dataset.csv')
+    make_dataset(rows).to_csv(path, index=False)
+    return ItineraryEngine(path)
+
+
+PROFILE = dict(age=34, interests=['History', 'Nature'], accessibility_needs=False,
+               preferred_duration=5, budget_preference='Budget')
+
+
+def test_site_recommendations_match_full_sort(tmp_path, no_state_cache):
+    engine = make_engine(tmp_path)
+    profile = TouristProfile(**PROFILE)
+
+    result = engine.get_recommendations(profile, num_recommendations=6, recommendation_type='sites')
+
+    scored = engine._score_destinations(engine._filter_by_preferences(profile), profile)
+    expected = scored.sort_values('final_score', ascending=False, kind='stable').drop_duplicates('Site Name')
+    assert result['status'] == 'success' and result['count'] == 6
+    assert [rec['name'] for rec in result['recommendations']] == expected['Site Name'].head(6).tolist()
+    np.testing.assert_allclose([rec['score'] for rec in result['recommendations']],
+                               expected['final_score'].head(6))
+
+
+def test_batch_matches_single_itineraries(tmp_path, no_state_cache):
+    engine = make_engine(tmp_path)
+    profiles = [
+        TouristProfile(**PROFILE),
+        TouristProfile(**{**PROFILE, 'age': 60, 'preferred_duration': 3}),
+        TouristProfile(**{**PROFILE, 'interests': ['Art']}),
+    ]
+    start = datetime(2026, 5, 1)
+
+    batch = engine.generate_itineraries_batch(profiles, start_date=start)
+    single = [engine.generate_itinerary(profile, start, use_cache=False) for profile in profiles]
+    assert batch == single
+
+
+def test_append_records_leaves_pinned_requests_on_their_version(tmp_path, no_state_cache):
+    engine = make_engine(tmp_path, rows=1_000)
+    version = engine.dataset_version()
+
+    with engine.snapshot() as pinned:
+        result = engine.append_records(make_dataset(200, seed=7))
+        assert len(engine.df) == 1_000
+        assert engine.df is pinned.df
+
+    assert result == {'appended': 200, 'records': 1_200, 'timings': result['timings']}
+    assert len(engine.df) == 1_200
+    assert engine.dataset_version() != version
@@ -0,0 +1,57 @@
+"""Dataset snapshots: filter index, city summary and appends"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataset_store import compact_dataset
+from engine_index import DatasetSnapshot
+from engine_scoring import compute_destination_scores, group_means, top_k_indices
+from synthetic import make_dataset
+
+
+def build(rows: int = 3_000, seed: int = 42) -> DatasetSnapshot:
+    df, _ = compact_dataset(make_dataset(rows, seed))
+    df.loc[[5, 17], 'adventure'] = np.nan
+    df.loc[23, ['culture', 'adventure', 'nature']] = np.nan
+    return DatasetSnapshot.build(df)
+
+
+@pytest.mark.parametrize('criteria', [{}, {'budget_level': 'Budget'}, {'Best Season': 'Winter'}])
+@pytest.mark.parametrize('interests', [['History', 'Nature'], []])
+def test_rank_cities_matches_mean_of_row_scores(criteria, interests):
+    snapshot = build()
+    encoder = snapshot.interest_encoder
+    rows = snapshot.df.iloc[snapshot.filter_index.select(criteria)]
+    scores = compute_destination_scores(
+        rows, rows['interest_mask'].to_numpy(), encoder.encode(interests), len(interests)
+    )['final_score']
+    codes, cities = pd.factorize(rows['city'].astype(object), sort=True)
+    means = group_means(codes, scores, len(cities))
+    top = top_k_indices(means, 5)
+
+    ranked = snapshot.city_summary.rank_cities(
+        criteria, [encoder.bits[i] for i in interests if i in encoder.bits], len(interests), 5
+    )
+    assert ranked['city'].tolist() == list(np.asarray(cities)[top])
+    np.testing.assert_allclose(ranked['final_score'], means[top])
+    assert ranked['site_count'].tolist() == np.bincount(codes)[top].tolist()
+
+
+def test_append_matches_rebuild():
+    base, _ = compact_dataset(make_dataset(2_000, seed=1))
+    records = make_dataset(500, seed=2)
+    records.loc[:49, 'city'] = 'Atlantis'
+    records.loc[:29, 'Interests'] = "['Diving', 'Art']"
+    records.loc[:19, 'Best Season'] = 'Monsoon'
+
+    appended = DatasetSnapshot.build(base.copy()).append(records)
+    rebuilt = DatasetSnapshot.build(compact_dataset(pd.concat([make_dataset(2_000, seed=1), records],
+                                                              ignore_index=True))[0])
+
+    assert appended.interest_encoder.interests == rebuilt.interest_encoder.interests
+    for column in rebuilt.df.columns:
+        assert appended.df[column].astype(object).tolist() == rebuilt.df[column].astype(object).tolist(), column
+    for criteria in [{'Best Season': 'Monsoon'}, {'budget_level': 'Budget', 'Best Season': 'Winter'}]:
+        np.testing.assert_array_equal(appended.filter_index.select(criteria), rebuilt.filter_index.select(criteria))
+    pd.testing.assert_frame_equal(appended.city_summary.table, rebuilt.city_summary.table[appended.city_summary.table.columns])
@@ -0,0 +1,63 @@
+"""Shared scoring array export"""
+
+import collections
+import os
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+import engine_parallel
+from bench_scoring import make_frame
+from dataset_store import compact_dataset, save_mapped
+from engine_index import FILTER_COLUMNS
+from engine_parallel import SharedScoringArrays, generate_itineraries_parallel
+from synthetic import make_dataset
+from tourism_backend_engine import TourismBackendEngine, TouristProfile
+
+
+def test_failed_export_removes_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(engine_parallel, '_shared_tmp_dir', lambda required_bytes=0: str(tmp_path))
+    saves = []
+
+    def failing_save(self, name, values):
+        saves.append(name)
+        if len(saves) == 2:
+            raise OSError(28, 'No space left on device')
+        np.save(os.path.join(self.directory, f"{name}.npy"), values)
+
+    monkeypatch.setattr(SharedScoringArrays, '_save', failing_save)
+    df = make_frame(100)
+    with pytest.raises(OSError):
+        SharedScoringArrays(df, np.zeros(len(df), dtype=np.uint64), FILTER_COLUMNS)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_shared_tmp_dir_falls_back_without_room(monkeypatch):
+    if not os.path.isdir('/dev/shm'):
+        pytest.skip('no /dev/shm')
+    usage = collections.namedtuple('usage', 'total used free')
+    monkeypatch.setattr(engine_parallel.shutil, 'disk_usage', lambda path: usage(64 << 20, 0, 64 << 20))
+
+    assert engine_parallel._shared_tmp_dir(1 << 20) == '/dev/shm'
+    assert engine_parallel._shared_tmp_dir(100 << 20) is None
+
+
+def test_parallel_itineraries_match_the_batch(tmp_path, monkeypatch):
+    monkeypatch.setenv('TOURISM_STATE_CACHE_DIR', '')
+    path = save_mapped(compact_dataset(make_dataset(1_000))[0], str(tmp_path / 'dataset.columns'))
+    profiles = [
+        TouristProfile(age=30 + i, interests=interests, accessibility_needs=i % 2 == 0,
+                       preferred_duration=2 + i, budget_preference=budget)
+        for i, (interests, budget) in enumerate([
+            (['History'], 'Budget'), (['Art', 'Nature'], 'Mid-range'),
+            (['Architecture'], 'Luxury'), (['History', 'Cultural'], 'Budget'),
+        ])
+    ]
+    start = datetime(2026, 5, 1)
+
+    results = generate_itineraries_parallel(path, profiles, start, workers=2, chunk_size=1)
+
+    expected = TourismBackendEngine(path).generate_itineraries_batch(profiles, start)
+    assert results == expected
+    assert all(result['status'] == 'success' for result in results)
@@ -0,0 +1,94 @@
+"""Vectorized scoring and top-k selection against their pandas references"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bench_scoring import PROFILE_INTERESTS, make_frame, score_rowwise
+from engine_scoring import (
+    InterestEncoder, best_in_groups, compute_destination_scores, compute_destination_scores_batch,
+    experience_scores, top_k_indices
+)
+
+
+def vectorized_scores(df, interests):
+    encoder = InterestEncoder()
+    masks = encoder.encode_column(df['Interests'])
+    scored = compute_destination_scores(df, masks, encoder.encode(interests), len(interests))
+    return scored['final_score']
+
+
+@pytest.mark.parametrize('interests', [PROFILE_INTERESTS, []])
+def test_scores_match_rowwise(interests):
+    df = make_frame(2_000)
+    np.testing.assert_allclose(vectorized_scores(df, interests), score_rowwise(df, interests))
+
+
+def test_batch_scores_identical_to_single_profiles():
+    df = make_frame(2_000)
+    encoder = InterestEncoder()
+    masks = encoder.encode_column(df['Interests'])
+    profiles = [PROFILE_INTERESTS, ['Nature'], []]
+
+    batch = compute_destination_scores_batch(
+        df, masks, [encoder.encode(p) for p in profiles], [len(p) for p in profiles]
+    )
+    for j, interests in enumerate(profiles):
+        single = compute_destination_scores(df, masks, encoder.encode(interests), len(interests))
+        np.testing.assert_array_equal(batch['final_score'][:, j], single['final_score'])
+
+
+def test_missing_experience_skipped_like_pandas_mean():
+    df = make_frame(50)
+    df.loc[3, ['culture', 'nature']] = np.nan
+    df.loc[7, ['culture', 'adventure', 'nature']] = np.nan
+
+    expected = df[['culture', 'adventure', 'nature']].mean(axis=1).to_numpy() / 5 * 100
+    np.testing.assert_allclose(experience_scores(df), expected, equal_nan=True)
+    assert not np.isnan(experience_scores(df)[:7]).any()
+    np.testing.assert_allclose(vectorized_scores(df, PROFILE_INTERESTS), score_rowwise(df, PROFILE_INTERESTS),
+                               equal_nan=True)
+
+
+def test_no_experience_columns_is_neutral():
+    df = make_frame(10).drop(columns=['culture', 'adventure', 'nature'])
+    assert (experience_scores(df) == 50.0).all()
+
+
+@pytest.mark.parametrize('k', [1, 5, 37, 200, 500])
+def test_top_k_matches_stable_sort(k):
+    rng = np.random.default_rng(k)
+    # Few distinct values so ties straddle the k-th place
+    scores = rng.integers(0, 20, 300).astype(np.float64)
+    scores[::17] = np.nan
+    tiebreak = rng.integers(0, 5, 300)
+
+    expected = pd.DataFrame({'score': scores, 'tiebreak': tiebreak}).sort_values(
+        ['score', 'tiebreak'], ascending=[False, True], kind='stable', na_position='last'
+    ).index.to_numpy()[:k]
+    np.testing.assert_array_equal(top_k_indices(scores, k, tiebreak), expected)
+
+    expected = pd.Series(scores).sort_values(ascending=False, kind='stable', na_position='last').index[:k]
+    np.testing.assert_array_equal(top_k_indices(scores, k), expected.to_numpy())
+
+
+def test_top_k_empty():
+    assert len(top_k_indices(np.array([]), 3)) == 0
+    assert len(top_k_indices(np.array([1.0, 2.0]), 0)) == 0
+
+
+def test_best_in_groups_matches_sort_and_drop_duplicates():
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({
+        'site': rng.choice(['A', 'B', 'C', 'D', 'E'], 400),
+        'score': rng.integers(0, 10, 400).astype(np.float64),
+    })
+    frame.loc[frame['site'] == 'E', 'score'] = np.nan
+    frame.loc[::7, 'score'] = np.nan
+
+    expected = frame.sort_values('score', ascending=False, kind='stable').drop_duplicates('site')
+    codes = pd.factorize(frame['site'])[0]
+    rows = best_in_groups(codes, frame['score'].to_numpy())
+    ranked = rows[top_k_indices(frame['score'].to_numpy()[rows], 3)]
+    np.testing.assert_array_equal(ranked, expected.index.to_numpy()[:3])
+    assert sorted(rows) == sorted(expected.index)
@@ -0,0 +1,74 @@
+"""Engine state cache round trips"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from dataset_store import compact_dataset
+from engine_index import DatasetSnapshot
+from engine_state_cache import STATE_FILE, EngineStateCache
+from synthetic import make_dataset
+
+
+def build(rows: int = 2_000) -> DatasetSnapshot:
+    df, _ = compact_dataset(make_dataset(rows, seed=3))
+    # Object columns as the engine may hold them, including missing values
+    unesco = pd.Series(np.where(np.arange(rows) % 2 == 0, True, False), dtype=object)
+    unesco[::7] = np.nan
+    df['UNESCO Site'] = unesco
+    df['Site Name'] = df['Site Name'].astype(object)
+    df.loc[5, 'adventure'] = np.nan
+    return DatasetSnapshot.build(df)
+
+
+def round_trip(tmp_path, snapshot: DatasetSnapshot, analytics=None):
+    tmp_path.mkdir(exist_ok=True)
+    dataset = tmp_path / 'data.csv'
+    dataset.write_text('placeholder\n')
+    cache = EngineStateCache(str(dataset), str(tmp_path / 'cache'))
+    assert cache.save(snapshot, analytics, {'rows': len(snapshot.df)}) is not None
+    return EngineStateCache(str(dataset), str(tmp_path / 'cache')).load()
+
+
+def test_restored_rows_keep_dtypes_and_values(tmp_path):
+    snapshot = build()
+    restored = round_trip(tmp_path, snapshot).snapshot
+
+    pd.testing.assert_series_equal(restored.df.dtypes, snapshot.df.dtypes)
+    assert restored.df['UNESCO Site'].dtype == object
+    assert restored.df['Site Name'].dtype == object
+    # Compared as objects: memory-mapped buffers are a different array class
+    pd.testing.assert_frame_equal(restored.df.astype(object), snapshot.df.astype(object))
+
+
+def test_restored_indexes_match(tmp_path):
+    snapshot = build()
+    restored = round_trip(tmp_path, snapshot).snapshot
+
+    assert restored.interest_encoder.interests == snapshot.interest_encoder.interests
+    for criteria in [{}, {'budget_level': 'Budget'}, {'Best Season': 'Winter', 'budget_level': 'Luxury'}]:
+        np.testing.assert_array_equal(restored.filter_index.select(criteria), snapshot.filter_index.select(criteria))
+    pd.testing.assert_frame_equal(restored.city_summary.table, snapshot.city_summary.table)
+
+    appended = restored.append(make_dataset(200, seed=4))
+    expected = snapshot.append(make_dataset(200, seed=4))
+    pd.testing.assert_frame_equal(appended.city_summary.table, expected.city_summary.table)
+
+
+def test_only_exact_json_analytics_are_cached(tmp_path):
+    snapshot = build(500)
+    analytics = {'total_records': np.int64(500), 'top_cities': {'Paris': 3}}
+    assert round_trip(tmp_path / 'plain', snapshot, analytics).analytics == {
+        'total_records': 500, 'top_cities': {'Paris': 3}
+    }
+    # Integer keys would come back as strings
+    assert round_trip(tmp_path / 'keys', snapshot, {'ages': {18: 2}}).analytics is None
+
+
+def test_state_file_is_json(tmp_path):
+    round_trip(tmp_path, build(500))
+    [entry] = [name for name in os.listdir(tmp_path / 'cache') if name != 'sources.json']
+    with open(tmp_path / 'cache' / entry / STATE_FILE, encoding='utf-8') as f:
+        assert 'filter_index' in json.load(f)
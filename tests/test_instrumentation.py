@@ -0,0 +1,123 @@
+"""Stage timings, events and hooks"""
+
+from datetime import datetime
+
+import pytest
+
+from instrumentation import (
+    EVENT_HISTORY_CLEARED, EVENT_ITINERARY, STAGE_FILTER, STAGE_RECOMMENDATIONS, STAGE_SCHEDULE,
+    STAGE_SCORE, STAGE_SELECT, STAGES, Instrumentation, timed_stage
+)
+from synthetic import make_dataset
+from tourism_backend_engine import TourismBackendEngine, TouristProfile
+
+
+class Worker:
+    def __init__(self):
+        self.instrumentation = Instrumentation()
+
+    def run(self, value):
+        if value is None:
+            raise ValueError('no value')
+        return value * 2
+
+    run = timed_stage(STAGE_SCORE)(run)
+
+
+def test_recorded_timings_are_summarized():
+    instrumentation = Instrumentation()
+    for duration_ms in [1.0, 2.0, 3.0, 4.0, 100.0]:
+        instrumentation.record(STAGE_FILTER, duration_ms)
+
+    stats = instrumentation.metrics()['stages'][STAGE_FILTER]
+    assert stats == {'count': 5, 'mean_ms': 22.0, 'p50_ms': 3.0, 'p99_ms': 100.0, 'max_ms': 100.0}
+
+
+def test_stage_passes_attributes_to_hooks():
+    instrumentation = Instrumentation()
+    events = []
+    instrumentation.add_hook(events.append)
+
+    with instrumentation.stage(STAGE_SELECT, k=5) as attributes:
+        attributes['rows'] = 10
+
+    [event] = events
+    assert event.name == STAGE_SELECT and event.duration_ms >= 0
+    assert event.attributes == {'k': 5, 'rows': 10}
+
+
+def test_timed_stage_counts_every_call_including_failures():
+    worker = Worker()
+    assert worker.run(2) == 4
+    with pytest.raises(ValueError):
+        worker.run(None)
+
+    assert worker.run.__name__ == 'run'
+    assert worker.instrumentation.metrics()['stages'][STAGE_SCORE]['count'] == 2
+
+
+def test_events_are_counted_and_printed(capsys):
+    instrumentation = Instrumentation(print_events=True)
+    instrumentation.event(EVENT_HISTORY_CLEARED)
+    instrumentation.event(EVENT_HISTORY_CLEARED)
+    instrumentation.event(EVENT_ITINERARY, days=3, total_cost=450.0, cities=['Paris', 'Rome'])
+
+    assert instrumentation.metrics()['events'] == {EVENT_HISTORY_CLEARED: 2, EVENT_ITINERARY: 1}
+    output = capsys.readouterr().out
+    assert output.count('Conversation history cleared') == 2
+    assert '3-day itinerary' in output and 'Paris, Rome' in output
+
+
+def test_events_are_silent_unless_printing(capsys):
+    Instrumentation().event(EVENT_HISTORY_CLEARED)
+    assert capsys.readouterr().out == ''
+
+
+def test_failing_hook_warns_and_others_still_run():
+    instrumentation = Instrumentation()
+    events = []
+
+    def broken(event):
+        raise RuntimeError('exporter down')
+
+    instrumentation.add_hook(broken)
+    instrumentation.add_hook(events.append)
+    with pytest.warns(UserWarning, match='exporter down'):
+        instrumentation.event(EVENT_ITINERARY, days=1, total_cost=0.0, cities=[])
+    assert [event.name for event in events] == [EVENT_ITINERARY]
+
+    instrumentation.remove_hook(broken)
+    instrumentation.event(EVENT_HISTORY_CLEARED)
+    assert len(events) == 2
+
+
+def test_reset_keeps_hooks():
+    instrumentation = Instrumentation()
+    events = []
+    instrumentation.add_hook(events.append)
+    instrumentation.record(STAGE_FILTER, 1.0)
+    instrumentation.event(EVENT_HISTORY_CLEARED)
+
+    instrumentation.reset()
+
+    assert instrumentation.metrics() == {'stages': {}, 'events': {}}
+    instrumentation.event(EVENT_HISTORY_CLEARED)
+    assert len(events) == 3
+
+
+def test_itinerary_times_each_stage(tmp_path, monkeypatch):
+    monkeypatch.setenv('TOURISM_STATE_CACHE_DIR', '')
+    path = str(tmp_path / 'dataset.csv')
+    make_dataset(500).to_csv(path, index=False)
+    engine = TourismBackendEngine(path)
+    engine.instrumentation = Instrumentation()
+    profile = TouristProfile(age=40, interests=['Art'], accessibility_needs=False,
+                             preferred_duration=3, budget_preference='Mid-range')
+
+    engine.generate_itinerary(profile, start_date=datetime(2026, 5, 1))
+
+    metrics = engine.instrumentation.metrics()
+    for stage in [STAGE_FILTER, STAGE_SCORE, STAGE_SELECT, STAGE_SCHEDULE, STAGE_RECOMMENDATIONS]:
+        assert stage in STAGES
+        assert metrics['stages'][stage]['count'] == 1, stage
+    assert metrics['events'] == {EVENT_ITINERARY: 1}
@@ -0,0 +1,82 @@
+"""Bulk PDF generation over a process pool"""
+
+import io
+import itertools
+import os
+import zipfile
+
+import pytest
+
+from instrumentation import STAGE_PDF_BUILD, Instrumentation
+from synthetic import make_itinerary
+
+pytest.importorskip('pdf_generator')
+from pdf_batch import default_filename, render_itineraries, write_pdf_directory, write_pdf_zip
+
+
+def itineraries(count: int):
+    return [make_itinerary(2, seed=i) for i in range(count)]
+
+
+def test_zip_holds_every_pdf():
+    output = io.BytesIO()
+
+    summary = write_pdf_zip(itineraries(3), output, workers=2)
+
+    with zipfile.ZipFile(io.BytesIO(output.getvalue())) as archive:
+        names = archive.namelist()
+        assert sorted(names) == [default_filename(i, None) for i in range(3)]
+        assert all(archive.read(name).startswith(b'%PDF') for name in names)
+        assert summary['bytes'] == sum(info.file_size for info in archive.infolist())
+    assert summary['documents'] == 3 and summary['failed'] == []
+
+
+def test_directory_output(tmp_path):
+    output_dir = tmp_path / 'pdfs'
+    progress = []
+
+    summary = write_pdf_directory(itineraries(3), str(output_dir), workers=2, progress=progress.append)
+
+    files = sorted(os.listdir(output_dir))
+    assert files == [default_filename(i, None) for i in range(3)]
+    assert sorted(result.index for result in progress) == [0, 1, 2]
+    for detail in summary['documents_detail']:
+        assert os.path.getsize(output_dir / detail['filename']) == detail['size_bytes']
+        assert (output_dir / detail['filename']).read_bytes().startswith(b'%PDF')
+
+
+def test_failures_are_reported_without_stopping_the_batch():
+    documents = itineraries(4)
+    # Fails while rendering in the worker
+    documents[1] = {'status': 'success'}
+    # Fails before reaching a worker: lambdas cannot be pickled
+    documents[2] = {**documents[2], 'render_hook': lambda: None}
+    output = io.BytesIO()
+
+    summary = write_pdf_zip(documents, output, workers=2)
+
+    failed = {failure['index']: failure['error'] for failure in summary['failed']}
+    assert sorted(failed) == [1, 2]
+    assert 'KeyError' in failed[1]
+    assert 'pickle' in failed[2].lower()
+    with zipfile.ZipFile(io.BytesIO(output.getvalue())) as archive:
+        assert sorted(archive.namelist()) == [default_filename(i, None) for i in (0, 3)]
+
+
+def test_closing_early_stops_reading_input():
+    read = []
+
+    def endless():
+        for i in itertools.count():
+            read.append(i)
+            yield make_itinerary(2, seed=i)
+
+    instrumentation = Instrumentation()
+    results = render_itineraries(endless(), workers=1, max_pending=2, instrumentation=instrumentation)
+    first = next(results)
+    results.close()
+
+    assert first.ok and first.data.startswith(b'%PDF')
+    # max_pending documents plus the refill after the first result
+    assert len(read) <= 3
+    assert instrumentation.metrics()['stages'][STAGE_PDF_BUILD]['count'] == 1
@@ -0,0 +1,53 @@
+"""PDF cache tiers and disk size accounting"""
+
+import os
+from datetime import date
+
+from pdf_cache import DiskPDFCache, PDFCache, pdf_cache_key
+
+
+def disk_size(directory) -> int:
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+
+def test_overwriting_a_key_counts_its_size_once(tmp_path):
+    cache = DiskPDFCache(str(tmp_path), max_bytes=1_000)
+    for size in (300, 500, 200):
+        cache.put('same', b'x' * size)
+        assert cache.size_bytes == disk_size(tmp_path) == size
+    assert cache.stats.evictions == 0
+    assert cache.get('same') == b'x' * 200
+
+
+def test_disk_tier_evicts_least_recently_used(tmp_path):
+    cache = DiskPDFCache(str(tmp_path), max_bytes=1_000)
+    cache.put('a', b'a' * 400)
+    cache.put('b', b'b' * 400)
+    # Modification time is the last use; make 'a' the oldest explicitly
+    os.utime(tmp_path / 'a.pdf', ns=(0, 0))
+    cache.put('c', b'c' * 400)
+
+    assert cache.get('a') is None
+    assert cache.get('b') == b'b' * 400
+    assert cache.size_bytes == disk_size(tmp_path) == 800
+    assert cache.stats.evictions == 1
+
+
+def test_cached_pdf_matches_render(tmp_path):
+    renders = []
+
+    def render(itinerary, generated_on):
+        renders.append(generated_on)
+        return f"{itinerary['city']} {generated_on}".encode()
+
+    itinerary = {'city': 'Paris', 'days': [1, 2]}
+    day = date(2024, 5, 1)
+    cache = PDFCache(maxsize=4, disk=DiskPDFCache(str(tmp_path)))
+    assert cache.get_or_render(itinerary, render, day) == render(itinerary, day)
+    renders.clear()
+
+    # Memory hit, then a fresh memory tier served from disk
+    assert cache.get_or_render(dict(reversed(itinerary.items())), render, day) == b'Paris 2024-05-01'
+    assert PDFCache(disk=DiskPDFCache(str(tmp_path))).get_or_render(itinerary, render, day) == b'Paris 2024-05-01'
+    assert renders == []
+    assert pdf_cache_key(itinerary, day) != pdf_cache_key(itinerary, date(2024, 5, 2))
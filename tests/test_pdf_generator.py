@@ -0,0 +1,68 @@
+"""Itinerary PDF rendering"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from synthetic import make_itinerary
+
+pdf_generator = pytest.importorskip('pdf_generator')
+
+
+@pytest.fixture
+def invariant_pdfs(monkeypatch):
+    """Byte-comparable output: no creation timestamps or random document IDs"""
+    from reportlab import rl_config
+    monkeypatch.setattr(rl_config, 'invariant', 1)
+
+
+@pytest.mark.parametrize('days', [1, 14, 90])
+def test_paged_rendering_matches_eager(invariant_pdfs, days):
+    itinerary = make_itinerary(days, sites_per_day=6)
+    generator = pdf_generator.get_pdf_generator()
+    day = date(2024, 5, 1)
+
+    paged = generator.render_itinerary_pdf(itinerary, generated_on=day, paged=True)
+    eager = generator.render_itinerary_pdf(itinerary, generated_on=day, paged=False)
+    assert paged.startswith(b'%PDF')
+    assert paged == eager
+
+
+def test_in_memory_rendering_matches_file_output(invariant_pdfs, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    itinerary = make_itinerary(3)
+    generator = pdf_generator.get_pdf_generator()
+    day = date(2024, 5, 1)
+
+    data = generator.render_itinerary_pdf(itinerary, generated_on=day)
+
+    assert data.startswith(b'%PDF') and os.listdir(tmp_path) == []
+    path = str(tmp_path / 'itinerary.pdf')
+    assert generator.generate_itinerary_pdf(itinerary, path, generated_on=day) == path
+    with open(path, 'rb') as f:
+        assert f.read() == data
+
+
+def test_generators_share_one_style_sheet():
+    generator = pdf_generator.get_pdf_generator()
+    assert pdf_generator.get_pdf_generator() is generator
+    assert pdf_generator.PDFItineraryGenerator().styles is generator.styles is pdf_generator.shared_styles()
+
+    private = pdf_generator.build_styles()
+    assert private is not generator.styles
+    for name in ['CustomTitle', 'CustomSubtitle', 'DayHeading', 'CustomBody']:
+        assert private[name].fontSize == generator.styles[name].fontSize
+
+
+def test_concurrent_rendering_with_shared_styles(invariant_pdfs):
+    itineraries = [make_itinerary(days, seed=days) for days in range(1, 9)]
+    generator = pdf_generator.get_pdf_generator()
+    day = date(2024, 5, 1)
+    expected = [generator.render_itinerary_pdf(itinerary, generated_on=day) for itinerary in itineraries]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        rendered = list(pool.map(lambda itinerary: generator.render_itinerary_pdf(itinerary, generated_on=day),
+                                 itineraries))
+    assert rendered == expected
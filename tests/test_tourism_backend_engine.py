@@ -0,0 +1,129 @@
+"""Itineraries, seasonal recommendations and analytics of the backend engine"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from instrumentation import EVENT_ITINERARY, STAGE_PREPARE, Instrumentation
+from synthetic import make_dataset
+from tourism_backend_engine import SITES_PER_DAY, TourismBackendEngine, TouristProfile
+
+PROFILE = dict(age=34, interests=['History', 'Nature'], accessibility_needs=False,
+               preferred_duration=5, budget_preference='Budget')
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.setenv('TOURISM_STATE_CACHE_DIR', '')
+    path = str(tmp_path / 'dataset.csv')
+    make_dataset(2_000).to_csv(path, index=False)
+    engine = TourismBackendEngine(path)
+    engine.instrumentation = Instrumentation()
+    return engine
+
+
+def test_prepare_runs_once(engine):
+    assert engine.load_timings is None
+
+    timings = engine.prepare()
+
+    assert timings and all(ms >= 0 for ms in timings.values())
+    assert engine.prepare() is timings
+    stages = engine.instrumentation.metrics()['stages']
+    assert stages[STAGE_PREPARE]['count'] == 1
+    assert len(engine.df) == 2_000 and 'interest_mask' in engine.df.columns
+
+
+def test_itinerary_covers_every_day(engine):
+    events = []
+    engine.instrumentation.add_hook(events.append)
+    profile = TouristProfile(**PROFILE)
+
+    result = engine.generate_itinerary(profile, start_date=datetime(2026, 5, 1))
+
+    itinerary = result['itinerary']
+    schedule = itinerary['daily_schedule']
+    assert result['status'] == 'success'
+    assert result['tourist_profile'] == {'age': 34, 'interests': ['History', 'Nature'],
+                                         'budget': 'Budget', 'duration': 5}
+    assert [day['day'] for day in schedule] == [1, 2, 3, 4, 5]
+    assert schedule[0]['date'] == itinerary['start_date'] == '2026-05-01'
+    assert schedule[-1]['date'] == itinerary['end_date'] == '2026-05-05'
+    assert itinerary['cities_visited'] == list(dict.fromkeys(day['city'] for day in schedule))
+    assert itinerary['total_cost_usd'] == pytest.approx(sum(day['estimated_cost_usd'] for day in schedule))
+
+    # Sites are distinct, at most SITES_PER_DAY a day, and from the day's city
+    sites = [site for day in schedule for site in day['sites']]
+    assert len(sites) == len(set(sites))
+    assert all(len(day['sites']) <= SITES_PER_DAY for day in schedule)
+    site_cities = dict(zip(engine.df['Site Name'].astype(str), engine.df['city'].astype(str)))
+    assert all(site_cities[site] == day['city'] for day in schedule for site in day['sites'])
+
+    recommendations = result['recommendations']
+    assert recommendations['best_season'] in {'Spring', 'Summer', 'Autumn', 'Winter'}
+    assert 'Daypack and reusable water bottle' in recommendations['packing_tips']
+    assert recommendations['accessibility_info'] is None
+    assert json.loads(json.dumps(result)) == result
+
+    itinerary_events = [event for event in events if event.name == EVENT_ITINERARY]
+    assert [event.attributes['days'] for event in itinerary_events] == [5]
+
+
+def test_long_trip_adds_free_days(engine):
+    profile = TouristProfile(**{**PROFILE, 'preferred_duration': 30, 'accessibility_needs': True,
+                                'season_preference': 'Winter'})
+
+    result = engine.generate_itinerary(profile, start_date=datetime(2026, 1, 1))
+
+    schedule = result['itinerary']['daily_schedule']
+    assert len(schedule) == 30
+    free_days = [day for day in schedule if not day['sites']]
+    assert free_days and all(day['notes'].startswith('Free day') for day in free_days)
+    assert result['recommendations']['best_season'] == 'Winter'
+    assert set(result['recommendations']['accessibility_info']) >= {'booking', 'transport'}
+
+
+def test_no_matching_destinations(engine):
+    profile = TouristProfile(**{**PROFILE, 'climate_preference': 'Arctic'})
+    result = engine.generate_itinerary(profile)
+    assert result['status'] == 'error' and result['message']
+
+
+def test_batch_matches_single_itineraries(engine):
+    profiles = [
+        TouristProfile(**PROFILE),
+        TouristProfile(**{**PROFILE, 'age': 65, 'preferred_duration': 3}),
+        TouristProfile(**{**PROFILE, 'interests': ['Art'], 'budget_preference': 'Luxury'}),
+    ]
+    start = datetime(2026, 5, 1)
+
+    batch = engine.generate_itineraries_batch(profiles, start_date=start)
+    single = [engine.generate_itinerary(profile, start, use_cache=False) for profile in profiles]
+    assert batch == single
+
+
+def test_seasonal_recommendations(engine):
+    result = engine.get_seasonal_recommendations('Summer', budget='Budget', num_recommendations=3)
+
+    df = engine.df
+    budget_cities = set(df.loc[df['budget_level'] == 'Budget', 'city'].astype(str))
+    assert result['count'] == len(result['recommendations']) == 3
+    assert all(rec['city'] in budget_cities for rec in result['recommendations'])
+    scores = [rec['score'] for rec in result['recommendations']]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_analytics_match_the_dataset(engine):
+    analytics = engine.get_analytics()
+
+    df = engine.df
+    assert analytics['dataset_stats']['total_records'] == len(df)
+    assert analytics['dataset_stats']['unique_cities'] == df['city'].nunique()
+    assert analytics['popular_destinations']['top_cities'] == {
+        str(city): int(count) for city, count in df['city'].value_counts().head(10).items()
+    }
+    assert sum(analytics['cost_analysis']['budget_distribution'].values()) == len(df)
+    assert analytics['cost_analysis']['avg_daily_cost_usd'] == pytest.approx(df['avg_cost_usd'].mean())
+    assert json.loads(json.dumps(analytics)) == analytics
+    assert engine.get_analytics() is analytics
@@ -0,0 +1,393 @@
+"""
+Tourism Backend Engine
+======================
+
+Itineraries and analytics for the tourism platform, built on EngineCore
+(dataset loading, preference filtering, scoring and ranking):
+- Day-by-day itineraries from the best-matching sites for a profile
+- Best season, packing tips and accessibility notes per itinerary
+- Seasonal city recommendations for the chatbot
+- Whole-dataset analytics for the dashboard
+
+Dependencies: numpy, pandas
+"""
+
+import pandas as pd
+import numpy as np
+from collections import Counter
+from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from engine_cache import cache_by_profile, memoize_per_dataset_version
+from engine_core import EngineCore, TouristProfile
+from engine_index import pin_snapshot
+from instrumentation import EVENT_ITINERARY, STAGE_RECOMMENDATIONS, STAGE_SCHEDULE, timed_stage
+import warnings
+warnings.filterwarnings('ignore')
+
+# Sites scheduled per day of an itinerary
+SITES_PER_DAY = 2
+
+# Suggested activities per interest
+INTEREST_ACTIVITIES = {
+    'Art': 'Gallery and museum visits',
+    'History': 'Guided historical tour',
+    'Architecture': 'Architecture walking tour',
+    'Cultural': 'Local cultural performance',
+    'Nature': 'Nature excursion',
+    'Food': 'Local cuisine tasting',
+}
+
+# Packing tips per climate classification
+CLIMATE_PACKING_TIPS = {
+    'Cold': 'Warm layers, gloves and a waterproof jacket',
+    'Temperate': 'Light layers for changing weather',
+    'Warm': 'Breathable clothing, sunscreen and a hat',
+}
+
+# ============================================================================
+# DATA MODELS
+# ============================================================================
+
+@dataclass
+class Destination:
+    """Destination data model"""
+    record_id: str
+    city: str
+    country: str
+    site_name: str
+    avg_cost_usd: float
+    best_season: str
+    climate: str
+    culture_score: float
+    adventure_score: float
+    nature_score: float
+    avg_rating: float
+    unesco_site: bool
+
+
+# ============================================================================
+# BACKEND ENGINE
+# ============================================================================
+
+class TourismBackendEngine(EngineCore):
+    """
+    Itinerary generation, recommendations and analytics
+    
+    Dataset loading, preparation and ranking come from EngineCore; call
+    prepare() once before serving requests.
+    """
+    
+    def __init__(self, dataset_path: str):
+        """
+        Initialize the backend engine
+        
+        Args:
+            dataset_path: Path to the tourism dataset CSV (or its columnar copy)
+        """
+        super().__init__(dataset_path)
+    
+    def generate_itinerary(
+        self,
+        tourist_profile: TouristProfile,
+        start_date: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate a personalized day-by-day itinerary
+        
+        The best-scoring distinct sites matching the profile's preferences
+        are grouped by city (cities in order of their best site) and
+        spread over the trip, SITES_PER_DAY sites a day.
+        
+        Args:
+            tourist_profile: Tourist profile
+            start_date: First day of the trip (defaults to today)
+        
+        Returns:
+            Dictionary with status, the tourist profile, the itinerary and
+            trip recommendations; status 'error' with a message when no
+            destination matches the preferences
+        """
+        if start_date is None:
+            start_date = datetime.now()
+        
+        filtered = self._filter_by_preferences(tourist_profile)
+        if filtered.empty:
+            return {
+                'status': 'error',
+                'message': "No destinations match your preferences. Try another budget, climate or season."
+            }
+        
+        scored = self._score_destinations(filtered, tourist_profile)
+        selected_destinations = self._rank_destinations(
+            scored,
+            tourist_profile.preferred_duration * SITES_PER_DAY,
+            distinct='Site Name'
+        )
+        
+        itinerary_days = self._build_daily_schedule(selected_destinations, tourist_profile, start_date)
+        total_cost = sum(day['estimated_cost_usd'] for day in itinerary_days)
+        end_date = start_date + timedelta(days=len(itinerary_days) - 1)
+        
+        result = {
+            'status': 'success',
+            'tourist_profile': {
+                'age': tourist_profile.age,
+                'interests': list(tourist_profile.interests),
+                'budget': tourist_profile.budget_preference,
+                'duration': tourist_profile.preferred_duration
+            },
+            'itinerary': {
+                'start_date': start_date.strftime('%Y-%m-%d'),
+                'end_date': end_date.strftime('%Y-%m-%d'),
+                'total_days': len(itinerary_days),
+                'cities_visited': list(dict.fromkeys(day['city'] for day in itinerary_days)),
+                'total_cost_usd': total_cost,
+                'avg_daily_cost_usd': total_cost / len(itinerary_days),
+                'daily_schedule': itinerary_days
+            },
+            'recommendations': self._build_recommendations(selected_destinations, tourist_profile)
+        }
+        
+        self.instrumentation.event(
+            EVENT_ITINERARY,
+            days=len(itinerary_days),
+            total_cost=total_cost,
+            cities=result['itinerary']['cities_visited']
+        )
+        
+        return result
+    
+    def _build_daily_schedule(
+        self,
+        selected_destinations: pd.DataFrame,
+        tourist_profile: TouristProfile,
+        start_date: datetime
+    ) -> List[Dict[str, Any]]:
+        """
+        Spread the selected sites over the days of the trip
+        
+        Each day stays in one city. When fewer sites match than the trip
+        needs, the remaining days are free days in each city in turn,
+        right after that city's sightseeing days.
+        
+        Args:
+            selected_destinations: Ranked sites, best first
+            tourist_profile: Tourist profile
+            start_date: First day of the trip
+        
+        Returns:
+            One entry per day with date, city, sites, activities, cost and notes
+        """
+        sites = selected_destinations.to_dict('records')
+        cities = list(dict.fromkeys(str(site['city']) for site in sites))
+        
+        # Sightseeing days per city, best sites first, cut to the trip length
+        visits = []
+        for city in cities:
+            city_sites = [site for site in sites if str(site['city']) == city]
+            for i in range(0, len(city_sites), SITES_PER_DAY):
+                visits.append((city, city_sites[i:i + SITES_PER_DAY]))
+        visits = visits[:tourist_profile.preferred_duration]
+        
+        stays: Dict[str, List[List[Dict[str, Any]]]] = {}
+        for city, day_sites in visits:
+            stays.setdefault(city, []).append(day_sites)
+        cities = list(stays)
+        for i in range(tourist_profile.preferred_duration - len(visits)):
+            stays[cities[i % len(cities)]].append([])
+        
+        activities = [INTEREST_ACTIVITIES[i] for i in tourist_profile.interests if i in INTEREST_ACTIVITIES]
+        city_costs = {
+            city: float(np.mean([site['avg_cost_usd'] for day_sites in days for site in day_sites]))
+            for city, days in stays.items()
+        }
+        
+        itinerary_days = []
+        for city, days in stays.items():
+            for day_sites in days:
+                day = len(itinerary_days)
+                if day_sites:
+                    cost = float(np.mean([site['avg_cost_usd'] for site in day_sites]))
+                    unesco = any(bool(site['UNESCO Site']) for site in day_sites)
+                    notes = 'Includes a UNESCO World Heritage Site' if unesco else ''
+                else:
+                    cost = city_costs[city]
+                    notes = f"Free day to explore {city} at your own pace"
+                itinerary_days.append({
+                    'day': day + 1,
+                    'date': (start_date + timedelta(days=day)).strftime('%Y-%m-%d'),
+                    'city': city,
+                    'sites': [str(site['Site Name']) for site in day_sites],
+                    'activities': [activities[(day + j) % len(activities)] for j in range(min(2, len(activities)))],
+                    'estimated_cost_usd': cost,
+                    'notes': notes
+                })
+        
+        return itinerary_days
+    
+    def _build_recommendations(
+        self,
+        selected_destinations: pd.DataFrame,
+        tourist_profile: TouristProfile
+    ) -> Dict[str, Any]:
+        """Best season, packing tips and accessibility notes for an itinerary"""
+        return {
+            'best_season': self._get_best_season(selected_destinations),
+            'packing_tips': self._get_packing_tips(selected_destinations, tourist_profile),
+            'accessibility_info': self._get_accessibility_info(selected_destinations) if tourist_profile.accessibility_needs else None
+        }
+    
+    def _get_best_season(self, selected_destinations: pd.DataFrame) -> Optional[str]:
+        """Most common best season of the selected sites (ties go to the better site)"""
+        seasons = selected_destinations['Best Season'].dropna().astype(str)
+        if seasons.empty:
+            return None
+        return Counter(seasons).most_common(1)[0][0]
+    
+    def _get_packing_tips(
+        self,
+        selected_destinations: pd.DataFrame,
+        tourist_profile: TouristProfile
+    ) -> List[str]:
+        """Packing tips for the climates, sites and traveler of an itinerary"""
+        tips = ['Comfortable walking shoes', 'Travel adapter and copies of your documents']
+        
+        climates = dict.fromkeys(selected_destinations['climate_classification'].dropna().astype(str))
+        tips.extend(CLIMATE_PACKING_TIPS[climate] for climate in climates if climate in CLIMATE_PACKING_TIPS)
+        
+        if 'Nature' in tourist_profile.interests:
+            tips.append('Daypack and reusable water bottle')
+        if selected_destinations['UNESCO Site'].any():
+            tips.append('Modest clothing for religious and heritage sites')
+        if tourist_profile.age >= 60:
+            tips.append('Regular medication, with copies of your prescriptions')
+        
+        return tips
+    
+    def _get_accessibility_info(self, selected_destinations: pd.DataFrame) -> Dict[str, str]:
+        """Accessibility notes for the selected sites"""
+        info = {
+            'booking': 'Ask each site about step-free routes and wheelchair availability when booking',
+            'transport': 'Request accessible transfers between cities in advance',
+        }
+        
+        unesco_sites = int(selected_destinations['UNESCO Site'].sum())
+        if unesco_sites:
+            info['heritage_sites'] = (
+                f"{unesco_sites} of {len(selected_destinations)} sites are UNESCO World Heritage "
+                "Sites, where historic paths can be uneven"
+            )
+        if 'Accessibility' in selected_destinations.columns:
+            share = float(selected_destinations['Accessibility'].mean()) * 100
+            info['visitors'] = f"{share:.0f}% of past visitors to these sites had accessibility needs"
+        
+        return info
+    
+    def get_seasonal_recommendations(
+        self,
+        season: str,
+        budget: Optional[str] = None,
+        num_recommendations: int = 5
+    ) -> Dict[str, Any]:
+        """
+        Best cities to visit in a season
+        
+        Cities are ranked from the precomputed city summary by the rating
+        and experience scores of their sites best visited in that season;
+        interests are not considered.
+        
+        Args:
+            season: 'Spring', 'Summer', 'Autumn' or 'Winter'
+            budget: Optional budget level ('Budget', 'Mid-range', 'Luxury')
+            num_recommendations: Number of cities
+        
+        Returns:
+            Dictionary with status, season, budget and the cities, best first
+        """
+        criteria = {'Best Season': season, 'budget_level': budget}
+        criteria = {column: value for column, value in criteria.items() if value}
+        
+        summary = self.city_summary
+        table = summary.table
+        recommendations = []
+        for city in summary.rank_cities(criteria, [], 0, num_recommendations).itertuples(index=False):
+            recommendations.append({
+                'city': str(city.city),
+                'country': str(table.at[city.city, 'country']) if 'country' in table.columns else None,
+                'score': float(city.final_score),
+                'avg_cost_usd': float(table.at[city.city, 'avg_cost_usd']),
+                'site_count': int(city.site_count)
+            })
+        
+        return {
+            'status': 'success',
+            'season': season,
+            'budget': budget,
+            'count': len(recommendations),
+            'recommendations': recommendations
+        }
+    
+    def get_analytics(self) -> Dict[str, Any]:
+        """
+        Platform analytics over the whole dataset
+        
+        Returns:
+            Dataset, destination, cost, demographic and satisfaction
+            statistics as plain Python values (they are cached as JSON,
+            see engine_state_cache)
+        """
+        df = self.df
+        
+        def counts(column: str, limit: Optional[int] = None) -> Dict[str, int]:
+            values = df[column].value_counts()
+            values = values[values > 0].head(limit)
+            return {str(key): int(count) for key, count in values.items()}
+        
+        def mean(column: str) -> float:
+            return float(df[column].mean()) if len(df) else 0.0
+        
+        return {
+            'dataset_stats': {
+                'total_records': len(df),
+                'unique_tourists': int(df['Tourist ID'].nunique()),
+                'unique_cities': int(df['city'].nunique()),
+                'unique_countries': int(df['country'].nunique())
+            },
+            'popular_destinations': {
+                'top_cities': counts('city', 10),
+                'top_countries': counts('country', 10)
+            },
+            'cost_analysis': {
+                'avg_daily_cost_usd': mean('avg_cost_usd'),
+                'min_cost_usd': float(df['avg_cost_usd'].min()) if len(df) else 0.0,
+                'max_cost_usd': float(df['avg_cost_usd'].max()) if len(df) else 0.0,
+                'budget_distribution': counts('budget_level')
+            },
+            'tourist_demographics': {
+                'avg_age': mean('Age'),
+                'accessibility_needs_pct': mean('Accessibility') * 100,
+                'age_distribution': dict(sorted(counts('Age_Group').items()))
+            },
+            'satisfaction_metrics': {
+                'avg_tourist_rating': mean('Tourist Rating'),
+                'avg_satisfaction': mean('Satisfaction'),
+                'recommendation_accuracy': mean('Recommendation Accuracy')
+            }
+        }
+    
+    # Analytics cover the whole dataset, so compute them once per version
+    get_analytics = memoize_per_dataset_version(get_analytics)
+    
+    # Identical forms (same profile fields, dates and options) share results
+    generate_itinerary = cache_by_profile(generate_itinerary)
+    
+    # Each request reads one dataset version from start to finish, even
+    # while append_records swaps in a new one
+    get_analytics = pin_snapshot(get_analytics)
+    generate_itinerary = pin_snapshot(generate_itinerary)
+    get_seasonal_recommendations = pin_snapshot(get_seasonal_recommendations)
+    
+    # Per-stage timings (see instrumentation.STAGES)
+    _build_daily_schedule = timed_stage(STAGE_SCHEDULE)(_build_daily_schedule)
+    _build_recommendations = timed_stage(STAGE_RECOMMENDATIONS)(_build_recommendations)